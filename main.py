@@ -6,9 +6,11 @@ import argparse
 import json
 import logging
 import re
+import stat
 import sys
 import warnings
 from pathlib import Path
+from typing import Dict, Iterable, List
 import os
 
 ROOT_DIR = Path(__file__).resolve().parent
@@ -60,7 +62,10 @@ def _load_dotenv(path: Path) -> None:
 # .env.example file in the repo shows the format.
 _load_dotenv(ROOT_DIR / ".env")
 
-from stream_companion import application, model_downloader, registry  # noqa: E402
+# The Qt-backed runtime (``stream_companion.application``) is imported
+# only on the code path that launches it, so ``--help``, ``--stt-status``
+# and ``--preload-stt`` start without loading PySide6.
+from stream_companion import model_downloader, registry  # noqa: E402
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -103,21 +108,78 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+# ``logging.getLevelNamesMapping`` is 3.11+; 3.10 gets the same table.
+_LOG_LEVELS: Dict[str, int] = (
+    logging.getLevelNamesMapping()
+    if hasattr(logging, "getLevelNamesMapping")
+    else {
+        "CRITICAL": logging.CRITICAL,
+        "FATAL": logging.FATAL,
+        "ERROR": logging.ERROR,
+        "WARN": logging.WARNING,
+        "WARNING": logging.WARNING,
+        "INFO": logging.INFO,
+        "DEBUG": logging.DEBUG,
+        "NOTSET": logging.NOTSET,
+    }
+)
+
+
 def configure_logging(level: str) -> None:
     logging.basicConfig(
-        level=getattr(logging, level.upper(), logging.INFO),
+        level=_LOG_LEVELS.get(level.upper(), logging.INFO),
         format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
     )
 
 
 def ensure_assets_exist() -> None:
-    for shortcut in registry.iter_shortcuts():
-        if shortcut.sound_path and not Path(shortcut.sound_path).is_file():
+    shortcuts = list(registry.iter_shortcuts())
+    # Shortcuts often share assets, so stat each unique path only once.
+    paths = {s.sound_path for s in shortcuts if s.sound_path}
+    paths.update(s.overlay.file for s in shortcuts if s.overlay)
+    is_file = _regular_files(paths)
+    for shortcut in shortcuts:
+        if shortcut.sound_path and not is_file[shortcut.sound_path]:
             _LOGGER.warning("Sound asset missing: %s", shortcut.sound_path)
-        if shortcut.overlay and not Path(shortcut.overlay.file).is_file():
+        if shortcut.overlay and not is_file[shortcut.overlay.file]:
             _LOGGER.warning("Overlay asset missing: %s", shortcut.overlay.file)
 
 
+def _regular_files(paths: Iterable[str]) -> Dict[str, bool]:
+    """Map each path to whether it is a regular file.
+
+    Paths are grouped by directory and each directory that holds more than
+    one of them is listed once with ``os.scandir``, so the check costs one
+    listing per folder rather than one ``stat`` per asset. Names missing
+    from a listing are re-checked with ``stat`` so case-insensitive
+    filesystems behave the same as before.
+    """
+    by_dir: Dict[str, List[str]] = {}
+    for path in paths:
+        by_dir.setdefault(os.path.dirname(path), []).append(path)
+
+    result: Dict[str, bool] = {}
+    for directory, group in by_dir.items():
+        if len(group) == 1:
+            result[group[0]] = _is_regular_file(group[0])
+            continue
+        try:
+            with os.scandir(directory or ".") as entries:
+                names = {entry.name for entry in entries if entry.is_file()}
+        except OSError:
+            names = set()
+        for path in group:
+            result[path] = os.path.basename(path) in names or _is_regular_file(path)
+    return result
+
+
+def _is_regular_file(path: str) -> bool:
+    try:
+        return stat.S_ISREG(os.stat(path).st_mode)
+    except (OSError, ValueError):
+        return False
+
+
 def _format_cache_status(model_name: str) -> str:
     """Return a human-readable cache status for a model name."""
 
@@ -215,6 +277,8 @@ def main() -> None:
 
         configurator.run_configurator()
     else:
+        from stream_companion import application
+
         ensure_assets_exist()
         stt_config = registry.get_stt_config()
         if stt_config is not None:
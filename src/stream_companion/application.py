@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 import logging
-from typing import Dict, Iterable, List, Optional, Tuple
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
-from PySide6.QtCore import Qt, QObject, Signal
+from PySide6.QtCore import Qt, QObject, QTimer, Signal
 from PySide6.QtWidgets import QApplication
 
 from .fact_checker import AnswerPanel, FactCheckerEngine, FactCheckerEvent
@@ -25,11 +28,18 @@ from . import registry
 
 _LOGGER = logging.getLogger(__name__)
 
+# Upper bound on threads used to decode sound files during startup.
+_PRELOAD_WORKERS = 8
+
 
 class ShortcutSignals(QObject):
-    """Qt signals for thread-safe shortcut triggering."""
+    """Qt signals for thread-safe STT and fact-checker notifications.
+
+    The instance also serves as the main-thread context object that
+    shortcut dispatches are posted to (see
+    :meth:`Application._main_thread_dispatcher`).
+    """
 
-    triggered = Signal(Shortcut)
     stt_status = Signal(str)
     stt_phrase = Signal(str)  # emitted whenever a phrase is finalized
     fact_check_event = Signal(object)  # FactCheckerEvent for GUI-thread observers
@@ -59,7 +69,18 @@ class Application:
         self._hotkey_manager = hotkey_manager or HotkeyManager()
         self._logger = logger or _LOGGER
 
-        self._sound_ids: Dict[Shortcut, str] = {}
+        # Keyed by ``id(shortcut)``: identity hashing is a single pointer
+        # hash per keypress, whereas the frozen dataclass hashes every
+        # field. ``self._shortcuts`` keeps the objects (and their ids)
+        # alive, and every dispatch path hands out those same objects.
+        self._sound_ids: Dict[int, str] = {}
+        # Every sound id handed to the player, plus the last numeric
+        # suffix tried per base name, so id allocation stays O(1).
+        self._used_sound_ids: set[str] = set()
+        self._sound_id_counters: Dict[str, int] = {}
+        # Canonical file path -> sound id, so shortcuts sharing a clip
+        # share one decoded buffer.
+        self._path_to_sound_id: Dict[str, str] = {}
         self._registered = False
 
         # STT (speech-to-text typing)
@@ -120,9 +141,6 @@ class Application:
 
         # Create signals for thread-safe communication
         self._signals = ShortcutSignals()
-        self._signals.triggered.connect(
-            self._handle_shortcut_in_main_thread, Qt.ConnectionType.QueuedConnection
-        )
         self._signals.stt_status.connect(
             self._handle_stt_status_in_main_thread, Qt.ConnectionType.QueuedConnection
         )
@@ -141,6 +159,7 @@ class Application:
             return
 
         self._preload_sounds()
+        self._preload_overlays()
         self._register_hotkeys()
         self._start_stt()
 
@@ -375,7 +394,7 @@ class Application:
                         matched_phrase,
                         shortcut.label(),
                     )
-                    self._signals.triggered.emit(shortcut)
+                    self._main_thread_dispatcher(shortcut)()
                     break
 
     # ------------------------------------------------------------------
@@ -473,37 +492,89 @@ class Application:
             self._fact_checker = None
 
     def _preload_sounds(self) -> None:
+        # Ids are allocated sequentially so naming stays deterministic;
+        # only the file decoding runs concurrently.
+        self._sound_ids.clear()
+        self._used_sound_ids.clear()
+        self._sound_id_counters.clear()
+        self._path_to_sound_id.clear()
+        pending: Dict[str, str] = {}
+        assigned: List[Tuple[Shortcut, str]] = []
         for shortcut in self._shortcuts:
             path = shortcut.sound_path
             if not path:
                 continue
-            sound_id = self._unique_sound_id(shortcut)
-            success = self._sound_player.load(sound_id, path)
-            if success:
-                self._sound_ids[shortcut] = sound_id
+            key = os.path.realpath(path)
+            sound_id = self._path_to_sound_id.get(key)
+            if sound_id is None:
+                sound_id = self._unique_sound_id(shortcut)
+                self._used_sound_ids.add(sound_id)
+                self._path_to_sound_id[key] = sound_id
+                pending[sound_id] = path
+            assigned.append((shortcut, sound_id))
+
+        loaded = self._load_sounds(pending)
+        for shortcut, sound_id in assigned:
+            if sound_id in loaded:
+                self._sound_ids[id(shortcut)] = sound_id
             else:
                 self._logger.warning("Failed to preload sound for %s", shortcut.hotkey)
 
+    def _load_sounds(self, pending: Dict[str, str]) -> set[str]:
+        """Load ``{sound_id: path}`` and return the ids that succeeded.
+
+        Disk reads and decoding overlap across a small thread pool;
+        ``SoundPlayer.load`` is safe to call concurrently.
+        """
+
+        if len(pending) <= 1:
+            return {
+                sound_id
+                for sound_id, path in pending.items()
+                if self._sound_player.load(sound_id, path)
+            }
+        workers = min(_PRELOAD_WORKERS, len(pending))
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="sound-preload"
+        ) as pool:
+            results = pool.map(
+                self._sound_player.load, pending.keys(), pending.values()
+            )
+            return {sound_id for sound_id, ok in zip(pending, results) if ok}
+
+    def _preload_overlays(self) -> None:
+        # Decoding happens on the overlay's worker pool, so this returns
+        # immediately; an early trigger just decodes synchronously.
+        for shortcut in self._shortcuts:
+            config = shortcut.overlay
+            if not config:
+                continue
+            size = None
+            if config.width is not None and config.height is not None:
+                size = (config.width, config.height)
+            self._overlay_window.preload(config.file, size=size)
+
     def _unique_sound_id(self, shortcut: Shortcut) -> str:
-        base = shortcut.sound_id() or f"sound_{len(self._sound_ids) + 1}"
+        base = shortcut.sound_id() or f"sound_{len(self._used_sound_ids) + 1}"
+        if base not in self._used_sound_ids:
+            return base
+        counter = self._sound_id_counters.get(base, 1)
         candidate = base
-        counter = 1
-        existing = set(self._sound_ids.values())
-        while candidate in existing:
+        while candidate in self._used_sound_ids:
             counter += 1
             candidate = f"{base}_{counter}"
+        self._sound_id_counters[base] = counter
         return candidate
 
     def _register_hotkeys(self) -> None:
         # Register direct hotkeys and collect chord suffix sequences
         seq_map: Dict[Tuple[str, ...], callable] = {}
         for shortcut in self._shortcuts:
-            callback = lambda sc=shortcut: self._signals.triggered.emit(sc)
             if shortcut.hotkey:
                 try:
                     self._hotkey_manager.register_hotkey(
                         shortcut.hotkey,
-                        callback,
+                        self._main_thread_dispatcher(shortcut),
                     )
                 except ValueError as exc:
                     self._logger.warning(
@@ -518,7 +589,7 @@ class Application:
                         "Duplicate chord suffix sequence '%s' detected; later entry will override",
                         "+".join(key),
                     )
-                seq_map[key] = callback
+                seq_map[key] = self._main_thread_dispatcher(shortcut)
 
         # Configure chorded activator if present
         activator = registry.get_activator()
@@ -607,25 +678,45 @@ class Application:
             "activated" if self._stt_engine.is_active else "deactivated"
         )
 
+    def _main_thread_dispatcher(self, shortcut: Shortcut) -> Callable[[], None]:
+        """Return a callable that queues ``shortcut`` onto the Qt main thread.
+
+        ``QTimer.singleShot`` with a context object posts one queued call
+        to the context's thread and is safe to invoke from the pynput
+        listener thread. Building the partial once per shortcut keeps
+        the per-keypress work to a single post, without a signal
+        emission and its argument marshalling.
+        """
+
+        return partial(
+            QTimer.singleShot,
+            0,
+            self._signals,
+            partial(self._handle_shortcut_in_main_thread, shortcut),
+        )
+
     def _handle_shortcut_in_main_thread(self, shortcut: Shortcut) -> None:
         """Handle shortcut trigger in the main Qt thread."""
-        self._logger.info("Hotkey triggered: %s", shortcut.label())
-        sound_id = self._sound_ids.get(shortcut)
+        # Bind the hot attributes once; this runs on every key press.
+        logger = self._logger
+        overlay = shortcut.overlay
+        logger.info("Hotkey triggered: %s", shortcut.label())
+        sound_id = self._sound_ids.get(id(shortcut))
         if sound_id:
-            played = self._sound_player.play(sound_id)
-            if not played:
-                self._logger.warning("Unable to play sound for %s", shortcut.hotkey)
+            if not self._sound_player.play(sound_id):
+                logger.warning("Unable to play sound for %s", shortcut.hotkey)
         elif shortcut.sound_path:
-            self._logger.warning("Sound for %s was not preloaded", shortcut.hotkey)
+            logger.warning("Sound for %s was not preloaded", shortcut.hotkey)
 
-        if shortcut.overlay:
-            self._show_overlay(shortcut.overlay)
+        if overlay:
+            self._show_overlay(overlay)
 
     def _show_overlay(self, config: OverlayConfig) -> None:
         size = None
         if config.width is not None and config.height is not None:
             size = (config.width, config.height)
 
+        logger = self._logger
         success = self._overlay_window.show_asset(
             config.file,
             duration_ms=config.duration_ms,
@@ -633,10 +724,10 @@ class Application:
             size=size,
         )
         if not success:
-            self._logger.warning("Overlay failed to display: %s", config.file)
+            logger.warning("Overlay failed to display: %s", config.file)
         else:
             size_str = f" size=({config.width},{config.height})" if size else ""
-            self._logger.info(
+            logger.info(
                 "Overlay displayed: file=%s position=(%s,%s) duration_ms=%s%s",
                 config.file,
                 config.x,
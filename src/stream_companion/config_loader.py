@@ -2,12 +2,21 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
+import os
+import shutil
+import tempfile
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
-import jsonschema
+try:  # C-accelerated JSON codec; the stdlib ``json`` module is the fallback.
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
 
 from .llm.config import LLMConfig
 from .llm.thinking import ThinkingStrategy
@@ -24,6 +33,86 @@ class ConfigError(RuntimeError):
     """Raised when the configuration file cannot be loaded or validated."""
 
 
+@dataclass
+class _CachedConfig:
+    """Parsed + validated config contents for one file on disk."""
+
+    # (config mtime_ns, config size, schema mtime_ns, schema size)
+    key: Tuple[int, int, int, int]
+    data: dict
+    hydrated: Optional[Tuple[Optional[ActivatorConfig], List[Shortcut]]] = None
+    # (stt, llm) blocks, hydrated on first ``load_full_config``.
+    sections: Optional[Tuple[Optional[STTConfig], Optional[LLMConfig]]] = None
+
+
+# Parsed files are cached by path and invalidated when the file's
+# (st_mtime_ns, st_size) changes, so repeated loads from the tray and
+# the configurator skip the read + decode + validate round-trip.
+_SCHEMA_CACHE: Dict[Path, Tuple[Tuple[int, int], Any]] = {}
+_CONFIG_CACHE: Dict[Path, _CachedConfig] = {}
+# Digest of the last payload ``save_config`` validated, per schema path.
+# The configurator saves on every edit and most saves are identical.
+_VALIDATED_PAYLOADS: Dict[Path, Tuple[Tuple[int, int], bytes]] = {}
+
+
+def _json_loads(raw: bytes) -> Any:
+    # ``orjson.JSONDecodeError`` subclasses ``json.JSONDecodeError``, so
+    # callers catch the stdlib type either way.
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _json_dumps(data: dict) -> bytes:
+    """Serialize ``data`` as 2-space indented JSON with a trailing newline."""
+
+    if orjson is not None:
+        return orjson.dumps(
+            data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+        )
+    return (json.dumps(data, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def _atomic_write_bytes(path: Path, payload: bytes) -> None:
+    """Write ``payload`` to a sibling temp file, then swap it into place.
+
+    A crash mid-save leaves either the old file or the new one, never a
+    truncated config. A symlinked config is updated through its target so
+    the link survives, and an existing file keeps its permission bits.
+    """
+
+    target = path.resolve()
+    with tempfile.NamedTemporaryFile(
+        dir=target.parent, prefix=f"{target.name}.", suffix=".tmp", delete=False
+    ) as handle:
+        tmp_path = Path(handle.name)
+        try:
+            handle.write(payload)
+            handle.flush()
+            if target.exists():
+                shutil.copymode(target, tmp_path)
+            os.fsync(handle.fileno())
+        except BaseException:
+            handle.close()
+            tmp_path.unlink(missing_ok=True)
+            raise
+    try:
+        os.replace(tmp_path, target)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def clear_cache() -> None:
+    """Drop all cached schema validators and parsed config files."""
+
+    _SCHEMA_CACHE.clear()
+    _compile_validator.cache_clear()
+    _CONFIG_CACHE.clear()
+    _VALIDATED_PAYLOADS.clear()
+
+
+@lru_cache(maxsize=None)
 def _repository_root() -> Path:
     return Path(__file__).resolve().parents[2]
 
@@ -53,13 +142,7 @@ def load_shortcuts(
     )
     _ensure_config_exists(cfg_path, samp_path)
 
-    try:
-        data = json.loads(cfg_path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError as exc:
-        raise ConfigError(f"Config file {cfg_path} is not valid JSON: {exc}") from exc
-
-    _validate_config(data, sch_path)
-    _, shortcuts = _hydrate_config(data)
+    _, shortcuts = _hydrate_cached(_load_cached(cfg_path, sch_path))
     _LOGGER.info("Loaded %d shortcuts from %s", len(shortcuts), cfg_path)
     return shortcuts
 
@@ -94,20 +177,215 @@ def _ensure_config_exists(config_path: Path, sample_path: Path) -> None:
         )
 
 
-def _validate_config(data: dict, schema_path: Path) -> None:
+def _stat_key(path: Path) -> Tuple[int, int]:
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _load_validator(schema_path: Path) -> Tuple[Tuple[int, int], Any]:
+    """Return ``(stat_key, validator)`` for the schema, compiling it on change.
+
+    The bundled ``config/schema.json`` ships with the app and does not
+    change while it runs, so once compiled it is reused without another
+    ``stat``; ``clear_cache()`` (e.g. ``registry.reload_config``) forces a
+    re-read. Custom schema paths are still checked on every call.
+    """
+
+    cached = _SCHEMA_CACHE.get(schema_path)
+    if cached is not None and schema_path == _default_paths()[1]:
+        return cached
     try:
-        schema = json.loads(schema_path.read_text(encoding="utf-8"))
+        key = _stat_key(schema_path)
     except FileNotFoundError as exc:
         raise ConfigError(f"Schema file {schema_path} is missing") from exc
+    if cached is not None and cached[0] == key:
+        return cached
+
+    try:
+        raw = schema_path.read_bytes()
+    except FileNotFoundError as exc:
+        raise ConfigError(f"Schema file {schema_path} is missing") from exc
+    try:
+        validator = _compile_validator(raw)
     except json.JSONDecodeError as exc:
         raise ConfigError(
             f"Schema file {schema_path} is not valid JSON: {exc}"
         ) from exc
+    entry = (key, validator)
+    _SCHEMA_CACHE[schema_path] = entry
+    return entry
+
+
+@lru_cache(maxsize=16)
+def _compile_validator(raw: bytes) -> Any:
+    """Build a validator for the schema text ``raw``.
+
+    Keyed by content rather than path, so identical schema files at
+    different paths compile once.
+    """
+
+    schema = _json_loads(raw)
+    # jsonschema is imported on first validation rather than at module
+    # load; callers that never validate (e.g. CLI argument errors) skip
+    # its import cost entirely.
+    from jsonschema.validators import validator_for
+
+    validator_cls = validator_for(schema)
+    validator_cls.check_schema(schema)
+    return validator_cls(_inline_local_refs(schema))
+
+
+def _inline_local_refs(schema: Any) -> Any:
+    """Return a copy of ``schema`` with local ``{"$ref": "#/..."}`` nodes inlined.
+
+    The validator then walks plain subschemas instead of going through
+    its ref resolver on every validation. Refs with sibling keywords,
+    remote refs and recursive refs are left in place; ``definitions``
+    is kept so those still resolve.
+    """
+
+    def resolve(pointer: str) -> Any:
+        node = schema
+        for part in pointer[2:].split("/") if pointer != "#" else ():
+            part = part.replace("~1", "/").replace("~0", "~")
+            node = node[int(part)] if isinstance(node, list) else node[part]
+        return node
+
+    def walk(node: Any, expanding: Tuple[str, ...]) -> Any:
+        if isinstance(node, list):
+            return [walk(item, expanding) for item in node]
+        if not isinstance(node, dict):
+            return node
+        ref = node.get("$ref")
+        if (
+            isinstance(ref, str)
+            and len(node) == 1
+            and (ref == "#" or ref.startswith("#/"))
+            and ref not in expanding
+        ):
+            try:
+                target = resolve(ref)
+            except (KeyError, IndexError, ValueError, TypeError):
+                return dict(node)
+            return walk(target, expanding + (ref,))
+        return {name: walk(value, expanding) for name, value in node.items()}
+
+    return walk(schema, ())
+
+
+def _raise_for_errors(validator: Any, data: dict) -> None:
+    from jsonschema.exceptions import best_match
+
+    # Same error selection as ``jsonschema.validate`` so messages are
+    # unchanged by reusing a compiled validator.
+    error = best_match(validator.iter_errors(data))
+    if error is not None:
+        raise ConfigError(f"Configuration validation error: {error.message}") from error
+
+
+def _load_cached(config_path: Path, schema_path: Path) -> _CachedConfig:
+    """Return the parsed and validated config, re-reading only on change."""
+
+    config_key = _stat_key(config_path)
+    schema_key, validator = _load_validator(schema_path)
+    key = (*config_key, *schema_key)
+    cached = _CONFIG_CACHE.get(config_path)
+    if cached is not None and cached.key == key:
+        return cached
 
     try:
-        jsonschema.validate(data, schema)
-    except jsonschema.ValidationError as exc:
-        raise ConfigError(f"Configuration validation error: {exc.message}") from exc
+        data = _json_loads(config_path.read_bytes())
+    except json.JSONDecodeError as exc:
+        raise ConfigError(
+            f"Config file {config_path} is not valid JSON: {exc}"
+        ) from exc
+
+    _raise_for_errors(validator, data)
+    entry = _CachedConfig(key=key, data=data)
+    _CONFIG_CACHE[config_path] = entry
+    return entry
+
+
+def _hydrate_cached(
+    cached: _CachedConfig,
+) -> Tuple[Optional[ActivatorConfig], List[Shortcut]]:
+    if cached.hydrated is None:
+        cached.hydrated = _hydrate_config(cached.data)
+    activator, shortcuts = cached.hydrated
+    # Callers own (and may mutate) the returned list.
+    return activator, list(shortcuts)
+
+
+def _make_shortcut(index: int, raw: dict) -> Shortcut:
+    get = raw.get
+    try:
+        raw_overlay = get("overlay")
+        overlay = (
+            OverlayConfig(
+                file=raw_overlay["file"],
+                x=raw_overlay.get("x", 0),
+                y=raw_overlay.get("y", 0),
+                duration_ms=raw_overlay.get("duration", 1500),
+                width=raw_overlay.get("width"),
+                height=raw_overlay.get("height"),
+            )
+            if raw_overlay is not None
+            else None
+        )
+
+        hotkey = get("hotkey")
+        suffix_raw = get("suffix")
+        if hotkey is None and suffix_raw is None:
+            raise ConfigError(
+                f"Shortcut at index {index} must define either 'hotkey' or 'suffix'"
+            )
+
+        suffix_tuple = None
+        if suffix_raw is not None:
+            if isinstance(suffix_raw, str):
+                tokens = [suffix_raw]
+            elif isinstance(suffix_raw, list):
+                tokens = [str(t) for t in suffix_raw]
+                if not tokens:
+                    raise ConfigError(
+                        f"Shortcut at index {index} has empty suffix list"
+                    )
+            else:
+                raise ConfigError(
+                    f"Shortcut at index {index} has invalid 'suffix' type"
+                )
+            suffix_tuple = tuple(t.strip().lower() for t in tokens)
+
+        # Voice triggers: ``trigger_word`` (legacy) and
+        # ``trigger_phrases`` (new). Both can be present on the
+        # same shortcut and are matched independently.
+        trigger_phrases_raw = get("trigger_phrases")
+        trigger_phrases_tuple: Optional[Tuple[str, ...]] = None
+        if trigger_phrases_raw is not None:
+            if isinstance(trigger_phrases_raw, str):
+                phrases_list = [trigger_phrases_raw]
+            elif isinstance(trigger_phrases_raw, list):
+                phrases_list = [str(p) for p in trigger_phrases_raw]
+            else:
+                raise ConfigError(
+                    f"Shortcut at index {index} has invalid 'trigger_phrases' type"
+                )
+            cleaned = tuple(p.strip() for p in phrases_list if p.strip())
+            trigger_phrases_tuple = cleaned or None
+
+        return Shortcut(
+            hotkey=hotkey,
+            suffix=suffix_tuple,
+            sound_path=get("sound"),
+            overlay=overlay,
+            trigger_word=get("trigger_word"),
+            trigger_phrases=trigger_phrases_tuple,
+            fact_check=bool(get("fact_check", False)),
+        )
+    except KeyError as exc:
+        raise ConfigError(
+            f"Shortcut at index {index} is missing required field: {exc.args[0]}"
+        ) from exc
 
 
 def _hydrate_config(data: dict) -> Tuple[Optional[ActivatorConfig], List[Shortcut]]:
@@ -125,76 +403,10 @@ def _hydrate_config(data: dict) -> Tuple[Optional[ActivatorConfig], List[Shortcu
                 f"Activator missing required field: {exc.args[0]}"
             ) from exc
 
-    shortcuts: List[Shortcut] = []
-    for index, raw in enumerate(data.get("shortcuts", [])):
-        try:
-            overlay = (
-                OverlayConfig(
-                    file=raw["overlay"]["file"],
-                    x=raw["overlay"].get("x", 0),
-                    y=raw["overlay"].get("y", 0),
-                    duration_ms=raw["overlay"].get("duration", 1500),
-                    width=raw["overlay"].get("width"),
-                    height=raw["overlay"].get("height"),
-                )
-                if "overlay" in raw and raw["overlay"] is not None
-                else None
-            )
-
-            hotkey = raw.get("hotkey")
-            suffix_raw = raw.get("suffix")
-            if hotkey is None and suffix_raw is None:
-                raise ConfigError(
-                    f"Shortcut at index {index} must define either 'hotkey' or 'suffix'"
-                )
-
-            suffix_tuple = None
-            if suffix_raw is not None:
-                if isinstance(suffix_raw, str):
-                    tokens = [suffix_raw]
-                elif isinstance(suffix_raw, list):
-                    tokens = [str(t) for t in suffix_raw]
-                    if not tokens:
-                        raise ConfigError(
-                            f"Shortcut at index {index} has empty suffix list"
-                        )
-                else:
-                    raise ConfigError(
-                        f"Shortcut at index {index} has invalid 'suffix' type"
-                    )
-                suffix_tuple = tuple(t.strip().lower() for t in tokens)
-
-            # Voice triggers: ``trigger_word`` (legacy) and
-            # ``trigger_phrases`` (new). Both can be present on the
-            # same shortcut and are matched independently.
-            trigger_phrases_raw = raw.get("trigger_phrases")
-            trigger_phrases_tuple: Optional[Tuple[str, ...]] = None
-            if trigger_phrases_raw is not None:
-                if isinstance(trigger_phrases_raw, str):
-                    phrases_list = [trigger_phrases_raw]
-                elif isinstance(trigger_phrases_raw, list):
-                    phrases_list = [str(p) for p in trigger_phrases_raw]
-                else:
-                    raise ConfigError(
-                        f"Shortcut at index {index} has invalid 'trigger_phrases' type"
-                    )
-                cleaned = tuple(p.strip() for p in phrases_list if p.strip())
-                trigger_phrases_tuple = cleaned or None
-
-            shortcut = Shortcut(
-                hotkey=hotkey,
-                suffix=suffix_tuple,
-                sound_path=raw.get("sound"),
-                overlay=overlay,
-                trigger_word=raw.get("trigger_word"),
-                trigger_phrases=trigger_phrases_tuple,
-                fact_check=bool(raw.get("fact_check", False)),
-            )
-        except KeyError as exc:
-            raise ConfigError(
-                f"Shortcut at index {index} is missing required field: {exc.args[0]}"
-            ) from exc
-        shortcuts.append(shortcut)
+    shortcuts = [
+        _make_shortcut(index, raw)
+        for index, raw in enumerate(data.get("shortcuts", ()))
+    ]
     return activator, shortcuts
 
 
@@ -214,13 +426,7 @@ def load_config(
     )
     _ensure_config_exists(cfg_path, samp_path)
 
-    try:
-        data = json.loads(cfg_path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError as exc:
-        raise ConfigError(f"Config file {cfg_path} is not valid JSON: {exc}") from exc
-
-    _validate_config(data, sch_path)
-    activator, shortcuts = _hydrate_config(data)
+    activator, shortcuts = _hydrate_cached(_load_cached(cfg_path, sch_path))
     _LOGGER.info("Loaded %d shortcuts from %s", len(shortcuts), cfg_path)
     return activator, shortcuts
 
@@ -248,15 +454,15 @@ def load_full_config(
     )
     _ensure_config_exists(cfg_path, samp_path)
 
-    try:
-        data = json.loads(cfg_path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError as exc:
-        raise ConfigError(f"Config file {cfg_path} is not valid JSON: {exc}") from exc
-
-    _validate_config(data, sch_path)
-    activator, shortcuts = _hydrate_config(data)
-    stt = _hydrate_stt_config(data.get("stt"))
-    llm = _hydrate_llm_config(data.get("llm"))
+    cached = _load_cached(cfg_path, sch_path)
+    data = cached.data
+    activator, shortcuts = _hydrate_cached(cached)
+    if cached.sections is None:
+        cached.sections = (
+            _hydrate_stt_config(data.get("stt")),
+            _hydrate_llm_config(data.get("llm")),
+        )
+    stt, llm = cached.sections
     _LOGGER.info(
         "Loaded %d shortcuts from %s (stt=%s, llm=%s)",
         len(shortcuts),
@@ -307,34 +513,31 @@ def _hydrate_llm_config(raw: Optional[dict]) -> Optional[LLMConfig]:
 
     if not isinstance(raw, dict):
         return None
+    defaults = LLMConfig()
     try:
         return LLMConfig(
-            base_url=str(raw.get("base_url", LLMConfig().base_url)),
-            model=str(raw.get("model", LLMConfig().model)),
-            api_key_env=str(raw.get("api_key_env", LLMConfig().api_key_env)),
-            persona=str(raw.get("persona", LLMConfig().persona)),
+            base_url=str(raw.get("base_url", defaults.base_url)),
+            model=str(raw.get("model", defaults.model)),
+            api_key_env=str(raw.get("api_key_env", defaults.api_key_env)),
+            persona=str(raw.get("persona", defaults.persona)),
             system_prompt=(
                 str(raw["system_prompt"])
                 if raw.get("system_prompt") is not None
                 else None
             ),
-            temperature=float(raw.get("temperature", LLMConfig().temperature)),
-            max_tokens=int(raw.get("max_tokens", LLMConfig().max_tokens)),
+            temperature=float(raw.get("temperature", defaults.temperature)),
+            max_tokens=int(raw.get("max_tokens", defaults.max_tokens)),
             toggle_hotkey=(
                 str(raw["toggle_hotkey"])
                 if raw.get("toggle_hotkey") is not None
                 else None
             ),
-            timeout_seconds=int(
-                raw.get("timeout_seconds", LLMConfig().timeout_seconds)
-            ),
-            silence_timeout=float(
-                raw.get("silence_timeout", LLMConfig().silence_timeout)
-            ),
+            timeout_seconds=int(raw.get("timeout_seconds", defaults.timeout_seconds)),
+            silence_timeout=float(raw.get("silence_timeout", defaults.silence_timeout)),
             esc_hotkey=(
                 str(raw["esc_hotkey"]) if raw.get("esc_hotkey") is not None else None
             ),
-            thinking=ThinkingStrategy(raw.get("thinking", LLMConfig().thinking.value)),
+            thinking=ThinkingStrategy(raw.get("thinking", defaults.thinking.value)),
         )
     except (TypeError, ValueError) as exc:
         raise ConfigError(f"Invalid LLM configuration: {exc}") from exc
@@ -465,7 +668,7 @@ def save_config(
     existing_llm: Optional[LLMConfig] = None
     if cfg_path.exists():
         try:
-            raw = json.loads(cfg_path.read_text(encoding="utf-8"))
+            raw = _json_loads(cfg_path.read_bytes())
         except json.JSONDecodeError:
             raw = None
         if isinstance(raw, dict):
@@ -478,7 +681,18 @@ def save_config(
         stt if stt is not None else existing_stt,
         llm if llm is not None else existing_llm,
     )
-    _validate_config(data, sch_path)
-
-    cfg_path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+    payload = _json_dumps(data)
+    digest = hashlib.blake2b(payload, digest_size=16).digest()
+    schema_key, validator = _load_validator(sch_path)
+    if _VALIDATED_PAYLOADS.get(sch_path) != (schema_key, digest):
+        _raise_for_errors(validator, data)
+        _VALIDATED_PAYLOADS[sch_path] = (schema_key, digest)
+
+    _atomic_write_bytes(cfg_path, payload)
+    # ``data`` was just validated against the same compiled schema, so
+    # seed the cache with it: the configurator's save-then-reload does
+    # not pay for a second read + validate.
+    _CONFIG_CACHE[cfg_path] = _CachedConfig(
+        key=(*_stat_key(cfg_path), *schema_key), data=data
+    )
     _LOGGER.info("Saved %d shortcuts to %s", len(shortcuts), cfg_path)
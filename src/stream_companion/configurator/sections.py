@@ -7,12 +7,14 @@ read/populate/validate API for the main window to drive.
 from __future__ import annotations
 
 import logging
-import re
+import os
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QMovie, QPixmap
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtGui import QImage, QImageReader, QPixmap
 from PySide6.QtWidgets import (
     QCheckBox,
     QComboBox,
@@ -40,10 +42,45 @@ from .constants import (
     WHISPER_LANGUAGES,
     WHISPER_MODELS,
 )
-from .widgets import HotkeyCapture, PositionPicker, SingleKeyCapture
+from .widgets import HotkeyCapture, PositionPicker, SingleKeyCapture, header_label
 
 _LOGGER = logging.getLogger(__name__)
 
+# Typing a path fires textChanged per keystroke; wait for a pause before
+# decoding the file.
+_PREVIEW_DEBOUNCE_MS = 150
+
+# Chord suffix keys may be separated by spaces and/or commas; commas are
+# mapped to spaces so a plain str.split() handles both.
+_SUFFIX_COMMAS = str.maketrans(",", " ")
+
+
+def _scale_preview(image: QImage) -> QImage:
+    return image.scaled(
+        PREVIEW_WIDTH,
+        PREVIEW_HEIGHT,
+        Qt.AspectRatioMode.KeepAspectRatio,
+        Qt.TransformationMode.SmoothTransformation,
+    )
+
+
+@lru_cache(maxsize=32)
+def _load_image_preview(
+    path: str, mtime_ns: int, size: int
+) -> Optional[Tuple[QImage, int, int]]:
+    """Decode and scale an image (or a GIF's first frame) for the preview.
+
+    Returns ``(scaled, native_width, native_height)`` or ``None`` when the
+    file is not a readable image. ``mtime_ns`` and ``size`` only key the
+    cache so an edited file is decoded again. The cache holds ``QImage``
+    rather than ``QPixmap``: it outlives the ``QApplication``, and only
+    images may be destroyed once the GUI application is gone.
+    """
+    image = QImageReader(path).read()
+    if image.isNull():
+        return None
+    return _scale_preview(image), image.width(), image.height()
+
 
 # ---------------------------------------------------------------------------
 # STT section
@@ -347,7 +384,7 @@ class STTSection(QWidget):
             w.setEnabled(enabled)
         self._on_activation_toggled()
 
-    def _on_activation_toggled(self) -> None:
+    def _on_activation_toggled(self, _checked: bool = False) -> None:
         """Enable hotkey capture only when toggle mode is selected."""
         if not hasattr(self, "_use_hotkey"):
             return
@@ -378,7 +415,12 @@ class ShortcutSection(QWidget):
 
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
-        self._preview_movie: Optional[QMovie] = None
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(_PREVIEW_DEBOUNCE_MS)
+        self._preview_timer.timeout.connect(self._update_overlay_preview)
+        self._picker: Optional[PositionPicker] = None
+        self._file_dialogs: Dict[str, QFileDialog] = {}
         self._build_ui()
         self.clear()
 
@@ -386,61 +428,63 @@ class ShortcutSection(QWidget):
 
     def populate(self, shortcut: Shortcut) -> None:
         """Fill widgets from a :class:`Shortcut`."""
-        if shortcut.hotkey:
-            self._trigger_direct.setChecked(True)
-            self._hotkey_capture.set_hotkey(shortcut.hotkey)
-            self._suffix_capture.set_key("")
-        else:
-            self._trigger_suffix.setChecked(True)
-            self._hotkey_capture.set_hotkey("")
-            self._suffix_capture.set_key(
-                " ".join(shortcut.suffix) if shortcut.suffix else ""
+        with self._batch_editor():
+            if shortcut.hotkey:
+                self._trigger_direct.setChecked(True)
+                self._hotkey_capture.set_hotkey(shortcut.hotkey)
+                self._suffix_capture.set_key("")
+            else:
+                self._trigger_suffix.setChecked(True)
+                self._hotkey_capture.set_hotkey("")
+                self._suffix_capture.set_key(
+                    " ".join(shortcut.suffix) if shortcut.suffix else ""
+                )
+            self._trigger_word_input.setText(shortcut.trigger_word or "")
+            self._trigger_phrases_input.setPlainText(
+                "\n".join(shortcut.trigger_phrases or ())
             )
-        self._trigger_word_input.setText(shortcut.trigger_word or "")
-        self._trigger_phrases_input.setPlainText(
-            "\n".join(shortcut.trigger_phrases or ())
-        )
-        self._sound_input.setText(shortcut.sound_path or "")
-
-        if shortcut.overlay:
-            self._overlay_input.setText(shortcut.overlay.file)
-            self._x_input.setValue(shortcut.overlay.x)
-            self._y_input.setValue(shortcut.overlay.y)
-            self._duration_input.setValue(shortcut.overlay.duration_ms)
-            if (
-                shortcut.overlay.width is not None
-                and shortcut.overlay.height is not None
-            ):
-                self._custom_size_checkbox.setChecked(True)
-                self._width_input.setValue(shortcut.overlay.width)
-                self._height_input.setValue(shortcut.overlay.height)
+            self._sound_input.setText(shortcut.sound_path or "")
+
+            if shortcut.overlay:
+                self._overlay_input.setText(shortcut.overlay.file)
+                self._x_input.setValue(shortcut.overlay.x)
+                self._y_input.setValue(shortcut.overlay.y)
+                self._duration_input.setValue(shortcut.overlay.duration_ms)
+                if (
+                    shortcut.overlay.width is not None
+                    and shortcut.overlay.height is not None
+                ):
+                    self._custom_size_checkbox.setChecked(True)
+                    self._width_input.setValue(shortcut.overlay.width)
+                    self._height_input.setValue(shortcut.overlay.height)
+                else:
+                    self._custom_size_checkbox.setChecked(False)
             else:
+                self._overlay_input.setText("")
+                self._x_input.setValue(0)
+                self._y_input.setValue(0)
+                self._duration_input.setValue(1500)
                 self._custom_size_checkbox.setChecked(False)
-        else:
+
+    def clear(self) -> None:
+        """Reset all fields to empty/defaults."""
+        with self._batch_editor():
+            self._trigger_direct.setChecked(True)
+            self._hotkey_capture.set_hotkey("")
+            self._suffix_capture.set_key("")
+            self._trigger_word_input.setText("")
+            self._trigger_phrases_input.setPlainText("")
+            self._sound_input.setText("")
             self._overlay_input.setText("")
+            self._preview_timer.stop()
+            self._overlay_preview.clear()
+            self._overlay_preview.setText("No preview")
             self._x_input.setValue(0)
             self._y_input.setValue(0)
             self._duration_input.setValue(1500)
             self._custom_size_checkbox.setChecked(False)
-
-    def clear(self) -> None:
-        """Reset all fields to empty/defaults."""
-        self._trigger_direct.setChecked(True)
-        self._hotkey_capture.set_hotkey("")
-        self._suffix_capture.set_key("")
-        self._trigger_word_input.setText("")
-        self._trigger_phrases_input.setPlainText("")
-        self._sound_input.setText("")
-        self._overlay_input.setText("")
-        self._cleanup_preview_movie()
-        self._overlay_preview.clear()
-        self._overlay_preview.setText("No preview")
-        self._x_input.setValue(0)
-        self._y_input.setValue(0)
-        self._duration_input.setValue(1500)
-        self._custom_size_checkbox.setChecked(False)
-        self._width_input.setValue(100)
-        self._height_input.setValue(100)
+            self._width_input.setValue(100)
+            self._height_input.setValue(100)
 
     def read(self) -> Shortcut:
         """Build a :class:`Shortcut` from the current editor fields.
@@ -450,10 +494,9 @@ class ShortcutSection(QWidget):
         errors rather than relying on this method to reject bad input.
         """
         hotkey: Optional[str] = None
-        suffix: Optional[tuple] = None
+        suffix: Optional[Tuple[str, ...]] = None
         if self._trigger_suffix.isChecked():
-            tokens = self._suffix_tokens()
-            suffix = tuple(tokens) if tokens else None
+            suffix = self._suffix_tokens() or None
         else:
             hotkey = self._hotkey_capture.get_hotkey().strip() or None
 
@@ -499,20 +542,44 @@ class ShortcutSection(QWidget):
         return errors
 
     def cleanup_preview(self) -> None:
-        """Release preview-movie resources. Call from window closeEvent."""
-        self._cleanup_preview_movie()
+        """Cancel a pending preview refresh. Call from window closeEvent."""
+        self._preview_timer.stop()
 
     # -- internals ----------------------------------------------------------
 
-    def _suffix_tokens(self) -> List[str]:
+    @contextmanager
+    def _batch_editor(self) -> Iterator[None]:
+        """Refill many fields with one repaint.
+
+        Spin box ``valueChanged`` signals are blocked since nothing
+        listens to them; the line edits keep theirs because the overlay
+        preview and the window's path cache react to ``textChanged``.
+        """
+        spin_boxes = (
+            self._x_input,
+            self._y_input,
+            self._duration_input,
+            self._width_input,
+            self._height_input,
+        )
+        blocked = [box.blockSignals(True) for box in spin_boxes]
+        self.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            for box, was_blocked in zip(spin_boxes, blocked):
+                box.blockSignals(was_blocked)
+            self.setUpdatesEnabled(True)
+
+    def _suffix_tokens(self) -> Tuple[str, ...]:
         """Split the suffix capture into normalized key tokens."""
-        raw = self._suffix_capture.get_key().strip().lower()
-        return [token for token in re.split(r"[\s,]+", raw) if token]
+        raw = self._suffix_capture.get_key().lower()
+        return tuple(raw.translate(_SUFFIX_COMMAS).split())
 
     def _build_ui(self) -> None:
         layout = QVBoxLayout()
         self.setLayout(layout)
-        layout.addWidget(QLabel("<b>Shortcut Details</b>"))
+        layout.addWidget(header_label("Shortcut Details"))
 
         # Trigger type
         trigger_layout = QHBoxLayout()
@@ -566,13 +633,8 @@ class ShortcutSection(QWidget):
         self._trigger_word_note.setWordWrap(True)
         layout.addWidget(self._trigger_word_note)
 
-        def _on_trigger_changed():
-            suffix_mode = self._trigger_suffix.isChecked()
-            self._hotkey_capture.setVisible(not suffix_mode)
-            self._suffix_capture.setVisible(suffix_mode)
-
-        self._trigger_direct.toggled.connect(_on_trigger_changed)
-        self._trigger_suffix.toggled.connect(_on_trigger_changed)
+        self._trigger_direct.toggled.connect(self._on_trigger_changed)
+        self._trigger_suffix.toggled.connect(self._on_trigger_changed)
 
         # Sound
         layout.addWidget(QLabel("Sound File:"))
@@ -656,51 +718,77 @@ class ShortcutSection(QWidget):
 
         layout.addStretch()
 
+    def _on_trigger_changed(self, _checked: bool = False) -> None:
+        """Show the capture widget matching the selected trigger mode."""
+        suffix_mode = self._trigger_suffix.isChecked()
+        self._hotkey_capture.setVisible(not suffix_mode)
+        self._suffix_capture.setVisible(suffix_mode)
+
+    def _pick_file(self, title: str, name_filter: str) -> Optional[str]:
+        """Ask for an existing file with a dialog reused per ``title``.
+
+        Keeping the dialog keeps its directory model, so reopening it does
+        not re-scan (and stat every entry of) the last folder, which is slow
+        on network mounts. The dialog also stays in the folder last used.
+        """
+        dialog = self._file_dialogs.get(title)
+        if dialog is None:
+            dialog = QFileDialog(self, title, "", name_filter)
+            dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
+            dialog.setOption(QFileDialog.Option.DontUseCustomDirectoryIcons, True)
+            dialog.setOption(QFileDialog.Option.DontResolveSymlinks, True)
+            self._file_dialogs[title] = dialog
+        if not dialog.exec():
+            return None
+        selected = dialog.selectedFiles()
+        return selected[0] if selected else None
+
     def _browse_sound(self) -> None:
         """Open file dialog to select sound file."""
-        file_path, _ = QFileDialog.getOpenFileName(
-            self,
-            "Select Sound File",
-            "",
-            "Audio Files (*.wav *.mp3);;All Files (*)",
+        file_path = self._pick_file(
+            "Select Sound File", "Audio Files (*.wav *.mp3);;All Files (*)"
         )
         if file_path:
             self._sound_input.setText(file_path)
 
     def _browse_overlay(self) -> None:
         """Open file dialog to select overlay file."""
-        file_path, _ = QFileDialog.getOpenFileName(
-            self,
+        file_path = self._pick_file(
             "Select Overlay File",
-            "",
             "Overlay Files (*.png *.gif *.jpg *.jpeg *.mp4 *.mov *.avi *.mkv *.webm *.m4v);;All Files (*)",
         )
         if file_path:
             self._overlay_input.setText(file_path)
+            # A picked file is final; no need to wait out the typing debounce.
+            self._preview_timer.stop()
+            self._update_overlay_preview()
 
     def _pick_position(self) -> None:
         """Open position picker to select overlay position with mouse."""
-        picker = PositionPicker(self)
-        picker.position_picked.connect(self._on_position_picked)
-        picker.show()
+        # The picker only hides on close, so one instance is kept and
+        # reshown instead of parenting a new full-screen widget per click.
+        if self._picker is None:
+            self._picker = PositionPicker(self)
+            self._picker.position_picked.connect(self._on_position_picked)
+        self._picker.show()
 
     def _on_position_picked(self, x: int, y: int) -> None:
         """Handle position picked from the position picker."""
         self._x_input.setValue(x)
         self._y_input.setValue(y)
 
-    def _cleanup_preview_movie(self) -> None:
-        """Clean up the preview movie to prevent memory leaks."""
-        if self._preview_movie is not None:
-            self._preview_movie.stop()
-            self._preview_movie.deleteLater()
-            self._preview_movie = None
+    def _on_overlay_changed(self, _path: str) -> None:
+        """Schedule a preview refresh once the path stops changing."""
+        self._preview_timer.start()
 
-    def _on_overlay_changed(self, path: str) -> None:
-        """Update overlay preview when path changes."""
-        self._cleanup_preview_movie()
-
-        if not path or not Path(path).exists():
+    def _update_overlay_preview(self) -> None:
+        """Update overlay preview for the current path."""
+        path = self._overlay_input.text()
+        try:
+            stat = os.stat(path) if path else None
+        except OSError:
+            stat = None
+        if stat is None:
             self._overlay_preview.clear()
             self._overlay_preview.setText("No preview")
             return
@@ -708,57 +796,39 @@ class ShortcutSection(QWidget):
         path_obj = Path(path)
         try:
             suffix = path_obj.suffix.lower()
-            if suffix == ".gif":
-                movie = QMovie(str(path_obj))
-                if not movie.isValid():
-                    self._overlay_preview.clear()
-                    self._overlay_preview.setText("Invalid GIF")
-                    _LOGGER.warning("Failed to load GIF preview: %s", path_obj)
-                    return
-
-                movie.jumpToFrame(0)
-                pixmap = movie.currentPixmap()
-                if pixmap.isNull():
-                    self._overlay_preview.clear()
-                    self._overlay_preview.setText("Invalid GIF")
-                    return
-
-                self._preview_movie = movie
-                self._show_scaled_preview(pixmap)
-            elif suffix in {".mp4", ".mov", ".avi", ".mkv", ".webm", ".m4v"}:
+            if suffix in {".mp4", ".mov", ".avi", ".mkv", ".webm", ".m4v"}:
                 self._overlay_preview.clear()
                 self._overlay_preview.setText("Video file selected (no preview)")
             else:
-                pixmap = QPixmap(str(path_obj))
-                if pixmap.isNull():
+                # GIFs preview their first frame; the reader decodes just
+                # that frame rather than setting up a QMovie.
+                preview = _load_image_preview(
+                    str(path_obj), stat.st_mtime_ns, stat.st_size
+                )
+                if preview is None:
+                    kind = "GIF" if suffix == ".gif" else "image"
                     self._overlay_preview.clear()
-                    self._overlay_preview.setText("Invalid image")
-                    _LOGGER.warning("Failed to load image preview: %s", path_obj)
+                    self._overlay_preview.setText(f"Invalid {kind}")
+                    _LOGGER.warning("Failed to load %s preview: %s", kind, path_obj)
                     return
 
-                self._show_scaled_preview(pixmap)
+                scaled, width, height = preview
+                self._show_scaled_preview(QPixmap.fromImage(scaled), width, height)
         except Exception as exc:
             self._overlay_preview.clear()
             self._overlay_preview.setText("Error loading preview")
             _LOGGER.error("Error loading overlay preview for %s: %s", path_obj, exc)
 
-    def _show_scaled_preview(self, pixmap: QPixmap) -> None:
-        """Scale ``pixmap`` into the preview label and seed the size inputs.
+    def _show_scaled_preview(self, scaled: QPixmap, width: int, height: int) -> None:
+        """Show ``scaled`` in the preview label and seed the size inputs.
 
-        Shared by the GIF (first-frame) and static-image preview paths.
         When custom size is off, the overlay defaults to the asset's
-        native dimensions.
+        native ``width`` x ``height``.
         """
-        scaled = pixmap.scaled(
-            PREVIEW_WIDTH,
-            PREVIEW_HEIGHT,
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation,
-        )
         self._overlay_preview.setPixmap(scaled)
         if not self._custom_size_checkbox.isChecked():
-            self._width_input.setValue(pixmap.width())
-            self._height_input.setValue(pixmap.height())
+            self._width_input.setValue(width)
+            self._height_input.setValue(height)
 
     def _on_custom_size_toggled(self, state: int) -> None:
         """Handle custom size checkbox toggle."""
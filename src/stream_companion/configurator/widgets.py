@@ -9,11 +9,22 @@ from __future__ import annotations
 import logging
 from typing import List, Optional
 
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QColor, QCursor, QPainter, QPen
+from PySide6.QtCore import QPoint, QRectF, Qt, QTimer, Signal
+from PySide6.QtGui import (
+    QColor,
+    QCursor,
+    QFont,
+    QFontMetrics,
+    QPainter,
+    QPen,
+    QPixmap,
+    QRegion,
+    QStaticText,
+)
 from PySide6.QtWidgets import (
     QApplication,
     QHBoxLayout,
+    QLabel,
     QLineEdit,
     QPushButton,
     QWidget,
@@ -22,64 +33,273 @@ from PySide6.QtWidgets import (
 _LOGGER = logging.getLogger(__name__)
 
 
+# Qt key code -> pynput-style name, shared by the capture widgets.
+_MODIFIER_KEYS = {
+    Qt.Key_Control: "ctrl",
+    Qt.Key_Alt: "alt",
+    Qt.Key_Shift: "shift",
+    Qt.Key_Meta: "cmd",
+    Qt.Key_Super_L: "cmd",
+    Qt.Key_Super_R: "cmd",
+}
+
+# Names that ``_format_hotkey`` wraps in angle brackets and sorts first.
+_MODIFIER_NAMES = frozenset({"ctrl", "alt", "shift", "cmd", "meta"})
+
+_KEY_NAMES = {
+    Qt.Key_A: "a",
+    Qt.Key_B: "b",
+    Qt.Key_C: "c",
+    Qt.Key_D: "d",
+    Qt.Key_E: "e",
+    Qt.Key_F: "f",
+    Qt.Key_G: "g",
+    Qt.Key_H: "h",
+    Qt.Key_I: "i",
+    Qt.Key_J: "j",
+    Qt.Key_K: "k",
+    Qt.Key_L: "l",
+    Qt.Key_M: "m",
+    Qt.Key_N: "n",
+    Qt.Key_O: "o",
+    Qt.Key_P: "p",
+    Qt.Key_Q: "q",
+    Qt.Key_R: "r",
+    Qt.Key_S: "s",
+    Qt.Key_T: "t",
+    Qt.Key_U: "u",
+    Qt.Key_V: "v",
+    Qt.Key_W: "w",
+    Qt.Key_X: "x",
+    Qt.Key_Y: "y",
+    Qt.Key_Z: "z",
+    Qt.Key_0: "0",
+    Qt.Key_1: "1",
+    Qt.Key_2: "2",
+    Qt.Key_3: "3",
+    Qt.Key_4: "4",
+    Qt.Key_5: "5",
+    Qt.Key_6: "6",
+    Qt.Key_7: "7",
+    Qt.Key_8: "8",
+    Qt.Key_9: "9",
+    Qt.Key_F1: "f1",
+    Qt.Key_F2: "f2",
+    Qt.Key_F3: "f3",
+    Qt.Key_F4: "f4",
+    Qt.Key_F5: "f5",
+    Qt.Key_F6: "f6",
+    Qt.Key_F7: "f7",
+    Qt.Key_F8: "f8",
+    Qt.Key_F9: "f9",
+    Qt.Key_F10: "f10",
+    Qt.Key_F11: "f11",
+    Qt.Key_F12: "f12",
+}
+
+
+def header_label(text: str) -> QLabel:
+    """Return a bold plain-text section header.
+
+    Equivalent to ``QLabel("<b>text</b>")`` without running the label
+    through Qt's rich-text engine.
+    """
+    label = QLabel(text)
+    label.setTextFormat(Qt.TextFormat.PlainText)
+    font = label.font()
+    font.setBold(True)
+    label.setFont(font)
+    return label
+
+
 class PositionPicker(QWidget):
     """Full-screen overlay for picking a position with the mouse."""
 
     position_picked = Signal(int, int)
 
+    _INSTRUCTIONS = "Click anywhere to set overlay position\nPress ESC to cancel"
+    # Half-width of the band repainted around each 2px crosshair line.
+    _LINE_MARGIN = 2
+    # Mouse moves are coalesced to at most one repaint per ~60 Hz frame.
+    _REPAINT_INTERVAL_MS = 16
+
+    # Paint resources are immutable; share them instead of rebuilding
+    # them on every paint.
+    _OVERLAY_COLOR = QColor(0, 0, 0, 180)
+    _INSTRUCTIONS_PEN = QPen(QColor(255, 255, 255), 2)
+    _CROSSHAIR_PEN = QPen(QColor(255, 0, 0), 2)
+    _COORDS_PEN = QPen(QColor(255, 255, 255), 1)
+
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
         self._picked_position: Optional[tuple[int, int]] = None
+        self._cursor_pos: Optional[QPoint] = None
+        self._pending_pos: Optional[QPoint] = None
+        # Dark overlay + instructions, rendered once per size (see
+        # ``_render_background``) and blitted on every paint.
+        self._background: Optional[QPixmap] = None
         self.setWindowFlags(
             Qt.WindowType.FramelessWindowHint
             | Qt.WindowType.WindowStaysOnTopHint
             | Qt.WindowType.Tool
         )
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, True)
+        # paintEvent overwrites every exposed pixel (the background is
+        # blitted with CompositionMode_Source), so Qt can skip clearing
+        # the damaged area to transparent before each paint.
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground, True)
         self.setCursor(QCursor(Qt.CursorShape.CrossCursor))
 
+        self._instructions_font = QFont(self.font())
+        self._instructions_font.setPointSize(16)
+        self._coords_font = QFont(self.font())
+        self._coords_font.setPointSize(12)
+        self._coords_metrics = QFontMetrics(self._coords_font)
+        self._coords_ascent = self._coords_metrics.ascent()
+        # Keeps the coordinate label's glyph layout between frames; only
+        # the text changes as the cursor moves.
+        self._coords_label = QStaticText()
+        self._coords_label.setTextFormat(Qt.TextFormat.PlainText)
+        self._coords_label.setPerformanceHint(
+            QStaticText.PerformanceHint.AggressiveCaching
+        )
+
+        self._repaint_timer = QTimer(self)
+        self._repaint_timer.setSingleShot(True)
+        self._repaint_timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._repaint_timer.setInterval(self._REPAINT_INTERVAL_MS)
+        self._repaint_timer.timeout.connect(self._flush_cursor_move)
+
     def showEvent(self, event) -> None:
         """Make the widget full screen when shown."""
         screen = QApplication.primaryScreen()
         if screen:
             self.setGeometry(screen.geometry())
+        self._cursor_pos = self.mapFromGlobal(QCursor.pos())
+        self._render_background()
         super().showEvent(event)
 
-    def paintEvent(self, event) -> None:
-        """Draw semi-transparent overlay with instructions."""
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-
+    def hideEvent(self, event) -> None:
+        # Drop a coalesced move that has not been painted yet.
+        self._repaint_timer.stop()
+        self._pending_pos = None
+        super().hideEvent(event)
+
+    def resizeEvent(self, event) -> None:
+        self._render_background()
+        super().resizeEvent(event)
+
+    def _render_background(self) -> None:
+        ratio = self.devicePixelRatioF()
+        size = self.size()
+        background = self._background
+        if (
+            background is not None
+            and background.devicePixelRatio() == ratio
+            and background.deviceIndependentSize().toSize() == size
+        ):
+            return
+        background = QPixmap(size * ratio)
+        background.setDevicePixelRatio(ratio)
+        background.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(background)
         # Semi-transparent dark overlay
-        painter.fillRect(self.rect(), QColor(0, 0, 0, 180))
+        painter.fillRect(self.rect(), self._OVERLAY_COLOR)
+        # Instructions
+        painter.setPen(self._INSTRUCTIONS_PEN)
+        painter.setFont(self._instructions_font)
+        painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, self._INSTRUCTIONS)
+        painter.end()
+        self._background = background
 
-        # Draw instructions
-        painter.setPen(QPen(QColor(255, 255, 255), 2))
-        font = painter.font()
-        font.setPointSize(16)
-        painter.setFont(font)
+    def paintEvent(self, event) -> None:
+        """Draw semi-transparent overlay with instructions.
+
+        Only the exposed region is repainted; mouse moves invalidate just
+        the old and new crosshair bands (see ``_crosshair_region``).
+        """
+        if self._background is None:
+            self._render_background()
+        # No Antialiasing hint: everything drawn here is pixmaps and
+        # axis-aligned lines on integer coordinates. Text keeps Qt's default
+        # TextAntialiasing.
+        painter = QPainter(self)
 
-        text = "Click anywhere to set overlay position\nPress ESC to cancel"
-        painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, text)
+        # Cached overlay + instructions, blitted one damaged rect at a time
+        # (the source rect is in the pixmap's device pixels). Source mode
+        # replaces whatever was there, alpha included.
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+        background = self._background
+        ratio = background.devicePixelRatio()
+        for rect in event.region():
+            source = QRectF(
+                rect.x() * ratio,
+                rect.y() * ratio,
+                rect.width() * ratio,
+                rect.height() * ratio,
+            )
+            painter.drawPixmap(QRectF(rect), background, source)
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceOver)
 
         # Draw crosshair at cursor position
-        cursor_pos = self.mapFromGlobal(QCursor.pos())
-        painter.setPen(QPen(QColor(255, 0, 0), 2))
+        cursor_pos = self._cursor_pos
+        if cursor_pos is None:
+            return
+        painter.setPen(self._CROSSHAIR_PEN)
         # Horizontal line
         painter.drawLine(0, cursor_pos.y(), self.width(), cursor_pos.y())
         # Vertical line
         painter.drawLine(cursor_pos.x(), 0, cursor_pos.x(), self.height())
 
         # Draw coordinates
-        painter.setPen(QPen(QColor(255, 255, 255), 1))
-        font.setPointSize(12)
-        painter.setFont(font)
-        coord_text = f"X: {cursor_pos.x()}, Y: {cursor_pos.y()}"
-        painter.drawText(cursor_pos.x() + 10, cursor_pos.y() - 10, coord_text)
+        painter.setPen(self._COORDS_PEN)
+        painter.setFont(self._coords_font)
+        text = self._coords_text(cursor_pos)
+        if self._coords_label.text() != text:
+            self._coords_label.setText(text)
+        # drawStaticText() takes the top-left corner, drawText() the baseline
+        painter.drawStaticText(
+            cursor_pos.x() + 10,
+            cursor_pos.y() - 10 - self._coords_ascent,
+            self._coords_label,
+        )
 
     def mouseMoveEvent(self, event) -> None:
-        """Update display as mouse moves."""
-        self.update()
+        """Record the cursor; the repaint happens on the next frame tick."""
+        self._pending_pos = event.position().toPoint()
+        if not self._repaint_timer.isActive():
+            self._repaint_timer.start()
+
+    def _flush_cursor_move(self) -> None:
+        """Repaint the previous and new crosshair bands only."""
+        pos = self._pending_pos
+        self._pending_pos = None
+        previous = self._cursor_pos
+        if pos is None or previous == pos:
+            return
+        self._cursor_pos = pos
+        region = self._crosshair_region(pos)
+        if previous is not None:
+            region += self._crosshair_region(previous)
+        self.update(region)
+
+    @staticmethod
+    def _coords_text(pos: QPoint) -> str:
+        return f"X: {pos.x()}, Y: {pos.y()}"
+
+    def _crosshair_region(self, pos: QPoint) -> QRegion:
+        """Area covered by the crosshair lines and coordinate label at ``pos``.
+
+        Passed to ``update()`` so Qt clips the whole repaint, including the
+        background blit, to these bands instead of the full screen.
+        """
+        margin = self._LINE_MARGIN
+        region = QRegion(0, pos.y() - margin, self.width(), 2 * margin + 1)
+        region += QRegion(pos.x() - margin, 0, 2 * margin + 1, self.height())
+        label = self._coords_metrics.boundingRect(self._coords_text(pos))
+        label.translate(pos.x() + 10, pos.y() - 10)
+        return region + QRegion(label.adjusted(-2, -2, 2, 2))
 
     def mousePressEvent(self, event) -> None:
         """Capture the clicked position."""
@@ -102,7 +322,9 @@ class HotkeyCapture(QWidget):
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
         self._capturing = False
+        # Captured keys in press order, plus a set for O(1) "seen" checks.
         self._keys: List[str] = []
+        self._keys_seen: set[str] = set()
 
         layout = QHBoxLayout()
         self._display = QLineEdit()
@@ -133,6 +355,7 @@ class HotkeyCapture(QWidget):
     def _start_capture(self) -> None:
         self._capturing = True
         self._keys = []
+        self._keys_seen = set()
         self._display.setText("Press keys...")
         self._capture_btn.setText("Stop")
         self.setFocus()
@@ -145,18 +368,18 @@ class HotkeyCapture(QWidget):
             self._display.setText(hotkey)
             self.hotkey_captured.emit(hotkey)
 
-    def _format_hotkey(self, keys: List[str]) -> str:
+    @staticmethod
+    def _format_hotkey(keys: List[str]) -> str:
         """Format captured keys into pynput-style hotkey string."""
-        modifiers = []
-        regular = []
-
+        modifiers: List[str] = []
+        regular: List[str] = []
         for key in keys:
-            if key in ("ctrl", "alt", "shift", "cmd", "meta"):
+            if key in _MODIFIER_NAMES:
                 modifiers.append(f"<{key}>")
             else:
                 regular.append(key)
-
-        return "+".join(modifiers + regular)
+        modifiers.extend(regular)
+        return "+".join(modifiers)
 
     def keyPressEvent(self, event) -> None:
         """Capture key press events."""
@@ -165,77 +388,16 @@ class HotkeyCapture(QWidget):
             return
 
         key_name = self._qt_key_to_name(event.key(), event.modifiers())
-        if key_name and key_name not in self._keys:
+        if key_name and key_name not in self._keys_seen:
             self._keys.append(key_name)
+            self._keys_seen.add(key_name)
             self._display.setText(" + ".join(self._keys))
 
-    def _qt_key_to_name(self, key: int, modifiers) -> Optional[str]:
+    @staticmethod
+    def _qt_key_to_name(key: int, modifiers) -> Optional[str]:
         """Convert Qt key code to readable name."""
-        # First check if the key itself is a modifier key
-        modifier_keys = {
-            Qt.Key_Control: "ctrl",
-            Qt.Key_Alt: "alt",
-            Qt.Key_Shift: "shift",
-            Qt.Key_Meta: "cmd",
-            Qt.Key_Super_L: "cmd",
-            Qt.Key_Super_R: "cmd",
-        }
-
-        if key in modifier_keys:
-            return modifier_keys[key]
-
-        # Map regular keys
-        key_map = {
-            Qt.Key_A: "a",
-            Qt.Key_B: "b",
-            Qt.Key_C: "c",
-            Qt.Key_D: "d",
-            Qt.Key_E: "e",
-            Qt.Key_F: "f",
-            Qt.Key_G: "g",
-            Qt.Key_H: "h",
-            Qt.Key_I: "i",
-            Qt.Key_J: "j",
-            Qt.Key_K: "k",
-            Qt.Key_L: "l",
-            Qt.Key_M: "m",
-            Qt.Key_N: "n",
-            Qt.Key_O: "o",
-            Qt.Key_P: "p",
-            Qt.Key_Q: "q",
-            Qt.Key_R: "r",
-            Qt.Key_S: "s",
-            Qt.Key_T: "t",
-            Qt.Key_U: "u",
-            Qt.Key_V: "v",
-            Qt.Key_W: "w",
-            Qt.Key_X: "x",
-            Qt.Key_Y: "y",
-            Qt.Key_Z: "z",
-            Qt.Key_0: "0",
-            Qt.Key_1: "1",
-            Qt.Key_2: "2",
-            Qt.Key_3: "3",
-            Qt.Key_4: "4",
-            Qt.Key_5: "5",
-            Qt.Key_6: "6",
-            Qt.Key_7: "7",
-            Qt.Key_8: "8",
-            Qt.Key_9: "9",
-            Qt.Key_F1: "f1",
-            Qt.Key_F2: "f2",
-            Qt.Key_F3: "f3",
-            Qt.Key_F4: "f4",
-            Qt.Key_F5: "f5",
-            Qt.Key_F6: "f6",
-            Qt.Key_F7: "f7",
-            Qt.Key_F8: "f8",
-            Qt.Key_F9: "f9",
-            Qt.Key_F10: "f10",
-            Qt.Key_F11: "f11",
-            Qt.Key_F12: "f12",
-        }
-        return key_map.get(key)
+        # Modifier keys take precedence over the regular key map
+        return _MODIFIER_KEYS.get(key) or _KEY_NAMES.get(key)
 
 
 class SingleKeyCapture(QWidget):
@@ -288,7 +450,7 @@ class SingleKeyCapture(QWidget):
         ):
             self._display.setText("No modifiers allowed")
             return
-        name = HotkeyCapture._qt_key_to_name(self, event.key(), event.modifiers())
+        name = HotkeyCapture._qt_key_to_name(event.key(), event.modifiers())
         if name:
             existing = self._display.text().strip()
             if existing and existing not in ("Press a key...", "No modifiers allowed"):
@@ -9,8 +9,13 @@ section widget has a small read/populate/validate API and lives in
 from __future__ import annotations
 
 import logging
-from pathlib import Path
-from typing import List, Optional
+import os
+import stat
+import time
+from collections import Counter
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterator, List, Optional
 
 from PySide6.QtWidgets import (
     QHBoxLayout,
@@ -22,6 +27,7 @@ from PySide6.QtWidgets import (
     QPushButton,
     QRadioButton,
     QSpinBox,
+    QStackedWidget,
     QTabWidget,
     QVBoxLayout,
     QWidget,
@@ -31,14 +37,44 @@ from .. import model_downloader
 from ..config_loader import ConfigError, load_full_config, save_config
 from ..llm.config import LLMConfig
 from ..models import ActivatorConfig, Shortcut
-from ..overlay import OverlayWindow
-from ..sound import SoundPlayer
 from .llm_section import LLMSection
 from .sections import STTSection, ShortcutSection
-from .widgets import HotkeyCapture
+from .widgets import HotkeyCapture, header_label
+
+if TYPE_CHECKING:
+    from ..overlay import OverlayWindow
+    from ..sound import SoundPlayer
 
 _LOGGER = logging.getLogger(__name__)
 
+# How long a cached asset existence check stays valid.
+_PATH_CHECK_TTL_S = 5.0
+# Expired checks are pruned once the cache holds this many paths.
+_PATH_CHECK_MAX = 256
+
+
+# Shortcut is a frozen, hashable dataclass, so list labels can be memoized
+# on the value itself: rows whose shortcut did not change reuse the string.
+@lru_cache(maxsize=1024)
+def _shortcut_display(shortcut: Shortcut) -> str:
+    """Return the list-row label for ``shortcut``."""
+    if shortcut.hotkey:
+        display = shortcut.hotkey
+    else:
+        seq = "+".join(shortcut.suffix) if shortcut.suffix else ""
+        display = f"[{seq}]"
+    if shortcut.sound_path:
+        display += " | 🔊"
+    if shortcut.overlay:
+        display += " | 🖼️"
+    triggers = shortcut.all_trigger_phrases()
+    if triggers:
+        preview = ", ".join(f"“{t}”" for t in triggers[:2])
+        if len(triggers) > 2:
+            preview += f" +{len(triggers) - 2}"
+        display += f" | 🗣️{preview}"
+    return display
+
 
 class ConfiguratorWindow(QMainWindow):
     """Main window for the desktop configurator."""
@@ -53,8 +89,14 @@ class ConfiguratorWindow(QMainWindow):
         self._stt_config = None
         self._llm_config: Optional[LLMConfig] = None
         self._current_index: Optional[int] = None
-        self._sound_player = SoundPlayer()
-        self._overlay_window = OverlayWindow()
+        # Set while the list selection is changed from code, so
+        # _on_selection_changed does not re-populate the editor.
+        self._suppress_selection = False
+        # path -> (is_file, monotonic time checked); see ``_path_is_file``.
+        self._path_checks: dict[str, tuple[bool, float]] = {}
+        # Only needed for Preview; built on first use (see the getters).
+        self._sound_player: Optional[SoundPlayer] = None
+        self._overlay_window: Optional[OverlayWindow] = None
 
         self._init_ui()
         self._load_shortcuts()
@@ -68,7 +110,7 @@ class ConfiguratorWindow(QMainWindow):
 
         # Left panel: shortcut list
         left_panel = QVBoxLayout()
-        left_panel.addWidget(QLabel("<b>Shortcuts</b>"))
+        left_panel.addWidget(header_label("Shortcuts"))
 
         self._list_widget = QListWidget()
         self._list_widget.currentRowChanged.connect(self._on_selection_changed)
@@ -92,12 +134,16 @@ class ConfiguratorWindow(QMainWindow):
         self._stt_section = STTSection()
         # Tab 3: AI Assistant (LLM)
         self._llm_section = LLMSection()
-        # Tab 4: Shortcut Details
+        # Tab 4: Shortcut Details. The editor is only built when a
+        # shortcut is first selected (see ``_shortcut_editor``); until
+        # then the tab shows a placeholder.
         shortcut_panel = QWidget()
         shortcut_layout = QVBoxLayout()
         shortcut_panel.setLayout(shortcut_layout)
-        self._shortcut_section = ShortcutSection()
-        shortcut_layout.addWidget(self._shortcut_section)
+        self._shortcut_section: Optional[ShortcutSection] = None
+        self._shortcut_stack = QStackedWidget()
+        self._shortcut_stack.addWidget(QLabel("Select or add a shortcut to edit it."))
+        shortcut_layout.addWidget(self._shortcut_stack)
 
         # Action buttons (Preview) for the selected shortcut. Saving
         # is handled by the global "Save All Settings" button at the
@@ -135,7 +181,7 @@ class ConfiguratorWindow(QMainWindow):
         global_panel = QWidget()
         global_layout = QVBoxLayout()
         global_panel.setLayout(global_layout)
-        global_layout.addWidget(QLabel("<b>Global Settings</b>"))
+        global_layout.addWidget(header_label("Global Settings"))
 
         global_layout.addWidget(QLabel("Activator Hotkey:"))
         self._activator_capture = HotkeyCapture()
@@ -194,39 +240,90 @@ class ConfiguratorWindow(QMainWindow):
             _LOGGER.error("Failed to load shortcuts: %s", exc)
 
     def _refresh_list(self) -> None:
-        """Refresh the shortcut list widget."""
-        self._list_widget.clear()
-        for shortcut in self._shortcuts:
-            if shortcut.hotkey:
-                display = shortcut.hotkey
-            else:
-                seq = "+".join(shortcut.suffix) if shortcut.suffix else ""
-                display = f"[{seq}]"
-            if shortcut.sound_path:
-                display += " | 🔊"
-            if shortcut.overlay:
-                display += " | 🖼️"
-            triggers = shortcut.all_trigger_phrases()
-            if triggers:
-                preview = ", ".join(f"“{t}”" for t in triggers[:2])
-                if len(triggers) > 2:
-                    preview += f" +{len(triggers) - 2}"
-                display += f" | 🗣️{preview}"
-            item = QListWidgetItem(display)
-            self._list_widget.addItem(item)
+        """Sync the shortcut list widget with ``self._shortcuts``.
+
+        Only used for bulk loads; single edits go through the
+        ``_append/_update/_remove_shortcut_row`` helpers. Existing rows are
+        reused and only relabelled when their text changed.
+        """
+        list_widget = self._list_widget
+        list_widget.setUpdatesEnabled(False)
+        try:
+            with self._programmatic_selection():
+                list_widget.setCurrentRow(-1)
+                while list_widget.count() > len(self._shortcuts):
+                    list_widget.takeItem(list_widget.count() - 1)
+                kept = list_widget.count()
+                for index, shortcut in enumerate(self._shortcuts[:kept]):
+                    self._update_shortcut_row(index, shortcut)
+                # New rows go in as one model insertion rather than one per item.
+                list_widget.addItems(
+                    [_shortcut_display(shortcut) for shortcut in self._shortcuts[kept:]]
+                )
+        finally:
+            list_widget.setUpdatesEnabled(True)
+        # A reload invalidates the old selection; reset the editor once.
+        self._current_index = None
+        if self._shortcut_section is not None:
+            self._shortcut_section.clear()
+        self._update_ui_state()
+
+    def _append_shortcut_row(self, shortcut: Shortcut) -> None:
+        self._list_widget.addItem(QListWidgetItem(_shortcut_display(shortcut)))
+
+    def _update_shortcut_row(self, index: int, shortcut: Shortcut) -> None:
+        item = self._list_widget.item(index)
+        if item is None:
+            self._refresh_list()
+            return
+        display = _shortcut_display(shortcut)
+        if item.text() != display:
+            item.setText(display)
+
+    def _remove_shortcut_row(self, index: int) -> None:
+        # Taking the current row would otherwise select (and populate the
+        # editor with) a neighbour; the caller resets the editor instead.
+        with self._programmatic_selection():
+            self._list_widget.takeItem(index)
+            self._list_widget.setCurrentRow(-1)
+
+    @contextmanager
+    def _programmatic_selection(self) -> Iterator[None]:
+        """Suppress ``_on_selection_changed`` while we move the selection."""
+        previous = self._suppress_selection
+        self._suppress_selection = True
+        try:
+            yield
+        finally:
+            self._suppress_selection = previous
 
     def _on_selection_changed(self, index: int) -> None:
         """Handle shortcut selection change."""
+        if self._suppress_selection:
+            return
         if index < 0 or index >= len(self._shortcuts):
             self._current_index = None
-            self._shortcut_section.clear()
+            if self._shortcut_section is not None:
+                self._shortcut_section.clear()
             self._update_ui_state()
             return
 
         self._current_index = index
-        self._shortcut_section.populate(self._shortcuts[index])
+        self._shortcut_editor().populate(self._shortcuts[index])
         self._update_ui_state()
 
+    def _shortcut_editor(self) -> ShortcutSection:
+        """Return the shortcut editor, building it on first use."""
+        if self._shortcut_section is None:
+            section = ShortcutSection()
+            # Re-entering a path drops its cached existence check.
+            section._sound_input.textChanged.connect(self._forget_path)
+            section._overlay_input.textChanged.connect(self._forget_path)
+            self._shortcut_stack.addWidget(section)
+            self._shortcut_stack.setCurrentWidget(section)
+            self._shortcut_section = section
+        return self._shortcut_section
+
     def _update_ui_state(self) -> None:
         """Update button enabled states."""
         has_selection = self._current_index is not None
@@ -241,8 +338,15 @@ class ConfiguratorWindow(QMainWindow):
         """Add a new shortcut."""
         new_shortcut = Shortcut(hotkey="<ctrl>+<alt>+new")
         self._shortcuts.append(new_shortcut)
-        self._refresh_list()
-        self._list_widget.setCurrentRow(len(self._shortcuts) - 1)
+        index = len(self._shortcuts) - 1
+        # Select the new row without going through _on_selection_changed;
+        # the editor is filled from ``new_shortcut`` directly.
+        with self._programmatic_selection():
+            self._append_shortcut_row(new_shortcut)
+            self._list_widget.setCurrentRow(index)
+        self._current_index = index
+        self._shortcut_editor().populate(new_shortcut)
+        self._update_ui_state()
 
     def _delete_shortcut(self) -> None:
         """Delete the selected shortcut."""
@@ -258,9 +362,9 @@ class ConfiguratorWindow(QMainWindow):
 
         if reply == QMessageBox.Yes:
             del self._shortcuts[self._current_index]
-            self._refresh_list()
+            self._remove_shortcut_row(self._current_index)
             self._current_index = None
-            self._shortcut_section.clear()
+            self._shortcut_editor().clear()
             self._update_ui_state()
 
     # ------------------------------------------------------------------
@@ -276,26 +380,27 @@ class ConfiguratorWindow(QMainWindow):
         if self._current_index is None:
             return
 
-        sec = self._shortcut_section
+        sec = self._shortcut_editor()
         sound_path = sec._sound_input.text().strip()
         overlay_path = sec._overlay_input.text().strip()
 
         if sound_path:
-            if not Path(sound_path).is_file():
+            if not self._path_is_file(sound_path):
                 QMessageBox.warning(
                     self, "Preview Error", f"Sound file not found: {sound_path}"
                 )
             else:
                 sound_id = f"preview_{self._current_index}"
-                if self._sound_player.load(sound_id, sound_path):
-                    self._sound_player.play(sound_id)
+                player = self._get_sound_player()
+                if player.load(sound_id, sound_path):
+                    player.play(sound_id)
                 else:
                     QMessageBox.warning(
                         self, "Preview Error", "Failed to load sound file"
                     )
 
         if overlay_path:
-            if not Path(overlay_path).is_file():
+            if not self._path_is_file(overlay_path):
                 QMessageBox.warning(
                     self, "Preview Error", f"Overlay file not found: {overlay_path}"
                 )
@@ -304,7 +409,7 @@ class ConfiguratorWindow(QMainWindow):
                 if sec._custom_size_checkbox.isChecked():
                     size = (sec._width_input.value(), sec._height_input.value())
 
-                success = self._overlay_window.show_asset(
+                success = self._get_overlay_window().show_asset(
                     overlay_path,
                     duration_ms=sec._duration_input.value(),
                     position=(sec._x_input.value(), sec._y_input.value()),
@@ -315,12 +420,59 @@ class ConfiguratorWindow(QMainWindow):
                         self, "Preview Error", "Failed to display overlay"
                     )
 
+    def _path_is_file(self, path: str) -> bool:
+        """Whether ``path`` is a regular file, reused for a few seconds.
+
+        Preview and Save check the same asset paths back to back, and
+        shortcuts often share files; this keeps it to one ``stat`` per
+        path. The short TTL picks up files created after a failed check,
+        and ``_save_changes`` starts every Save from an empty cache.
+        """
+        now = time.monotonic()
+        cached = self._path_checks.get(path)
+        if cached is not None and now - cached[1] < _PATH_CHECK_TTL_S:
+            return cached[0]
+        try:
+            result = stat.S_ISREG(os.stat(path).st_mode)
+        except (OSError, ValueError):
+            result = False
+        checks = self._path_checks
+        if len(checks) >= _PATH_CHECK_MAX and path not in checks:
+            # A long session can check many distinct paths; drop expired
+            # entries instead of letting the cache grow without bound.
+            for stale in [
+                p for p, (_, at) in checks.items() if now - at >= _PATH_CHECK_TTL_S
+            ]:
+                del checks[stale]
+        checks[path] = (result, now)
+        return result
+
+    def _forget_path(self, path: str) -> None:
+        self._path_checks.pop(path.strip(), None)
+
+    def _get_sound_player(self) -> SoundPlayer:
+        if self._sound_player is None:
+            from ..sound import SoundPlayer
+
+            self._sound_player = SoundPlayer()
+        return self._sound_player
+
+    def _get_overlay_window(self) -> OverlayWindow:
+        if self._overlay_window is None:
+            from ..overlay import OverlayWindow
+
+            self._overlay_window = OverlayWindow()
+        return self._overlay_window
+
     def _save_changes(self) -> None:
         """Save all shortcuts to configuration file."""
         if self._current_index is not None:
             if not self._update_current_shortcut():
                 return
 
+        # Each Save re-checks the disk, so a missing asset the user just
+        # copied into place is not reported again from the cache.
+        self._path_checks.clear()
         validation_errors = self._validate_shortcuts()
         stt_config = self._stt_section.read()
         validation_errors.extend(self._stt_section.validate(stt_config))
@@ -398,40 +550,40 @@ class ConfiguratorWindow(QMainWindow):
         if self._current_index is None:
             return True
 
-        errors = self._shortcut_section.validate_trigger()
+        errors = self._shortcut_editor().validate_trigger()
         if errors:
             QMessageBox.warning(self, "Validation Error", errors[0])
             return False
 
-        self._shortcuts[self._current_index] = self._shortcut_section.read()
-        self._refresh_list()
+        shortcut = self._shortcut_editor().read()
+        self._shortcuts[self._current_index] = shortcut
+        self._update_shortcut_row(self._current_index, shortcut)
         return True
 
     def _validate_shortcuts(self) -> List[str]:
         """Validate all shortcuts and return list of errors."""
         errors = []
 
-        hotkeys = [s.hotkey for s in self._shortcuts if s.hotkey]
-        duplicates = {hk for hk in hotkeys if hotkeys.count(hk) > 1}
+        hotkey_counts = Counter(s.hotkey for s in self._shortcuts if s.hotkey)
+        duplicates = [hk for hk, count in hotkey_counts.items() if count > 1]
         if duplicates:
             errors.append(f"Duplicate hotkeys found: {', '.join(duplicates)}")
 
-        suffixes = [s.suffix for s in self._shortcuts if s.suffix]
-        dup_suffix: list[tuple[str, ...]] = []
-        for sx in suffixes:
-            if suffixes.count(sx) > 1 and sx not in dup_suffix:
-                dup_suffix.append(sx)
+        suffix_counts = Counter(s.suffix for s in self._shortcuts if s.suffix)
+        dup_suffix = [sx for sx, count in suffix_counts.items() if count > 1]
         if dup_suffix:
             formatted = ["+".join(sx) for sx in dup_suffix]
             errors.append(f"Duplicate chord suffixes found: {', '.join(formatted)}")
 
         seen: set[str] = set()
-        duplicate_triggers: list[str] = []
+        # dict as an insertion-ordered set: report in first-seen order.
+        duplicate_triggers: dict[str, None] = {}
         for s in self._shortcuts:
             for phrase in s.all_trigger_phrases():
-                if phrase in seen and phrase not in duplicate_triggers:
-                    duplicate_triggers.append(phrase)
-                seen.add(phrase)
+                if phrase in seen:
+                    duplicate_triggers[phrase] = None
+                else:
+                    seen.add(phrase)
         for phrase in duplicate_triggers:
             errors.append(
                 f"Duplicate voice triggers found: {phrase!r} — only the "
@@ -439,11 +591,11 @@ class ConfiguratorWindow(QMainWindow):
             )
 
         for i, shortcut in enumerate(self._shortcuts):
-            if shortcut.sound_path and not Path(shortcut.sound_path).is_file():
+            if shortcut.sound_path and not self._path_is_file(shortcut.sound_path):
                 errors.append(
                     f"Shortcut {i + 1}: Sound file not found: {shortcut.sound_path}"
                 )
-            if shortcut.overlay and not Path(shortcut.overlay.file).is_file():
+            if shortcut.overlay and not self._path_is_file(shortcut.overlay.file):
                 errors.append(
                     f"Shortcut {i + 1}: Overlay file not found: {shortcut.overlay.file}"
                 )
@@ -452,6 +604,8 @@ class ConfiguratorWindow(QMainWindow):
 
     def closeEvent(self, event) -> None:
         """Handle window close event."""
-        self._shortcut_section.cleanup_preview()
-        self._sound_player.shutdown()
+        if self._shortcut_section is not None:
+            self._shortcut_section.cleanup_preview()
+        if self._sound_player is not None:
+            self._sound_player.shutdown()
         super().closeEvent(event)
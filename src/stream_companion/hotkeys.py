@@ -4,19 +4,127 @@ from __future__ import annotations
 
 import logging
 import threading
-from dataclasses import dataclass
-from typing import Callable, Dict, Iterable, Optional, Tuple, List
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
 
 from pynput import keyboard
 
 Callback = Callable[[], None]
-
-
-@dataclass
+_Key = keyboard.Key | keyboard.KeyCode
+
+# Clock for chord deadlines; a module attribute so tests can swap it
+# without patching the global ``time`` module.
+_monotonic = time.monotonic
+
+# Chord suffix tokens for non-character keys.
+_SPECIAL_KEY_TOKENS: Dict[keyboard.Key, str] = {
+    keyboard.Key.esc: "esc",
+    keyboard.Key.space: "space",
+    keyboard.Key.enter: "enter",
+    keyboard.Key.tab: "tab",
+    keyboard.Key.backspace: "backspace",
+    keyboard.Key.delete: "delete",
+    keyboard.Key.up: "up",
+    keyboard.Key.down: "down",
+    keyboard.Key.left: "left",
+    keyboard.Key.right: "right",
+    keyboard.Key.home: "home",
+    keyboard.Key.end: "end",
+    keyboard.Key.page_up: "pageup",
+    keyboard.Key.page_down: "pagedown",
+    keyboard.Key.f1: "f1",
+    keyboard.Key.f2: "f2",
+    keyboard.Key.f3: "f3",
+    keyboard.Key.f4: "f4",
+    keyboard.Key.f5: "f5",
+    keyboard.Key.f6: "f6",
+    keyboard.Key.f7: "f7",
+    keyboard.Key.f8: "f8",
+    keyboard.Key.f9: "f9",
+    keyboard.Key.f10: "f10",
+    keyboard.Key.f11: "f11",
+    keyboard.Key.f12: "f12",
+}
+# Punctuation characters accepted as suffix tokens besides letters/digits.
+_PUNCTUATION_TOKENS = frozenset("-=`[];,'./\\")
+
+
+@dataclass(slots=True)
 class _Binding:
+    """A registered hotkey; ``keys`` is ``None`` when its key set is unknown."""
+
     combination: str
     callback: Callback
     hotkey: keyboard.HotKey
+    keys: Optional[FrozenSet[_Key]] = None
+
+
+@dataclass(slots=True)
+class _SuffixNode:
+    """One token in the chord-suffix trie; ``callback`` marks a full sequence.
+
+    ``sequence`` is the ``+``-joined path to a node with a callback, kept
+    for log messages so dispatch does not have to record typed keys.
+    """
+
+    children: Dict[str, "_SuffixNode"] = field(default_factory=dict)
+    callback: Optional[Callback] = None
+    sequence: str = ""
+
+
+@lru_cache(maxsize=256)
+def _normalize_combination(combination: str) -> str:
+    """Registry key for ``combination``: segments stripped, lowercased.
+
+    Pure and called with the same few strings on every unregistration, so
+    results are memoized. Canonical combinations are already in this form.
+    """
+    parts = [segment.strip() for segment in combination.split("+")]
+    return "+".join(parts).lower()
+
+
+@lru_cache(maxsize=256)
+def _canonicalize(combination: str) -> str:
+    # Memoized body of HotkeyManager.canonicalize; the result is already
+    # stripped and lowercased, so it doubles as the registry key.
+    if not combination:
+        raise ValueError("Hotkey combination must be a non-empty string")
+    modifiers = {"ctrl", "alt", "shift", "cmd", "meta"}
+    out = []
+    for raw in combination.split("+"):
+        token = raw.strip().lower()
+        if not token:
+            continue
+        if token in modifiers:
+            out.append(f"<{token}>")
+        else:
+            out.append(token)
+    if not out:
+        raise ValueError(
+            f"Hotkey combination '{combination}' has no usable key segments"
+        )
+    # Require at least one non-modifier key to avoid registering
+    # something like "ctrl+alt" with no trigger. Note that bracketed
+    # special keys such as ``<esc>``, ``<space>`` or ``<f1>`` are
+    # NON-modifiers — only the actual modifier names count here, so a
+    # bare ``<esc>`` is a valid (modifier-less) hotkey.
+    modifier_tokens = {f"<{m}>" for m in modifiers}
+    if all(seg in modifier_tokens for seg in out):
+        raise ValueError(f"Hotkey combination '{combination}' has no non-modifier key")
+    return "+".join(out)
+
+
+def _build_suffix_trie(seq_map: Dict[Tuple[str, ...], Callback]) -> _SuffixNode:
+    root = _SuffixNode()
+    for seq, callback in seq_map.items():
+        node = root
+        for token in seq:
+            node = node.children.setdefault(token, _SuffixNode())
+        node.callback = callback
+        node.sequence = "+".join(seq)
+    return root
 
 
 class HotkeyManager:
@@ -33,18 +141,37 @@ class HotkeyManager:
         self._lock = threading.RLock()
         self._listener_factory = listener_factory or self._default_listener_factory
         self._hotkey_factory = hotkey_factory or self._default_hotkey_factory
+        # Only pynput's own HotKey is known to ignore keys outside its
+        # combination, so custom factories are fed every key event.
+        self._index_keys = hotkey_factory is None
         self._logger = logger or logging.getLogger(__name__)
         self._listener: Optional[keyboard.Listener] = None
         self._hotkeys: Dict[str, _Binding] = {}
+        # Dispatch index rebuilt on (un)registration: bindings by each key
+        # of their combination, so a key event only feeds the hotkeys that
+        # contain it, plus bindings whose keys are unknown (fed everything).
+        # Both halves are swapped in as one tuple and never mutated, so the
+        # listener thread reads them without taking the lock.
+        self._dispatch_index: Tuple[
+            Dict[_Key, Tuple[_Binding, ...]], Tuple[_Binding, ...]
+        ] = ({}, ())
+        # Immutable like the index; handed out as-is by
+        # registered_combinations().
+        self._combinations: Tuple[str, ...] = ()
         # Chorded hotkey support (press-mode MVP)
         self._activator_combo: Optional[str] = None
         self._activator_binding: Optional[_Binding] = None
         self._armed: bool = False
-        self._arm_timer: Optional[threading.Timer] = None
+        # _monotonic() time after which an armed chord no longer accepts
+        # suffix keys; checked lazily on the next key press instead of
+        # starting a Timer thread per activation.
+        self._arm_deadline: float = 0.0
         self._arm_timeout_ms: int = 1500
-        # For sequential chords
-        self._suffix_seq_map: Dict[Tuple[str, ...], Callback] = {}
-        self._buffer: List[str] = []
+        # For sequential chords: a trie of suffix tokens plus the node the
+        # keys typed since arming have reached, so each key press is a
+        # single dict lookup regardless of how many sequences exist.
+        self._suffix_root = _SuffixNode()
+        self._suffix_node = self._suffix_root
         # When activator is triggered by a key press, ignore that press as a suffix token
         self._ignore_next: bool = False
 
@@ -62,11 +189,6 @@ class HotkeyManager:
         parsed = keyboard.HotKey.parse(combination)
         return keyboard.HotKey(parsed, on_activate)
 
-    @staticmethod
-    def _normalize_combination(combination: str) -> str:
-        parts = [segment.strip() for segment in combination.split("+")]
-        return "+".join(parts).lower()
-
     @staticmethod
     def canonicalize(combination: str) -> str:
         """Convert a user-friendly hotkey string into pynput's <key>+<key> form.
@@ -79,33 +201,7 @@ class HotkeyManager:
         modifiers.
         """
 
-        if not combination:
-            raise ValueError("Hotkey combination must be a non-empty string")
-        modifiers = {"ctrl", "alt", "shift", "cmd", "meta"}
-        out = []
-        for raw in combination.split("+"):
-            token = raw.strip().lower()
-            if not token:
-                continue
-            if token in modifiers:
-                out.append(f"<{token}>")
-            else:
-                out.append(token)
-        if not out:
-            raise ValueError(
-                f"Hotkey combination '{combination}' has no usable key segments"
-            )
-        # Require at least one non-modifier key to avoid registering
-        # something like "ctrl+alt" with no trigger. Note that bracketed
-        # special keys such as ``<esc>``, ``<space>`` or ``<f1>`` are
-        # NON-modifiers — only the actual modifier names count here, so a
-        # bare ``<esc>`` is a valid (modifier-less) hotkey.
-        modifier_tokens = {f"<{m}>" for m in modifiers}
-        if all(seg in modifier_tokens for seg in out):
-            raise ValueError(
-                f"Hotkey combination '{combination}' has no non-modifier key"
-            )
-        return "+".join(out)
+        return _canonicalize(combination)
 
     @property
     def is_running(self) -> bool:
@@ -140,15 +236,16 @@ class HotkeyManager:
             raise ValueError("Hotkey callback must be callable")
 
         canonical = self.canonicalize(combination)
-        normalized = self._normalize_combination(canonical)
+        keys = frozenset(keyboard.HotKey.parse(canonical)) if self._index_keys else None
         with self._lock:
-            if normalized in self._hotkeys:
+            if canonical in self._hotkeys:
                 raise ValueError(f"Hotkey '{combination}' already registered")
             hotkey = self._hotkey_factory(
                 canonical,
-                lambda combo=normalized: self._execute_callback(combo),
+                lambda combo=canonical: self._execute_callback(combo),
             )
-            self._hotkeys[normalized] = _Binding(canonical, callback, hotkey)
+            self._hotkeys[canonical] = _Binding(canonical, callback, hotkey, keys)
+            self._rebuild_dispatch_index()
         self._logger.info("Registered hotkey %s (input was %r)", canonical, combination)
 
     def configure_chord(
@@ -165,7 +262,7 @@ class HotkeyManager:
 
         # Register activator as a normal hotkey whose callback arms the manager
         canonical = self.canonicalize(activator)
-        self._activator_combo = self._normalize_combination(canonical)
+        self._activator_combo = canonical
 
         def _arm_cb() -> None:
             self._arm(timeout_ms)
@@ -174,7 +271,10 @@ class HotkeyManager:
         self.register_hotkey(canonical, _arm_cb)
         with self._lock:
             # Back-compat: wrap single-key map into sequence map
-            self._suffix_seq_map = {(k,): cb for k, cb in suffix_map.items()}
+            self._suffix_root = _build_suffix_trie(
+                {(k,): cb for k, cb in suffix_map.items()}
+            )
+            self._suffix_node = self._suffix_root
             self._arm_timeout_ms = max(100, int(timeout_ms))
 
     def configure_chord_sequences(
@@ -190,37 +290,56 @@ class HotkeyManager:
             raise ValueError("Sequence map must not be empty")
 
         canonical = self.canonicalize(activator)
-        self._activator_combo = self._normalize_combination(canonical)
+        self._activator_combo = canonical
 
         def _arm_cb() -> None:
             self._arm(timeout_ms)
 
         self.register_hotkey(canonical, _arm_cb)
         with self._lock:
-            self._suffix_seq_map = dict(seq_map)
+            self._suffix_root = _build_suffix_trie(seq_map)
+            self._suffix_node = self._suffix_root
             self._arm_timeout_ms = max(100, int(timeout_ms))
 
     def unregister_hotkey(self, combination: str) -> bool:
-        normalized = self._normalize_combination(combination)
+        normalized = _normalize_combination(combination)
         with self._lock:
             removed = self._hotkeys.pop(normalized, None)
+            if removed:
+                self._rebuild_dispatch_index()
         if removed:
             self._logger.info("Unregistered hotkey %s", combination)
             return True
         self._logger.debug("Attempted to remove unknown hotkey %s", combination)
         return False
 
+    def _rebuild_dispatch_index(self) -> None:
+        # Caller holds the lock.
+        by_key: Dict[_Key, List[_Binding]] = {}
+        unindexed: List[_Binding] = []
+        for binding in self._hotkeys.values():
+            if binding.keys is None:
+                unindexed.append(binding)
+                continue
+            for key in binding.keys:
+                by_key.setdefault(key, []).append(binding)
+        self._dispatch_index = (
+            {key: tuple(group) for key, group in by_key.items()},
+            tuple(unindexed),
+        )
+        self._combinations = tuple(
+            binding.combination for binding in self._hotkeys.values()
+        )
+
     def trigger(self, combination: str) -> bool:
         try:
             canonical = self.canonicalize(combination)
         except ValueError:
             return False
-        normalized = self._normalize_combination(canonical)
-        return self._execute_callback(normalized)
+        return self._execute_callback(canonical)
 
     def registered_combinations(self) -> Iterable[str]:
-        with self._lock:
-            return tuple(binding.combination for binding in self._hotkeys.values())
+        return self._combinations
 
     def _execute_callback(self, normalized: str) -> bool:
         with self._lock:
@@ -240,120 +359,113 @@ class HotkeyManager:
     def _on_press(
         self, key: keyboard.Key | keyboard.KeyCode
     ) -> None:  # pragma: no cover - integration path
-        self._dispatch("press", key)
+        dispatch = self._dispatch_state(key)
+        if dispatch is None:
+            return
+        bindings, canonical_key = dispatch
+        # Feed existing bindings first (activator will arm here on press)
+        for binding in bindings:
+            binding.hotkey.press(canonical_key)
+        if self._armed:
+            self._advance_chord(canonical_key)
 
     def _on_release(
         self, key: keyboard.Key | keyboard.KeyCode
     ) -> None:  # pragma: no cover - integration path
-        self._dispatch("release", key)
-
-    def _dispatch(self, action: str, key: keyboard.Key | keyboard.KeyCode) -> None:
-        with self._lock:
-            listener = self._listener
-            hotkeys = list(self._hotkeys.values())
-        if listener is None:
+        dispatch = self._dispatch_state(key)
+        if dispatch is None:
             return
+        bindings, canonical_key = dispatch
+        for binding in bindings:
+            binding.hotkey.release(canonical_key)
+
+    def _dispatch_state(
+        self, key: keyboard.Key | keyboard.KeyCode
+    ) -> Optional[Tuple[Tuple[_Binding, ...], keyboard.Key | keyboard.KeyCode]]:
+        """Bindings to feed and the listener-canonical ``key``, if running.
+
+        Returns ``None`` when nothing is registered: there is no HotKey to
+        feed, and chords can only be armed through the activator binding.
+        The bindings may be empty when no hotkey uses ``key``; an armed
+        chord still needs to see it.
+        """
+        # Single attribute reads are atomic; no lock on the per-key path.
+        listener = self._listener
+        by_key, unindexed = self._dispatch_index
+        if listener is None or not (by_key or unindexed):
+            return None
         canonical_key = listener.canonical(key)
-        # Feed existing bindings first (activator will arm here on press)
-        for binding in hotkeys:
-            getattr(binding.hotkey, action)(canonical_key)
-
-        # Handle chord suffix when ARMED on key press (sequential)
-        if action == "press" and self._armed:
-            # Ignore the very first key press after arming if it was the activator's own final key
-            if self._ignore_next:
-                self._ignore_next = False
-                return
-            token = self._key_to_token(canonical_key)
-            if token is None:
-                return
-            # Esc cancels arming
-            if token == "esc":
-                self._disarm()
-                return
-            self._buffer.append(token)
-            seq = tuple(self._buffer)
-            # Exact match?
-            callback = self._suffix_seq_map.get(seq)
-            if callback is not None:
-                self._disarm()
-                try:
-                    callback()
-                except Exception:
-                    self._logger.exception(
-                        "Chord sequence callback for %s raised", "+".join(seq)
-                    )
-                return
-            # Prefix of any sequence?
-            if any(s[: len(seq)] == seq for s in self._suffix_seq_map.keys()):
-                # Keep waiting for more keys within the same arming window
-                return
-            # No match and not a prefix -> disarm and clear buffer
+        bindings = by_key.get(canonical_key, ())
+        if unindexed:
+            bindings = bindings + unindexed
+        return bindings, canonical_key
+
+    def _advance_chord(self, canonical_key: keyboard.Key | keyboard.KeyCode) -> None:
+        """Handle a key press while ARMED (sequential chord suffix).
+
+        Keys that do not advance the trie are rejected right here on the
+        listener thread; only a completed sequence invokes its callback
+        (which is what posts work to the Qt main thread).
+        """
+        if _monotonic() >= self._arm_deadline:
             self._disarm()
+            return
+        # Ignore the very first key press after arming if it was the activator's own final key
+        if self._ignore_next:
+            self._ignore_next = False
+            return
+        token = self._key_to_token(canonical_key)
+        if token is None:
+            return
+        # Esc cancels arming
+        if token == "esc":
+            self._disarm()
+            return
+        node = self._suffix_node.children.get(token)
+        if node is None:
+            # No sequence continues with this key -> disarm
+            self._disarm()
+            return
+        # Exact match?
+        if node.callback is not None:
+            callback = node.callback
+            self._disarm()
+            try:
+                callback()
+            except Exception:
+                self._logger.exception(
+                    "Chord sequence callback for %s raised", node.sequence
+                )
+            return
+        # Prefix of a longer sequence: keep waiting for more keys
+        # within the same arming window
+        self._suffix_node = node
 
     def _arm(self, timeout_ms: int) -> None:
         with self._lock:
-            # Cancel previous timer
-            if self._arm_timer is not None:
-                self._arm_timer.cancel()
+            # Re-arming simply pushes the deadline out.
+            self._arm_deadline = _monotonic() + max(0.1, timeout_ms / 1000.0)
             self._armed = True
-            self._buffer.clear()
+            self._suffix_node = self._suffix_root
             self._ignore_next = True
-            self._arm_timer = threading.Timer(
-                max(0.1, timeout_ms / 1000.0), self._disarm
-            )
-            self._arm_timer.daemon = True
-            self._arm_timer.start()
             self._logger.debug("Activator armed for %d ms", timeout_ms)
 
     def _disarm(self) -> None:
         with self._lock:
-            if self._arm_timer is not None:
-                try:
-                    self._arm_timer.cancel()
-                except Exception:
-                    pass
-                self._arm_timer = None
             if self._armed:
                 self._logger.debug("Activator disarmed")
             self._armed = False
-            self._buffer.clear()
+            self._suffix_node = self._suffix_root
             self._ignore_next = False
 
-    def _key_to_token(self, key: keyboard.Key | keyboard.KeyCode) -> Optional[str]:
+    @staticmethod
+    def _key_to_token(key: keyboard.Key | keyboard.KeyCode) -> Optional[str]:
         # Map special keys first
-        specials = {
-            keyboard.Key.esc: "esc",
-            keyboard.Key.space: "space",
-            keyboard.Key.enter: "enter",
-            keyboard.Key.tab: "tab",
-            keyboard.Key.backspace: "backspace",
-            keyboard.Key.delete: "delete",
-            keyboard.Key.up: "up",
-            keyboard.Key.down: "down",
-            keyboard.Key.left: "left",
-            keyboard.Key.right: "right",
-            keyboard.Key.home: "home",
-            keyboard.Key.end: "end",
-            keyboard.Key.page_up: "pageup",
-            keyboard.Key.page_down: "pagedown",
-            keyboard.Key.f1: "f1",
-            keyboard.Key.f2: "f2",
-            keyboard.Key.f3: "f3",
-            keyboard.Key.f4: "f4",
-            keyboard.Key.f5: "f5",
-            keyboard.Key.f6: "f6",
-            keyboard.Key.f7: "f7",
-            keyboard.Key.f8: "f8",
-            keyboard.Key.f9: "f9",
-            keyboard.Key.f10: "f10",
-            keyboard.Key.f11: "f11",
-            keyboard.Key.f12: "f12",
-        }
-        if key in specials:
-            return specials[key]
+        token = _SPECIAL_KEY_TOKENS.get(key)
+        if token is not None:
+            return token
         if isinstance(key, keyboard.KeyCode) and key.char is not None:
             c = key.char.lower()
-            if len(c) == 1 and (c.isalnum() or c in "-=`[];,'./\\"):
+            if len(c) == 1 and (c.isalnum() or c in _PUNCTUATION_TOKENS):
                 return c
         return None
@@ -20,7 +20,7 @@ __all__ = [
 ]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OverlayConfig:
     """Configuration describing an overlay asset and its placement."""
 
@@ -32,7 +32,7 @@ class OverlayConfig:
     height: Optional[int] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Shortcut:
     """Representation of a triggerable shortcut."""
 
@@ -114,7 +114,7 @@ class Shortcut:
         return [s for s in shortcuts if s.fact_check]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ActivatorConfig:
     """Global activator configuration for chorded shortcuts."""
 
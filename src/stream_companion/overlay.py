@@ -8,16 +8,87 @@ auto-hides after a configurable duration.
 from __future__ import annotations
 
 import logging
+import math
+import stat
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, Tuple
-
-from PySide6.QtCore import QPoint, Qt, QTimer, QUrl
-from PySide6.QtGui import QMovie, QPixmap
+from typing import Optional, Set, Tuple
+
+from PySide6.QtCore import (
+    QObject,
+    QPoint,
+    QRunnable,
+    QSize,
+    Qt,
+    QThreadPool,
+    QTimer,
+    QUrl,
+    Signal,
+)
+from PySide6.QtGui import QImage, QImageReader, QMovie, QPixmap
 from PySide6.QtWidgets import QLabel, QWidget
-from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput, QVideoSink
+from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput, QVideoFrame, QVideoSink
 
 _LOGGER = logging.getLogger(__name__)
 
+# Decoded (and scaled) images and GIF movies kept for replays. Images are
+# bounded by their decoded size as well, since a handful of full-screen
+# overlays can outweigh dozens of small stingers. Movies get fewer slots
+# since each holds every decoded frame of an animation.
+_PIXMAP_CACHE_SIZE = 32
+_PIXMAP_CACHE_BYTES = 64 * 1024 * 1024
+_MOVIE_CACHE_SIZE = 8
+
+# (st_mtime_ns, st_size): part of every cache key so an edited file on disk
+# is loaded again instead of replaying a stale copy.
+_FileStamp = Tuple[int, int]
+_CacheKey = Tuple[str, Optional[Tuple[int, int]], _FileStamp]
+
+# Extensions rendered as animations or video; everything else is decoded as
+# a still image.
+_VIDEO_SUFFIXES = frozenset({".mp4", ".mov", ".avi", ".mkv", ".webm", ".m4v"})
+
+# Clock for the auto-hide deadline; a module attribute so tests can swap it
+# without patching the global ``time`` module.
+_monotonic = time.monotonic
+
+
+def _read_image(path: str, size: Optional[Tuple[int, int]]) -> QImage:
+    reader = QImageReader(path)
+    if size is not None:
+        # Decoding straight to the target size lets plugins that support
+        # it (e.g. JPEG) skip materializing the full-resolution image.
+        reader.setScaledSize(QSize(size[0], size[1]))
+    return reader.read()
+
+
+def _pixmap_bytes(pixmap: QPixmap) -> int:
+    return pixmap.width() * pixmap.height() * pixmap.depth() // 8
+
+
+class _DecodeSignals(QObject):
+    decoded = Signal(object, QImage)
+
+
+class _ImageDecodeJob(QRunnable):
+    """Decode one image off the GUI thread.
+
+    Only ``QImage`` is safe to build outside the GUI thread; the result is
+    handed back through ``signals.decoded`` and converted to a ``QPixmap``
+    there.
+    """
+
+    def __init__(self, key: _CacheKey, signals: _DecodeSignals) -> None:
+        super().__init__()
+        self._key = key
+        self._signals = signals
+
+    def run(self) -> None:
+        path, size, _ = self._key
+        self._signals.decoded.emit(self._key, _read_image(path, size))
+
 
 class OverlayWindow(QWidget):
     """Display PNG/GIF overlays in a frameless, transparent window.
@@ -39,7 +110,10 @@ class OverlayWindow(QWidget):
         self._auto_hide_ms = auto_hide_ms
         self._timer = QTimer(self)
         self._timer.setSingleShot(True)
-        self._timer.timeout.connect(self.hide)
+        self._timer.timeout.connect(self._on_auto_hide_timeout)
+        # Burst triggers only move the deadline; the running timer is
+        # re-armed for the remainder when it fires early.
+        self._hide_at = 0.0
 
         self._label = QLabel(self)
         self._label.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -49,8 +123,30 @@ class OverlayWindow(QWidget):
         self._video_audio: Optional[QAudioOutput] = None
         self._video_sink: Optional[QVideoSink] = None
         self._video_target_size: Optional[Tuple[int, int]] = None
+        # Latest frame not yet converted for the label; frames that arrive
+        # while one is pending replace it instead of each being converted.
+        # The sink delivers frames on its render thread, hence the lock.
+        self._pending_video_frame: Optional[QVideoFrame] = None
+        self._video_frame_lock = threading.Lock()
 
         self._movie: Optional[QMovie] = None
+        # Whether the label shows anything that hideEvent needs to clear.
+        self._has_content = False
+
+        # LRU caches, most recently used last.
+        self._pixmap_cache: OrderedDict[_CacheKey, QPixmap] = OrderedDict()
+        self._pixmap_cache_bytes = 0
+        self._movie_cache: OrderedDict[_CacheKey, QMovie] = OrderedDict()
+
+        # Background decodes started by preload(), keyed like the caches.
+        self._pending_decodes: Set[_CacheKey] = set()
+        self._decode_signals = _DecodeSignals(self)
+        self._decode_signals.decoded.connect(self._on_image_decoded)
+        # A show_asset() waiting on one of those decodes: (key, duration_ms,
+        # position). Only the latest request is kept.
+        self._deferred_show: Optional[
+            Tuple[_CacheKey, Optional[int], Optional[Tuple[int, int]]]
+        ] = None
 
         self._configure_window_flags()
 
@@ -75,34 +171,84 @@ class OverlayWindow(QWidget):
 
         Returns:
             ``True`` when the asset was successfully displayed, otherwise
-            ``False``.
+            ``False``. An image still being decoded by :meth:`preload` is
+            shown as soon as the decode finishes, and counts as displayed.
         """
 
+        self._deferred_show = None
         path = Path(asset_path)
-        if not path.exists() or not path.is_file():
+        try:
+            st = path.stat()
+        except OSError:
+            st = None
+        if st is None or not stat.S_ISREG(st.st_mode):
             _LOGGER.warning("Overlay asset missing or not a file: %s", path)
             return False
+        stamp = (st.st_mtime_ns, st.st_size)
 
         suffix = path.suffix.lower()
         is_gif = suffix == ".gif"
-        is_video = suffix in {".mp4", ".mov", ".avi", ".mkv", ".webm", ".m4v"}
+        is_video = suffix in _VIDEO_SUFFIXES
         if is_gif:
-            if not self._prepare_movie(path, size):
+            if not self._prepare_movie(path, size, stamp):
                 return False
         elif is_video:
             if not self._prepare_video(path, size):
                 return False
         else:
-            if not self._prepare_pixmap(path, size):
+            key = (path.as_posix(), size, stamp)
+            if key in self._pending_decodes and key not in self._pixmap_cache:
+                # Decoding again here would block the GUI thread for work
+                # the worker is about to hand back.
+                self._deferred_show = (key, duration_ms, position)
+                return True
+            if not self._prepare_pixmap(path, size, stamp):
                 return False
 
-        self._start_timer(duration_ms)
+        self._present(duration_ms, position)
+        return True
 
-        if position is not None:
-            self.move(QPoint(position[0], position[1]))
+    def preload(
+        self, asset_path: str, *, size: Optional[Tuple[int, int]] = None
+    ) -> bool:
+        """Warm the caches for an asset so its first show is fast.
 
-        self.show()
-        self.raise_()
+        Still images are decoded in the background and land in the pixmap
+        cache once the worker finishes; a ``show_asset`` call before then
+        simply decodes synchronously as usual. GIFs are opened right here
+        (``QMovie`` must live on the GUI thread), which only parses the
+        header and first frame. Videos are skipped.
+
+        Returns:
+            ``True`` when a decode was queued or a movie was opened.
+        """
+
+        path = Path(asset_path)
+        suffix = path.suffix.lower()
+        if suffix in _VIDEO_SUFFIXES:
+            return False
+        try:
+            st = path.stat()
+        except OSError:
+            return False
+        if not stat.S_ISREG(st.st_mode):
+            return False
+
+        stamp = (st.st_mtime_ns, st.st_size)
+        key = (path.as_posix(), size, stamp)
+        if suffix == ".gif":
+            if key in self._movie_cache:
+                return False
+            movie = self._open_movie(path, size, stamp)
+            if movie is None:
+                return False
+            # CacheAll keeps this frame, so playback starts without a decode.
+            movie.jumpToFrame(0)
+            return True
+        if key in self._pixmap_cache or key in self._pending_decodes:
+            return False
+        self._pending_decodes.add(key)
+        QThreadPool.globalInstance().start(_ImageDecodeJob(key, self._decode_signals))
         return True
 
     def is_animating(self) -> bool:
@@ -118,7 +264,9 @@ class OverlayWindow(QWidget):
     def hideEvent(self, event) -> None:  # type: ignore[override]
         self._stop_animation()
         self._stop_video()
-        self._label.clear()
+        if self._has_content:
+            self._label.clear()
+            self._has_content = False
         super().hideEvent(event)
 
     def closeEvent(self, event) -> None:  # type: ignore[override]
@@ -136,7 +284,10 @@ class OverlayWindow(QWidget):
         self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground, True)
 
     def _prepare_pixmap(
-        self, path: Path, size: Optional[Tuple[int, int]] = None
+        self,
+        path: Path,
+        size: Optional[Tuple[int, int]] = None,
+        stamp: Optional[_FileStamp] = None,
     ) -> bool:
         # Ensure window is translucent for images
         try:
@@ -147,27 +298,22 @@ class OverlayWindow(QWidget):
         # Ensure label paints with transparent bg
         self._label.setStyleSheet("background: transparent;")
 
-        pixmap = QPixmap(path.as_posix())
-        if pixmap.isNull():
+        pixmap = self._load_pixmap(path, size, stamp)
+        if pixmap is None:
             _LOGGER.warning("Overlay image failed to load: %s", path)
             return False
 
-        # Resize if size is specified
-        if size is not None:
-            pixmap = pixmap.scaled(
-                size[0],
-                size[1],
-                Qt.AspectRatioMode.IgnoreAspectRatio,
-                Qt.TransformationMode.SmoothTransformation,
-            )
-
         self._stop_animation()
         self._label.setPixmap(pixmap)
+        self._has_content = True
         self._resize_to_pixmap(pixmap)
         return True
 
     def _prepare_movie(
-        self, path: Path, size: Optional[Tuple[int, int]] = None
+        self,
+        path: Path,
+        size: Optional[Tuple[int, int]] = None,
+        stamp: Optional[_FileStamp] = None,
     ) -> bool:
         # Ensure window is translucent for animations (GIFs)
         try:
@@ -178,25 +324,28 @@ class OverlayWindow(QWidget):
         # Ensure label paints with transparent bg
         self._label.setStyleSheet("background: transparent;")
 
-        movie = QMovie(path.as_posix())
-        if not movie.isValid():
+        movie = self._open_movie(path, size, stamp)
+        if movie is None:
             _LOGGER.warning("Overlay animation invalid: %s", path)
             return False
 
-        # Set scaled size if specified
-        if size is not None:
-            from PySide6.QtCore import QSize
-
-            movie.setScaledSize(QSize(size[0], size[1]))
-
+        # stop() rewinds to frame 0, so a cached movie replays from the start.
         self._stop_animation()
-        movie.setCacheMode(QMovie.CacheMode.CacheAll)
         movie.start()
-        if movie.currentPixmap().isNull():
+        # Size the window from the frame geometry rather than converting the
+        # current frame to a QPixmap just to read its size.
+        frame_size = (
+            QSize(size[0], size[1]) if size is not None else movie.frameRect().size()
+        )
+        if frame_size.isEmpty():
             movie.jumpToFrame(0)
+            frame_size = movie.currentPixmap().size()
 
         self._label.setMovie(movie)
-        self._resize_to_pixmap(movie.currentPixmap())
+        self._has_content = True
+        if not frame_size.isEmpty():
+            self._label.resize(frame_size)
+            self.resize(frame_size)
         self._movie = movie
         return True
 
@@ -213,26 +362,7 @@ class OverlayWindow(QWidget):
             self._video_player.setVideoSink(self._video_sink)
 
             # Render frames into the QLabel to avoid GLX/OpenGL requirements
-            def _on_frame_changed(frame):  # type: ignore[no-redef]
-                try:
-                    image = frame.toImage()
-                    if image.isNull():
-                        return
-                    pixmap = QPixmap.fromImage(image)
-                    target = self._video_target_size
-                    if target is not None:
-                        pixmap = pixmap.scaled(
-                            target[0],
-                            target[1],
-                            Qt.AspectRatioMode.IgnoreAspectRatio,
-                            Qt.TransformationMode.SmoothTransformation,
-                        )
-                    self._label.setPixmap(pixmap)
-                    self._resize_to_pixmap(pixmap)
-                except Exception:  # noqa: BLE001 - best effort rendering
-                    pass
-
-            self._video_sink.videoFrameChanged.connect(_on_frame_changed)
+            self._video_sink.videoFrameChanged.connect(self._on_video_frame)
 
             # Auto-hide on end of media if no explicit timer is running
             def _on_status_changed(status):  # type: ignore[no-redef]
@@ -259,6 +389,8 @@ class OverlayWindow(QWidget):
 
         # Remember target size for scaling frames
         self._video_target_size = size if size is not None else (640, 360)
+        # Frames are rendered into the label as they arrive.
+        self._has_content = True
 
         # Set source and start playback
         try:
@@ -267,26 +399,183 @@ class OverlayWindow(QWidget):
             _LOGGER.warning("Overlay video failed to set source: %s (%s)", path, exc)
             return False
 
-        # Set initial window size before first frame arrives
-        self.resize(self._video_target_size[0], self._video_target_size[1])
+        # Size the window once; frames are scaled into the label at paint time
+        width, height = self._video_target_size
+        self._label.setScaledContents(True)
+        self._label.resize(width, height)
+        self.resize(width, height)
 
         self._video_player.play()  # type: ignore[union-attr]
         return True
 
+    def _on_video_frame(self, frame: QVideoFrame) -> None:
+        """Hand a sink frame to the GUI thread; may run on any thread."""
+        with self._video_frame_lock:
+            schedule = self._pending_video_frame is None
+            self._pending_video_frame = frame
+        if schedule:
+            # With a context object the call is queued to this widget's
+            # thread; a bare zero-timer created on the sink's render thread
+            # (which has no event loop) would never fire.
+            QTimer.singleShot(0, self, self._present_video_frame)
+
+    def _present_video_frame(self) -> None:
+        with self._video_frame_lock:
+            frame = self._pending_video_frame
+            self._pending_video_frame = None
+        # A frame queued before _stop_video ran must not repaint the label.
+        if frame is None or self._video_target_size is None:
+            return
+        try:
+            image = frame.toImage()
+            if image.isNull():
+                return
+            # The label is fixed at the target size and scales its contents
+            # when painting, so frames the compositor never shows are not
+            # resampled.
+            self._label.setPixmap(QPixmap.fromImage(image))
+        except Exception:  # noqa: BLE001 - best effort rendering
+            pass
+
+    def _load_pixmap(
+        self,
+        path: Path,
+        size: Optional[Tuple[int, int]],
+        stamp: Optional[_FileStamp],
+    ) -> Optional[QPixmap]:
+        """Decode (and scale to ``size``) an image, reusing earlier results."""
+        key = (path.as_posix(), size, stamp) if stamp is not None else None
+        cache = self._pixmap_cache
+        if key is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                cache.move_to_end(key)
+                return cached
+
+        if size is None:
+            pixmap = QPixmap(path.as_posix())
+        else:
+            pixmap = QPixmap.fromImage(_read_image(path.as_posix(), size))
+        if pixmap.isNull():
+            return None
+
+        if key is not None:
+            self._cache_pixmap(key, pixmap)
+        return pixmap
+
+    def _cache_pixmap(self, key: _CacheKey, pixmap: QPixmap) -> None:
+        cache = self._pixmap_cache
+        previous = cache.pop(key, None)
+        if previous is not None:
+            self._pixmap_cache_bytes -= _pixmap_bytes(previous)
+        cache[key] = pixmap
+        self._pixmap_cache_bytes += _pixmap_bytes(pixmap)
+        # The newest entry always stays, even if it alone exceeds the budget.
+        while len(cache) > 1 and (
+            len(cache) > _PIXMAP_CACHE_SIZE
+            or self._pixmap_cache_bytes > _PIXMAP_CACHE_BYTES
+        ):
+            _, evicted = cache.popitem(last=False)
+            self._pixmap_cache_bytes -= _pixmap_bytes(evicted)
+
+    def _on_image_decoded(self, key: _CacheKey, image: QImage) -> None:
+        self._pending_decodes.discard(key)
+        deferred = self._deferred_show
+        if deferred is not None and deferred[0] == key:
+            self._deferred_show = None
+        else:
+            deferred = None
+        if image.isNull():
+            if deferred is not None:
+                _LOGGER.warning("Overlay image failed to load: %s", key[0])
+            else:
+                _LOGGER.debug("Overlay preload failed to decode: %s", key[0])
+            return
+        # A show_asset() that raced the worker already cached its own copy.
+        if key not in self._pixmap_cache:
+            self._cache_pixmap(key, QPixmap.fromImage(image))
+        if deferred is not None:
+            path, size, stamp = key
+            if self._prepare_pixmap(Path(path), size, stamp):
+                self._present(deferred[1], deferred[2])
+
+    def _present(
+        self, duration_ms: Optional[int], position: Optional[Tuple[int, int]]
+    ) -> None:
+        self._start_timer(duration_ms)
+
+        if position is not None:
+            self.move(QPoint(position[0], position[1]))
+
+        self.show()
+        self.raise_()
+
+    def _open_movie(
+        self,
+        path: Path,
+        size: Optional[Tuple[int, int]],
+        stamp: Optional[_FileStamp],
+    ) -> Optional[QMovie]:
+        """Return a ready-to-start ``QMovie`` for ``path``, or ``None``.
+
+        Movies use ``CacheAll``, so once one has played through, every frame
+        stays decoded; keeping the movie per ``(path, size, stamp)`` lets
+        replays skip GIF decoding entirely.
+        """
+        key = (path.as_posix(), size, stamp) if stamp is not None else None
+        cache = self._movie_cache
+        if key is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                cache.move_to_end(key)
+                return cached
+
+        movie = QMovie(path.as_posix())
+        if not movie.isValid():
+            return None
+        if size is not None:
+            movie.setScaledSize(QSize(size[0], size[1]))
+        movie.setCacheMode(QMovie.CacheMode.CacheAll)
+
+        if key is not None:
+            movie.setParent(self)
+            cache[key] = movie
+            if len(cache) > _MOVIE_CACHE_SIZE:
+                # The evicted entry is least recently shown, never the
+                # movie currently on screen.
+                _, evicted = cache.popitem(last=False)
+                evicted.deleteLater()
+        return movie
+
     def _resize_to_pixmap(self, pixmap: QPixmap) -> None:
         if pixmap.isNull():
             return
         size = pixmap.size()
-        self._label.resize(size)
-        self.resize(size)
+        # Replays of the same asset keep the current geometry; a same-size
+        # resize() still goes through the platform window and dirties the
+        # opaque region.
+        if self._label.size() != size:
+            self._label.resize(size)
+        if self.size() != size:
+            self.resize(size)
 
     def _start_timer(self, duration_ms: Optional[int]) -> None:
         effective = self._auto_hide_ms if duration_ms is None else duration_ms
         if effective and effective > 0:
-            self._timer.start(effective)
+            self._hide_at = _monotonic() + effective / 1000.0
+            timer = self._timer
+            if not timer.isActive() or timer.remainingTime() > effective:
+                timer.start(effective)
         else:
             self._timer.stop()
 
+    def _on_auto_hide_timeout(self) -> None:
+        remaining = self._hide_at - _monotonic()
+        if remaining > 0:
+            self._timer.start(max(1, math.ceil(remaining * 1000)))
+        else:
+            self.hide()
+
     def _stop_animation(self) -> None:
         if self._movie:
             self._movie.stop()
@@ -294,12 +583,19 @@ class OverlayWindow(QWidget):
             self._movie = None
 
     def _stop_video(self) -> None:
+        # _prepare_video sets the target size; None means no video has been
+        # shown since the last stop, so there is nothing to undo.
+        if self._video_target_size is None:
+            return
         if self._video_player:
             try:
                 self._video_player.stop()
             except Exception:  # noqa: BLE001 - best effort cleanup
                 pass
         self._video_target_size = None
+        with self._video_frame_lock:
+            self._pending_video_frame = None
+        self._label.setScaledContents(False)
         # Restore translucent background attributes for image/GIF overlays
         try:
             self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, True)
@@ -3,22 +3,17 @@
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import Iterable, List, Optional, Tuple
 
-from .config_loader import ConfigError, load_config, load_full_config
+from .config_loader import ConfigError, clear_cache, load_full_config
 from .llm.config import LLMConfig
 from .models import ActivatorConfig, Shortcut, STTConfig
 
 _LOGGER = logging.getLogger(__name__)
 _ASSETS_DIR = Path(__file__).resolve().parents[2] / "assets"
 
-_CACHED_ACTIVATOR: Optional[ActivatorConfig] = None
-_CACHED_SHORTCUTS: Optional[list[Shortcut]] = None
-_CACHED_STT: Optional[STTConfig] = None
-_CACHED_LLM: Optional[LLMConfig] = None
-_FULL_CONFIG_LOADED: bool = False
-
 
 def default_shortcuts() -> List[Shortcut]:
     """Return the built-in shortcut list used for the Phase 1 MVP.
@@ -31,68 +26,43 @@ def default_shortcuts() -> List[Shortcut]:
     return []
 
 
-def _load_config_cached() -> tuple[Optional[ActivatorConfig], list[Shortcut]]:
-    global _CACHED_ACTIVATOR
-    global _CACHED_SHORTCUTS
-    if _CACHED_SHORTCUTS is not None:
-        return _CACHED_ACTIVATOR, _CACHED_SHORTCUTS
-    try:
-        activator, shortcuts = load_config()
-        _CACHED_ACTIVATOR = activator
-        _CACHED_SHORTCUTS = list(shortcuts)
-    except ConfigError as exc:
-        _LOGGER.warning("Falling back to built-in shortcuts: %s", exc)
-        _CACHED_ACTIVATOR = None
-        _CACHED_SHORTCUTS = list(default_shortcuts())
-    return _CACHED_ACTIVATOR, _CACHED_SHORTCUTS
-
-
-def _load_full_config_cached() -> tuple[
+# The whole config (success or fallback alike) is memoized once, so the
+# shortcut and STT/LLM getters always see the same load and a bad file
+# logs its fallback warning a single time. ``reload_config`` clears it.
+@lru_cache(maxsize=1)
+def _cached_full_config() -> Tuple[
     Optional[ActivatorConfig],
-    list[Shortcut],
+    Tuple[Shortcut, ...],
     Optional[STTConfig],
     Optional[LLMConfig],
 ]:
-    global _CACHED_ACTIVATOR
-    global _CACHED_SHORTCUTS
-    global _CACHED_STT
-    global _CACHED_LLM
-    global _FULL_CONFIG_LOADED
-    if _FULL_CONFIG_LOADED:
-        return _CACHED_ACTIVATOR, _CACHED_SHORTCUTS, _CACHED_STT, _CACHED_LLM
     try:
         activator, shortcuts, stt, llm = load_full_config()
-        _CACHED_ACTIVATOR = activator
-        _CACHED_SHORTCUTS = list(shortcuts)
-        _CACHED_STT = stt
-        _CACHED_LLM = llm
     except ConfigError as exc:
         _LOGGER.warning("Falling back to built-in shortcuts: %s", exc)
-        _CACHED_ACTIVATOR = None
-        _CACHED_SHORTCUTS = list(default_shortcuts())
-        _CACHED_STT = None
-        _CACHED_LLM = None
-    _FULL_CONFIG_LOADED = True
-    return _CACHED_ACTIVATOR, _CACHED_SHORTCUTS, _CACHED_STT, _CACHED_LLM
+        return None, tuple(default_shortcuts()), None, None
+    return activator, tuple(shortcuts), stt, llm
+
+
+def _cached_config() -> Tuple[Optional[ActivatorConfig], Tuple[Shortcut, ...]]:
+    activator, shortcuts, _stt, _llm = _cached_full_config()
+    return activator, shortcuts
 
 
 def get_activator() -> Optional[ActivatorConfig]:
     """Return the optional global activator configuration, if present."""
-    activator, _ = _load_config_cached()
-    return activator
+    return _cached_config()[0]
 
 
 def iter_shortcuts() -> Iterable[Shortcut]:
     """Convenience iterator over the configured shortcuts."""
-    _, shortcuts = _load_config_cached()
-    yield from shortcuts
+    return iter(_cached_config()[1])
 
 
 def get_stt_config() -> Optional[STTConfig]:
     """Return the speech-to-text configuration, if present."""
 
-    _, _, stt, _ = _load_full_config_cached()
-    return stt
+    return _cached_full_config()[2]
 
 
 def get_llm_config() -> Optional[LLMConfig]:
@@ -102,23 +72,14 @@ def get_llm_config() -> Optional[LLMConfig]:
     (i.e. schema < 1.5.0 or the user has not configured it).
     """
 
-    _, _, _, llm = _load_full_config_cached()
-    return llm
+    return _cached_full_config()[3]
 
 
 def reload_config() -> None:
     """Clear the config cache so the next call reloads from disk."""
 
-    global _CACHED_ACTIVATOR
-    global _CACHED_SHORTCUTS
-    global _CACHED_STT
-    global _CACHED_LLM
-    global _FULL_CONFIG_LOADED
-    _CACHED_ACTIVATOR = None
-    _CACHED_SHORTCUTS = None
-    _CACHED_STT = None
-    _CACHED_LLM = None
-    _FULL_CONFIG_LOADED = False
+    _cached_full_config.cache_clear()
+    clear_cache()
 
 
 def assets_dir() -> Path:
@@ -7,6 +7,8 @@ effects with `pygame.mixer`.
 from __future__ import annotations
 
 import logging
+import os
+import threading
 from pathlib import Path
 from typing import Dict, Optional
 
@@ -20,18 +22,29 @@ class SoundPlayer:
 
     The player preloads requested sound files and keeps them in memory for
     near-zero latency playback. It uses dependency injection friendly
-    factories to aid unit testing.
+    factories to aid unit testing. ``load`` may be called from several
+    threads at once; mixer initialization is serialized.
     """
 
     def __init__(
         self,
         mixer: Optional[pygame.mixer] = None,
         logger: Optional[Logger] = None,
+        *,
+        buffer: int = 512,
     ) -> None:
         self._mixer = mixer or pygame.mixer
+        self._buffer = buffer
         self._logger = logger or logging.getLogger(__name__)
         self._sounds: Dict[str, pygame.mixer.Sound] = {}
+        # Sounds are shared between ids that load the same file (by resolved
+        # path); a path's Sound is dropped when its last id is unloaded.
+        self._by_path: Dict[str, pygame.mixer.Sound] = {}
+        self._path_refs: Dict[str, int] = {}
+        self._id_paths: Dict[str, str] = {}
+        self._paths_lock = threading.Lock()
         self._initialized = False
+        self._init_lock = threading.Lock()
 
     def initialize(
         self,
@@ -39,19 +52,29 @@ class SoundPlayer:
         frequency: int = 44_100,
         size: int = -16,
         channels: int = 2,
-        buffer: int = 512,
+        buffer: Optional[int] = None,
     ) -> None:
-        """Initialize the mixer subsystem if it is not already running."""
+        """Initialize the mixer subsystem if it is not already running.
 
-        if self._initialized:
-            return
-        self._mixer.init(
-            frequency=frequency,
-            size=size,
-            channels=channels,
-            buffer=buffer,
-        )
-        self._initialized = True
+        ``buffer`` is the device buffer in samples and bounds the delay
+        between ``play`` and audible output: the default of 512 samples is
+        ~12 ms at 44.1 kHz. ``None`` uses the value given to the constructor.
+        Smaller buffers cut latency but underrun (crackle) more readily on
+        some audio stacks, so they are opt-in.
+        """
+
+        if buffer is None:
+            buffer = self._buffer
+        with self._init_lock:
+            if self._initialized:
+                return
+            self._mixer.init(
+                frequency=frequency,
+                size=size,
+                channels=channels,
+                buffer=buffer,
+            )
+            self._initialized = True
         self._logger.info(
             "Initialized audio mixer (freq=%s, size=%s, channels=%s, buffer=%s)",
             frequency,
@@ -68,6 +91,10 @@ class SoundPlayer:
         self.stop_all()
         self._mixer.quit()
         self._sounds.clear()
+        with self._paths_lock:
+            self._by_path.clear()
+            self._path_refs.clear()
+            self._id_paths.clear()
         self._initialized = False
         self._logger.info("Audio mixer shut down")
 
@@ -88,24 +115,39 @@ class SoundPlayer:
 
         self._ensure_initialized()
 
-        try:
-            sound = self._mixer.Sound(path.as_posix())
-        except Exception as exc:  # pragma: no cover - defensive logging
-            self._logger.exception(
-                "Failed to load sound: %s (%s)",
-                path,
-                type(exc).__name__,
-            )
-            return False
-
-        self._sounds[sound_id] = sound
+        key = os.path.realpath(path)
+        with self._paths_lock:
+            sound = self._by_path.get(key)
+        if sound is None:
+            try:
+                sound = self._mixer.Sound(path.as_posix())
+            except Exception as exc:  # pragma: no cover - defensive logging
+                self._logger.exception(
+                    "Failed to load sound: %s (%s)",
+                    path,
+                    type(exc).__name__,
+                )
+                return False
+        with self._paths_lock:
+            # Drop the id's previous reference first: releasing it after
+            # registering would free the entry just stored when the id is
+            # reloaded with the same file.
+            self._release_path(sound_id)
+            # Another thread may have decoded the same file meanwhile; keep
+            # the first Sound so every id shares one buffer.
+            sound = self._by_path.setdefault(key, sound)
+            self._id_paths[sound_id] = key
+            self._path_refs[key] = self._path_refs.get(key, 0) + 1
+            self._sounds[sound_id] = sound
         self._logger.info("Loaded sound '%s' from %s", sound_id, path)
         return True
 
     def unload(self, sound_id: str) -> bool:
         """Remove a previously loaded sound from memory."""
 
-        removed = self._sounds.pop(sound_id, None)
+        with self._paths_lock:
+            removed = self._sounds.pop(sound_id, None)
+            self._release_path(sound_id)
         if removed is None:
             self._logger.debug("Attempted to unload missing sound '%s'", sound_id)
             return False
@@ -142,6 +184,18 @@ class SoundPlayer:
 
         return dict(self._sounds)
 
+    def _release_path(self, sound_id: str) -> None:
+        # Caller holds ``_paths_lock``.
+        key = self._id_paths.pop(sound_id, None)
+        if key is None:
+            return
+        refs = self._path_refs[key] - 1
+        if refs:
+            self._path_refs[key] = refs
+        else:
+            del self._path_refs[key]
+            del self._by_path[key]
+
     def _ensure_initialized(self) -> None:
         if not self._initialized:
             self.initialize()
@@ -5,7 +5,7 @@ from __future__ import annotations
 import logging
 from typing import Callable, Optional
 
-from PySide6.QtGui import QAction, QIcon
+from PySide6.QtGui import QAction, QIcon, QPixmap
 from PySide6.QtWidgets import QApplication, QMenu, QSystemTrayIcon
 
 from .tray_indicators import (
@@ -66,6 +66,8 @@ class TrayIcon:
         self._stt_toggle_action: Optional[QAction] = None
         self._fact_check_action: Optional[QAction] = None
         self._base_icon: Optional[QIcon] = None
+        # Decoded once in show(); every indicator refresh paints on top of it.
+        self._base_pixmap: Optional[QPixmap] = None
         self._last_state_key: Optional[tuple] = None
         # Disable the dot menu entries until state is provided.
         self._stt_menu_hidden = False
@@ -155,6 +157,7 @@ class TrayIcon:
         from .tray_indicators import find_base_icon_pixmap, _fallback_base_pixmap
 
         base = find_base_icon_pixmap(64) or _fallback_base_pixmap(64)
+        self._base_pixmap = base
         self._base_icon = QIcon(base)
         if self._tray_icon is not None:
             self._tray_icon.setIcon(self._base_icon)
@@ -162,10 +165,7 @@ class TrayIcon:
     def _composed_icon(self, state: TrayIndicatorState) -> QIcon:
         """Compose the indicator-painted icon for the given state."""
 
-        from .tray_indicators import find_base_icon_pixmap
-
-        base = find_base_icon_pixmap(64)
-        return compose_tray_icon(state, size=64, base_pixmap=base)
+        return compose_tray_icon(state, size=64, base_pixmap=self._base_pixmap)
 
     def refresh_stt_label(self) -> None:
         """Update the STT menu label and the indicator icon to match state.
@@ -24,6 +24,7 @@ state changes that persist), which keeps them trivial to unit-test.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Tuple
 
@@ -157,6 +158,13 @@ def _candidate_icon_paths() -> list[Path]:
     ]
 
 
+@lru_cache(maxsize=1)
+def _existing_icon_paths() -> Tuple[Path, ...]:
+    """Candidate icon paths that exist, probed once per process."""
+
+    return tuple(path for path in _candidate_icon_paths() if path.is_file())
+
+
 def find_base_icon_pixmap(size: int = 64) -> Optional[QPixmap]:
     """Return the first existing icon as a square ``QPixmap`` of ``size``.
 
@@ -164,16 +172,15 @@ def find_base_icon_pixmap(size: int = 64) -> Optional[QPixmap]:
     fall back to a generated default (a colored square with a letter).
     """
 
-    for path in _candidate_icon_paths():
-        if path.is_file():
-            pix = QPixmap(str(path))
-            if not pix.isNull():
-                return pix.scaled(
-                    size,
-                    size,
-                    Qt.AspectRatioMode.IgnoreAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation,
-                )
+    for path in _existing_icon_paths():
+        pix = QPixmap(str(path))
+        if not pix.isNull():
+            return pix.scaled(
+                size,
+                size,
+                Qt.AspectRatioMode.IgnoreAspectRatio,
+                Qt.TransformationMode.SmoothTransformation,
+            )
     return None
 
 
@@ -1,8 +1,15 @@
 from __future__ import annotations
 
+import os
 import pathlib
 import sys
 
+# Must be set before the first QApplication is created; conftest is
+# imported ahead of every test module.
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest  # noqa: E402
+
 PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
 SRC_ROOT = PROJECT_ROOT / "src"
 
@@ -10,3 +17,17 @@ for path in (PROJECT_ROOT, SRC_ROOT):
     as_str = str(path)
     if as_str not in sys.path:
         sys.path.insert(0, as_str)
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """One QApplication shared by every test that needs Qt."""
+    from PySide6.QtWidgets import QApplication
+
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture(scope="session")
+def qt_app(qapp):
+    """Alias of ``qapp`` kept for the application and tray tests."""
+    return qapp
@@ -1,24 +1,19 @@
 from __future__ import annotations
 
 import logging
+import threading
 from typing import Dict, List, Optional
 
 import pytest
 from PySide6.QtCore import QCoreApplication
-from PySide6.QtWidgets import QApplication
 
 from stream_companion.application import Application
 from stream_companion.models import OverlayConfig, Shortcut
 
 
-@pytest.fixture(scope="module")
-def qt_app():
-    """Provide a QApplication instance for tests."""
-    app = QApplication.instance() or QApplication([])
-    yield app
-
-
 class FakeSoundPlayer:
+    __slots__ = ("succeed", "loaded", "played", "shutdown_called")
+
     def __init__(self, succeed: bool = True) -> None:
         self.succeed = succeed
         self.loaded: Dict[str, str] = {}
@@ -41,9 +36,16 @@ class FakeSoundPlayer:
 
 
 class FakeOverlayWindow:
+    __slots__ = ("succeed", "calls", "preloaded")
+
     def __init__(self, succeed: bool = True) -> None:
         self.succeed = succeed
         self.calls: List[OverlayConfig] = []
+        self.preloaded: List[tuple[str, Optional[tuple[int, int]]]] = []
+
+    def preload(self, file: str, *, size: Optional[tuple[int, int]] = None) -> bool:
+        self.preloaded.append((file, size))
+        return True
 
     def show_asset(
         self,
@@ -67,6 +69,8 @@ class FakeOverlayWindow:
 
 
 class FakeHotkeyManager:
+    __slots__ = ("callbacks", "started", "stopped")
+
     def __init__(self) -> None:
         self.callbacks: Dict[str, callable] = {}
         self.started = False
@@ -95,26 +99,39 @@ def shortcut() -> Shortcut:
     )
 
 
+@pytest.fixture()
+def make_app(shortcut: Shortcut, qt_app):
+    """Build ``(app, sound, overlay, hotkeys)`` for ``shortcut`` on fresh fakes."""
+
+    def _make(*, sound_succeeds: bool = True):
+        sound = FakeSoundPlayer(succeed=sound_succeeds)
+        overlay = FakeOverlayWindow()
+        hotkeys = FakeHotkeyManager()
+        app = Application(
+            [shortcut],
+            sound_player=sound,
+            overlay_window=overlay,
+            hotkey_manager=hotkeys,
+        )
+        return app, sound, overlay, hotkeys
+
+    return _make
+
+
 def test_application_registers_and_triggers_shortcut(
-    shortcut: Shortcut, qt_app
+    shortcut: Shortcut, make_app
 ) -> None:
-    sound = FakeSoundPlayer()
-    overlay = FakeOverlayWindow()
-    hotkeys = FakeHotkeyManager()
-
-    app = Application(
-        [shortcut], sound_player=sound, overlay_window=overlay, hotkey_manager=hotkeys
-    )
+    app, sound, overlay, hotkeys = make_app()
     app.start()
 
     assert sound.loaded  # sound preloaded
+    assert overlay.preloaded == [(shortcut.overlay.file, None)]  # type: ignore[union-attr]
     assert hotkeys.started is True
     assert shortcut.hotkey in hotkeys.callbacks
 
     hotkeys.callbacks[shortcut.hotkey]()
     # Process Qt events to handle the signal
     QCoreApplication.processEvents()
-    QCoreApplication.sendPostedEvents()
 
     assert sound.played == list(sound.loaded.keys())
     assert len(overlay.calls) == 1
@@ -126,15 +143,9 @@ def test_application_registers_and_triggers_shortcut(
 
 
 def test_application_handles_missing_sound_gracefully(
-    shortcut: Shortcut, qt_app, caplog: pytest.LogCaptureFixture
+    shortcut: Shortcut, make_app, caplog: pytest.LogCaptureFixture
 ) -> None:
-    sound = FakeSoundPlayer(succeed=False)
-    overlay = FakeOverlayWindow()
-    hotkeys = FakeHotkeyManager()
-
-    app = Application(
-        [shortcut], sound_player=sound, overlay_window=overlay, hotkey_manager=hotkeys
-    )
+    app, sound, overlay, hotkeys = make_app(sound_succeeds=False)
     with caplog.at_level(logging.WARNING):
         app.start()
 
@@ -142,7 +153,6 @@ def test_application_handles_missing_sound_gracefully(
     hotkeys.callbacks[shortcut.hotkey]()
     # Process Qt events to handle the signal
     QCoreApplication.processEvents()
-    QCoreApplication.sendPostedEvents()
 
     assert overlay.calls  # overlay still displayed
     assert "Failed to preload sound" in caplog.text
@@ -151,6 +161,68 @@ def test_application_handles_missing_sound_gracefully(
     app.stop()
 
 
+def test_application_hotkey_callback_from_listener_thread_runs_on_main_thread(
+    shortcut: Shortcut, make_app
+) -> None:
+    app, sound, overlay, hotkeys = make_app()
+    app.start()
+
+    listener = threading.Thread(target=hotkeys.callbacks[shortcut.hotkey])
+    listener.start()
+    listener.join()
+    assert not overlay.calls  # nothing runs on the listener thread
+
+    QCoreApplication.processEvents()
+
+    assert len(overlay.calls) == 1
+    assert sound.played == list(sound.loaded.keys())
+
+    app.stop()
+
+
+def test_application_assigns_unique_sound_ids_for_shared_stems(qt_app) -> None:
+    sound = FakeSoundPlayer()
+    shortcuts = [
+        Shortcut(hotkey=f"<ctrl>+<alt>+{i}", sound_path=f"/tmp/{folder}/clip.wav")
+        for i, folder in enumerate(("a", "b", "c"))
+    ]
+
+    app = Application(
+        shortcuts,
+        sound_player=sound,
+        overlay_window=FakeOverlayWindow(),
+        hotkey_manager=FakeHotkeyManager(),
+    )
+    app.start()
+
+    assert sorted(sound.loaded) == ["clip", "clip_2", "clip_3"]
+    assert sound.loaded["clip_3"] == "/tmp/c/clip.wav"
+
+    app.stop()
+
+
+def test_application_preloads_shared_sound_file_once(qt_app) -> None:
+    sound = FakeSoundPlayer()
+    first = Shortcut(hotkey="<ctrl>+<alt>+1", sound_path="/tmp/clip.wav")
+    second = Shortcut(hotkey="<ctrl>+<alt>+2", sound_path="/tmp/../tmp/clip.wav")
+    hotkeys = FakeHotkeyManager()
+
+    app = Application(
+        [first, second],
+        sound_player=sound,
+        overlay_window=FakeOverlayWindow(),
+        hotkey_manager=hotkeys,
+    )
+    app.start()
+
+    assert sound.loaded == {"clip": "/tmp/clip.wav"}
+    hotkeys.callbacks[second.hotkey]()
+    QCoreApplication.processEvents()
+    assert sound.played == ["clip"]
+
+    app.stop()
+
+
 # ---------------------------------------------------------------------------
 # Fact-checker wiring
 # ---------------------------------------------------------------------------
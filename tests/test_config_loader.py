@@ -11,6 +11,14 @@ from stream_companion.config_loader import (
     load_shortcuts,
     save_config,
 )
+from stream_companion.models import Shortcut
+
+
+# Config payloads shared by several tests, encoded once at import.
+_ONE_SHORTCUT = json.dumps({"shortcuts": [{"hotkey": "a"}]}).encode("utf-8")
+_LEGACY_SHORTCUT = json.dumps(
+    {"version": "1.0.0", "shortcuts": [{"hotkey": "a", "sound": "x.wav"}]}
+).encode("utf-8")
 
 
 def _write_schema(path: Path) -> None:
@@ -63,12 +71,18 @@ def _write_schema(path: Path) -> None:
     path.write_text(json.dumps(schema), encoding="utf-8")
 
 
-def test_load_shortcuts_reads_config(tmp_path: Path) -> None:
+@pytest.fixture(scope="session")
+def schema_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    # Written once per session; tests only read it.
+    path = tmp_path_factory.mktemp("schema") / "schema.json"
+    _write_schema(path)
+    return path
+
+
+def test_load_shortcuts_reads_config(tmp_path: Path, schema_path: Path) -> None:
     config_path = tmp_path / "shortcuts.json"
-    schema_path = tmp_path / "schema.json"
     sample_path = tmp_path / "shortcuts.sample.json"
 
-    _write_schema(schema_path)
     config = {
         "shortcuts": [
             {
@@ -98,12 +112,12 @@ def test_load_shortcuts_reads_config(tmp_path: Path) -> None:
     assert shortcut.overlay.duration_ms == 500
 
 
-def test_load_shortcuts_creates_file_from_sample(tmp_path: Path) -> None:
+def test_load_shortcuts_creates_file_from_sample(
+    tmp_path: Path, schema_path: Path
+) -> None:
     config_path = tmp_path / "shortcuts.json"
-    schema_path = tmp_path / "schema.json"
     sample_path = tmp_path / "shortcuts.sample.json"
 
-    _write_schema(schema_path)
     sample_path.write_text(
         json.dumps({"shortcuts": [{"hotkey": "a", "sound": "sound.wav"}]}),
         encoding="utf-8",
@@ -118,24 +132,20 @@ def test_load_shortcuts_creates_file_from_sample(tmp_path: Path) -> None:
     assert shortcuts[0].hotkey == "a"
 
 
-def test_load_shortcuts_invalid_json(tmp_path: Path) -> None:
+def test_load_shortcuts_invalid_json(tmp_path: Path, schema_path: Path) -> None:
     config_path = tmp_path / "shortcuts.json"
-    schema_path = tmp_path / "schema.json"
     sample_path = tmp_path / "shortcuts.sample.json"
 
-    _write_schema(schema_path)
     config_path.write_text("{not valid json}", encoding="utf-8")
 
     with pytest.raises(ConfigError):
         load_shortcuts(config_path, schema_path=schema_path, sample_path=sample_path)
 
 
-def test_load_shortcuts_validation_failure(tmp_path: Path) -> None:
+def test_load_shortcuts_validation_failure(tmp_path: Path, schema_path: Path) -> None:
     config_path = tmp_path / "shortcuts.json"
-    schema_path = tmp_path / "schema.json"
     sample_path = tmp_path / "shortcuts.sample.json"
 
-    _write_schema(schema_path)
     config_path.write_text(
         json.dumps({"shortcuts": [{"sound": "missing"}]}), encoding="utf-8"
     )
@@ -144,6 +154,95 @@ def test_load_shortcuts_validation_failure(tmp_path: Path) -> None:
         load_shortcuts(config_path, schema_path=schema_path, sample_path=sample_path)
 
 
+def test_load_shortcuts_reuses_cache_until_file_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, schema_path: Path
+) -> None:
+    config_path = tmp_path / "shortcuts.json"
+    sample_path = tmp_path / "shortcuts.sample.json"
+
+    config_path.write_bytes(_ONE_SHORTCUT)
+    first = load_shortcuts(
+        config_path, schema_path=schema_path, sample_path=sample_path
+    )
+
+    def _fail_read(*args, **kwargs):
+        raise AssertionError("cached config should not be re-read")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(Path, "read_bytes", _fail_read)
+        second = load_shortcuts(
+            config_path, schema_path=schema_path, sample_path=sample_path
+        )
+    assert second == first
+    assert second is not first
+
+    config_path.write_text(
+        json.dumps({"shortcuts": [{"hotkey": "a"}, {"hotkey": "bb"}]}),
+        encoding="utf-8",
+    )
+    third = load_shortcuts(
+        config_path, schema_path=schema_path, sample_path=sample_path
+    )
+    assert [s.hotkey for s in third] == ["a", "bb"]
+
+
+def test_save_config_refreshes_cached_config(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, schema_path: Path
+) -> None:
+    config_path = tmp_path / "shortcuts.json"
+    sample_path = tmp_path / "shortcuts.sample.json"
+
+    config_path.write_bytes(_ONE_SHORTCUT)
+    shortcuts = load_shortcuts(
+        config_path, schema_path=schema_path, sample_path=sample_path
+    )
+
+    save_config(
+        None,
+        shortcuts + [Shortcut(hotkey="b")],
+        config_path=config_path,
+        schema_path=schema_path,
+    )
+
+    def _fail_read(*args, **kwargs):
+        raise AssertionError("freshly saved config should not be re-read")
+
+    monkeypatch.setattr(Path, "read_bytes", _fail_read)
+    reloaded = load_shortcuts(
+        config_path, schema_path=schema_path, sample_path=sample_path
+    )
+    assert [s.hotkey for s in reloaded] == ["a", "b"]
+
+
+def test_save_config_skips_revalidating_identical_payload(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, schema_path: Path
+) -> None:
+    from stream_companion import config_loader
+
+    config_path = tmp_path / "shortcuts.json"
+    shortcuts = [Shortcut(hotkey="a")]
+
+    save_config(None, shortcuts, config_path=config_path, schema_path=schema_path)
+
+    calls = []
+    original = config_loader._raise_for_errors
+    monkeypatch.setattr(
+        config_loader,
+        "_raise_for_errors",
+        lambda validator, data: calls.append(data) or original(validator, data),
+    )
+    save_config(None, shortcuts, config_path=config_path, schema_path=schema_path)
+    assert calls == []
+
+    save_config(
+        None,
+        shortcuts + [Shortcut(hotkey="b")],
+        config_path=config_path,
+        schema_path=schema_path,
+    )
+    assert len(calls) == 1
+
+
 # ---------------------------------------------------------------------------
 # STT configuration
 # ---------------------------------------------------------------------------
@@ -195,12 +294,17 @@ def _write_full_schema(path: Path) -> None:
     path.write_text(json.dumps(schema), encoding="utf-8")
 
 
-def test_stt_config_round_trip(tmp_path: Path) -> None:
+@pytest.fixture(scope="session")
+def full_schema_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    path = tmp_path_factory.mktemp("schema") / "schema.json"
+    _write_full_schema(path)
+    return path
+
+
+def test_stt_config_round_trip(tmp_path: Path, full_schema_path: Path) -> None:
     config_path = tmp_path / "shortcuts.json"
-    schema_path = tmp_path / "schema.json"
     sample_path = tmp_path / "shortcuts.sample.json"
 
-    _write_full_schema(schema_path)
     config_path.write_text(
         json.dumps(
             {
@@ -227,7 +331,7 @@ def test_stt_config_round_trip(tmp_path: Path) -> None:
     )
 
     _, shortcuts, stt, _ = load_full_config(
-        config_path, schema_path=schema_path, sample_path=sample_path
+        config_path, schema_path=full_schema_path, sample_path=sample_path
     )
     assert len(shortcuts) == 1
     assert stt is not None
@@ -241,36 +345,32 @@ def test_stt_config_round_trip(tmp_path: Path) -> None:
 
     # Save and reload
     save_config(
-        None, shortcuts, config_path=config_path, schema_path=schema_path, stt=stt
+        None, shortcuts, config_path=config_path, schema_path=full_schema_path, stt=stt
     )
     _, _, stt2, _ = load_full_config(
-        config_path, schema_path=schema_path, sample_path=sample_path
+        config_path, schema_path=full_schema_path, sample_path=sample_path
     )
     assert stt2 == stt
 
 
-def test_stt_omitted_returns_none(tmp_path: Path) -> None:
+def test_stt_omitted_returns_none(tmp_path: Path, full_schema_path: Path) -> None:
     config_path = tmp_path / "shortcuts.json"
-    schema_path = tmp_path / "schema.json"
     sample_path = tmp_path / "shortcuts.sample.json"
 
-    _write_full_schema(schema_path)
-    config_path.write_text(
-        json.dumps({"shortcuts": [{"hotkey": "a"}]}), encoding="utf-8"
-    )
+    config_path.write_bytes(_ONE_SHORTCUT)
 
     _, _, stt, _ = load_full_config(
-        config_path, schema_path=schema_path, sample_path=sample_path
+        config_path, schema_path=full_schema_path, sample_path=sample_path
     )
     assert stt is None
 
 
-def test_stt_save_without_stt_preserves_existing(tmp_path: Path) -> None:
+def test_stt_save_without_stt_preserves_existing(
+    tmp_path: Path, full_schema_path: Path
+) -> None:
     config_path = tmp_path / "shortcuts.json"
-    schema_path = tmp_path / "schema.json"
     sample_path = tmp_path / "shortcuts.sample.json"
 
-    _write_full_schema(schema_path)
     # Pre-seed config with an stt block
     config_path.write_text(
         json.dumps(
@@ -288,9 +388,9 @@ def test_stt_save_without_stt_preserves_existing(tmp_path: Path) -> None:
     )
 
     # Save without stt -> existing stt block should be preserved
-    save_config(None, [], config_path=config_path, schema_path=schema_path)
+    save_config(None, [], config_path=config_path, schema_path=full_schema_path)
     _, _, stt, _ = load_full_config(
-        config_path, schema_path=schema_path, sample_path=sample_path
+        config_path, schema_path=full_schema_path, sample_path=sample_path
     )
     assert stt is not None
     assert stt.always_on is True
@@ -298,12 +398,10 @@ def test_stt_save_without_stt_preserves_existing(tmp_path: Path) -> None:
 
 
 def test_trigger_word_round_trip(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, schema_path: Path
 ) -> None:
     """A trigger_word declared on a shortcut should survive a save/load cycle."""
 
-    schema_path = tmp_path / "schema.json"
-    _write_schema(schema_path)
     config_path = tmp_path / "shortcuts.json"
     config_path.write_text(
         json.dumps(
@@ -344,19 +442,12 @@ def test_trigger_word_round_trip(
 
 
 def test_trigger_word_omitted_is_none(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, schema_path: Path
 ) -> None:
     """A shortcut without trigger_word should have None, not a default empty string."""
 
-    schema_path = tmp_path / "schema.json"
-    _write_schema(schema_path)
     config_path = tmp_path / "shortcuts.json"
-    config_path.write_text(
-        json.dumps(
-            {"version": "1.0.0", "shortcuts": [{"hotkey": "a", "sound": "x.wav"}]}
-        ),
-        encoding="utf-8",
-    )
+    config_path.write_bytes(_LEGACY_SHORTCUT)
 
     from stream_companion import config_loader
 
@@ -372,12 +463,10 @@ def test_trigger_word_omitted_is_none(
 
 
 def test_trigger_phrases_round_trip(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, schema_path: Path
 ) -> None:
     """Multi-word trigger phrases should survive a save/load cycle."""
 
-    schema_path = tmp_path / "schema.json"
-    _write_schema(schema_path)
     config_path = tmp_path / "shortcuts.json"
     config_path.write_text(
         json.dumps(
@@ -423,19 +512,12 @@ def test_trigger_phrases_round_trip(
 
 
 def test_trigger_phrases_omitted_is_none(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, schema_path: Path
 ) -> None:
     """A shortcut without trigger_phrases should have None, not []."""
 
-    schema_path = tmp_path / "schema.json"
-    _write_schema(schema_path)
     config_path = tmp_path / "shortcuts.json"
-    config_path.write_text(
-        json.dumps(
-            {"version": "1.0.0", "shortcuts": [{"hotkey": "a", "sound": "x.wav"}]}
-        ),
-        encoding="utf-8",
-    )
+    config_path.write_bytes(_LEGACY_SHORTCUT)
 
     from stream_companion import config_loader
 
@@ -451,12 +533,10 @@ def test_trigger_phrases_omitted_is_none(
 
 
 def test_trigger_phrases_accepts_single_string(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, schema_path: Path
 ) -> None:
     """For convenience, a single string is coerced to a 1-element list."""
 
-    schema_path = tmp_path / "schema.json"
-    _write_schema(schema_path)
     config_path = tmp_path / "shortcuts.json"
     config_path.write_text(
         json.dumps(
@@ -536,12 +616,17 @@ def _write_schema_with_llm(path: Path) -> None:
     path.write_text(json.dumps(schema), encoding="utf-8")
 
 
-def test_llm_config_round_trip(tmp_path: Path) -> None:
+@pytest.fixture(scope="session")
+def llm_schema_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    path = tmp_path_factory.mktemp("schema") / "schema.json"
+    _write_schema_with_llm(path)
+    return path
+
+
+def test_llm_config_round_trip(tmp_path: Path, llm_schema_path: Path) -> None:
     config_path = tmp_path / "shortcuts.json"
-    schema_path = tmp_path / "schema.json"
     sample_path = tmp_path / "shortcuts.sample.json"
 
-    _write_schema_with_llm(schema_path)
     config_path.write_text(
         json.dumps(
             {
@@ -568,7 +653,7 @@ def test_llm_config_round_trip(tmp_path: Path) -> None:
     from stream_companion.llm.config import LLMConfig
 
     _, _, _, llm = load_full_config(
-        config_path, schema_path=schema_path, sample_path=sample_path
+        config_path, schema_path=llm_schema_path, sample_path=sample_path
     )
     assert llm is not None
     assert llm == LLMConfig(
@@ -591,37 +676,33 @@ def test_llm_config_round_trip(tmp_path: Path) -> None:
         None,
         [],
         config_path=config_path,
-        schema_path=schema_path,
+        schema_path=llm_schema_path,
         llm=llm,
     )
     _, _, _, llm2 = load_full_config(
-        config_path, schema_path=schema_path, sample_path=sample_path
+        config_path, schema_path=llm_schema_path, sample_path=sample_path
     )
     assert llm2 == llm
 
 
-def test_llm_omitted_returns_none(tmp_path: Path) -> None:
+def test_llm_omitted_returns_none(tmp_path: Path, llm_schema_path: Path) -> None:
     config_path = tmp_path / "shortcuts.json"
-    schema_path = tmp_path / "schema.json"
     sample_path = tmp_path / "shortcuts.sample.json"
 
-    _write_schema_with_llm(schema_path)
-    config_path.write_text(
-        json.dumps({"shortcuts": [{"hotkey": "a"}]}), encoding="utf-8"
-    )
+    config_path.write_bytes(_ONE_SHORTCUT)
 
     _, _, _, llm = load_full_config(
-        config_path, schema_path=schema_path, sample_path=sample_path
+        config_path, schema_path=llm_schema_path, sample_path=sample_path
     )
     assert llm is None
 
 
-def test_llm_save_without_llm_preserves_existing(tmp_path: Path) -> None:
+def test_llm_save_without_llm_preserves_existing(
+    tmp_path: Path, llm_schema_path: Path
+) -> None:
     config_path = tmp_path / "shortcuts.json"
-    schema_path = tmp_path / "schema.json"
     sample_path = tmp_path / "shortcuts.sample.json"
 
-    _write_schema_with_llm(schema_path)
     config_path.write_text(
         json.dumps(
             {
@@ -638,21 +719,19 @@ def test_llm_save_without_llm_preserves_existing(tmp_path: Path) -> None:
     )
 
     # Save without llm -> existing llm block must be preserved.
-    save_config(None, [], config_path=config_path, schema_path=schema_path)
+    save_config(None, [], config_path=config_path, schema_path=llm_schema_path)
     _, _, _, llm = load_full_config(
-        config_path, schema_path=schema_path, sample_path=sample_path
+        config_path, schema_path=llm_schema_path, sample_path=sample_path
     )
     assert llm is not None
     assert llm.base_url == "https://api.deepseek.com/v1"
     assert llm.model == "deepseek-chat"
 
 
-def test_fact_check_shortcut_round_trip(tmp_path: Path) -> None:
+def test_fact_check_shortcut_round_trip(tmp_path: Path, llm_schema_path: Path) -> None:
     config_path = tmp_path / "shortcuts.json"
-    schema_path = tmp_path / "schema.json"
     sample_path = tmp_path / "shortcuts.sample.json"
 
-    _write_schema_with_llm(schema_path)
     config_path.write_text(
         json.dumps(
             {
@@ -666,17 +745,156 @@ def test_fact_check_shortcut_round_trip(tmp_path: Path) -> None:
     )
 
     _, shortcuts, _, _ = load_full_config(
-        config_path, schema_path=schema_path, sample_path=sample_path
+        config_path, schema_path=llm_schema_path, sample_path=sample_path
     )
     assert shortcuts[0].fact_check is False
     assert shortcuts[1].fact_check is True
 
 
-def test_save_config_writes_version_1_5_0(tmp_path: Path) -> None:
+def test_save_config_writes_version_1_5_0(
+    tmp_path: Path, llm_schema_path: Path
+) -> None:
     config_path = tmp_path / "shortcuts.json"
-    schema_path = tmp_path / "schema.json"
 
-    _write_schema_with_llm(schema_path)
-    save_config(None, [], config_path=config_path, schema_path=schema_path)
+    save_config(None, [], config_path=config_path, schema_path=llm_schema_path)
     data = json.loads(config_path.read_text(encoding="utf-8"))
     assert data["version"] == "1.5.0"
+
+
+def test_save_config_output_matches_stdlib_json(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, schema_path: Path
+) -> None:
+    pytest.importorskip("orjson")
+    from stream_companion import config_loader
+
+    shortcuts = [
+        Shortcut(hotkey="a", sound_path="assets/a.wav", trigger_phrases=("go",)),
+        # Non-ASCII text must be written as raw UTF-8 by both encoders.
+        Shortcut(hotkey="b", trigger_phrases=("café", "¡vamos!")),
+    ]
+
+    fast_path = tmp_path / "fast.json"
+    save_config(None, shortcuts, config_path=fast_path, schema_path=schema_path)
+
+    monkeypatch.setattr(config_loader, "orjson", None)
+    stdlib_path = tmp_path / "stdlib.json"
+    save_config(None, shortcuts, config_path=stdlib_path, schema_path=schema_path)
+
+    assert fast_path.read_bytes() == stdlib_path.read_bytes()
+    config_loader.clear_cache()
+    reloaded = load_shortcuts(
+        stdlib_path, schema_path=schema_path, sample_path=tmp_path / "x.json"
+    )
+    assert reloaded == shortcuts
+
+
+def test_save_config_failed_replace_keeps_previous_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, schema_path: Path
+) -> None:
+    from stream_companion import config_loader
+
+    config_path = tmp_path / "shortcuts.json"
+    save_config(
+        None, [Shortcut(hotkey="a")], config_path=config_path, schema_path=schema_path
+    )
+    before = config_path.read_bytes()
+
+    def _fail_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(config_loader.os, "replace", _fail_replace)
+    with pytest.raises(OSError):
+        save_config(
+            None,
+            [Shortcut(hotkey="b")],
+            config_path=config_path,
+            schema_path=schema_path,
+        )
+
+    assert config_path.read_bytes() == before
+    assert list(tmp_path.glob("*.tmp")) == []
+
+
+def test_save_config_writes_through_a_symlink(
+    tmp_path: Path, schema_path: Path
+) -> None:
+    real_path = tmp_path / "real" / "shortcuts.json"
+    real_path.parent.mkdir()
+    real_path.write_text("{}", encoding="utf-8")
+    link_path = tmp_path / "shortcuts.json"
+    link_path.symlink_to(real_path)
+
+    save_config(
+        None, [Shortcut(hotkey="a")], config_path=link_path, schema_path=schema_path
+    )
+
+    assert link_path.is_symlink()
+    assert (
+        json.loads(real_path.read_text(encoding="utf-8"))["shortcuts"][0]["hotkey"]
+        == "a"
+    )
+
+
+def test_save_config_keeps_existing_file_mode(
+    tmp_path: Path, schema_path: Path
+) -> None:
+    config_path = tmp_path / "shortcuts.json"
+    config_path.write_text("{}", encoding="utf-8")
+    config_path.chmod(0o640)
+
+    save_config(
+        None, [Shortcut(hotkey="a")], config_path=config_path, schema_path=schema_path
+    )
+
+    assert config_path.stat().st_mode & 0o777 == 0o640
+
+
+def test_schema_refs_are_inlined_before_validation(tmp_path: Path) -> None:
+    schema_path = tmp_path / "schema.json"
+    schema_path.write_text(
+        json.dumps(
+            {
+                "$schema": "http://json-schema.org/draft-07/schema#",
+                "type": "object",
+                "properties": {
+                    "shortcuts": {
+                        "type": "array",
+                        "items": {"$ref": "#/definitions/shortcut"},
+                    }
+                },
+                "definitions": {
+                    "shortcut": {
+                        "type": "object",
+                        "required": ["hotkey"],
+                        "properties": {"hotkey": {"type": "string"}},
+                    }
+                },
+            }
+        ),
+        encoding="utf-8",
+    )
+    config_path = tmp_path / "shortcuts.json"
+
+    save_config(
+        None, [Shortcut(hotkey="a")], config_path=config_path, schema_path=schema_path
+    )
+    with pytest.raises(ConfigError):
+        save_config(
+            None,
+            [Shortcut(suffix=("a",))],
+            config_path=config_path,
+            schema_path=schema_path,
+        )
+
+
+def test_identical_schema_files_share_one_validator(
+    tmp_path: Path, schema_path: Path
+) -> None:
+    from stream_companion import config_loader
+
+    copy_path = tmp_path / "schema.json"
+    copy_path.write_bytes(schema_path.read_bytes())
+
+    _, first = config_loader._load_validator(schema_path)
+    _, second = config_loader._load_validator(copy_path)
+    assert second is first
@@ -20,10 +20,10 @@ def temp_config_dir(tmp_path: Path) -> Path:
     return config_dir
 
 
-@pytest.fixture
-def temp_schema(temp_config_dir: Path) -> Path:
-    """Create a temporary schema file."""
-    schema_path = temp_config_dir / "schema.json"
+@pytest.fixture(scope="session")
+def temp_schema(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a temporary schema file, shared by every test."""
+    schema_path = tmp_path_factory.mktemp("config") / "schema.json"
     schema = {
         "$schema": "http://json-schema.org/draft-07/schema#",
         "title": "Streaming Companion Shortcuts",
@@ -62,112 +62,92 @@ def temp_schema(temp_config_dir: Path) -> Path:
     return schema_path
 
 
-def test_save_shortcuts_empty_list(temp_config_dir: Path, temp_schema: Path) -> None:
-    """Test saving an empty shortcuts list."""
-    config_path = temp_config_dir / "shortcuts.json"
-    shortcuts: List[Shortcut] = []
-
-    save_shortcuts(shortcuts, config_path, schema_path=temp_schema)
-
-    assert config_path.exists()
-    data = json.loads(config_path.read_text())
-    assert data["version"] == "1.5.0"
-    assert data["shortcuts"] == []
-
-
-def test_save_shortcuts_single_shortcut(
-    temp_config_dir: Path, temp_schema: Path
-) -> None:
-    """Test saving a single shortcut."""
-    config_path = temp_config_dir / "shortcuts.json"
-    shortcuts = [
-        Shortcut(
-            hotkey="<ctrl>+<alt>+1",
-            sound_path="assets/sounds/test.wav",
-            overlay=OverlayConfig(
-                file="assets/overlays/test.gif",
-                x=100,
-                y=200,
-                duration_ms=2000,
-            ),
-        )
-    ]
-
-    save_shortcuts(shortcuts, config_path, schema_path=temp_schema)
-
-    assert config_path.exists()
-    data = json.loads(config_path.read_text())
-    assert len(data["shortcuts"]) == 1
-    assert data["shortcuts"][0]["hotkey"] == "<ctrl>+<alt>+1"
-    assert data["shortcuts"][0]["sound"] == "assets/sounds/test.wav"
-    assert data["shortcuts"][0]["overlay"]["file"] == "assets/overlays/test.gif"
-    assert data["shortcuts"][0]["overlay"]["x"] == 100
-    assert data["shortcuts"][0]["overlay"]["y"] == 200
-    assert data["shortcuts"][0]["overlay"]["duration"] == 2000
-
-
-def test_save_shortcuts_without_optional_fields(
-    temp_config_dir: Path, temp_schema: Path
-) -> None:
-    """Test saving shortcuts without sound or overlay."""
-    config_path = temp_config_dir / "shortcuts.json"
-    shortcuts = [
-        Shortcut(hotkey="<ctrl>+<alt>+1"),
-        Shortcut(hotkey="<ctrl>+<alt>+2", sound_path="assets/sounds/test.wav"),
-        Shortcut(
-            hotkey="<ctrl>+<alt>+3",
-            overlay=OverlayConfig(file="assets/overlays/test.gif"),
+@pytest.mark.parametrize(
+    ("shortcuts", "expected"),
+    [
+        pytest.param([], [], id="empty-list"),
+        pytest.param(
+            [
+                Shortcut(
+                    hotkey="<ctrl>+<alt>+1",
+                    sound_path="assets/sounds/test.wav",
+                    overlay=OverlayConfig(
+                        file="assets/overlays/test.gif",
+                        x=100,
+                        y=200,
+                        duration_ms=2000,
+                    ),
+                )
+            ],
+            [
+                {
+                    "hotkey": "<ctrl>+<alt>+1",
+                    "sound": "assets/sounds/test.wav",
+                    "overlay": {
+                        "file": "assets/overlays/test.gif",
+                        "x": 100,
+                        "y": 200,
+                        "duration": 2000,
+                    },
+                }
+            ],
+            id="single-shortcut",
         ),
-    ]
-
-    save_shortcuts(shortcuts, config_path, schema_path=temp_schema)
-
-    assert config_path.exists()
-    data = json.loads(config_path.read_text())
-    assert len(data["shortcuts"]) == 3
-
-    # First shortcut has only hotkey
-    assert data["shortcuts"][0]["hotkey"] == "<ctrl>+<alt>+1"
-    assert "sound" not in data["shortcuts"][0]
-    assert "overlay" not in data["shortcuts"][0]
-
-    # Second shortcut has sound but no overlay
-    assert data["shortcuts"][1]["hotkey"] == "<ctrl>+<alt>+2"
-    assert data["shortcuts"][1]["sound"] == "assets/sounds/test.wav"
-    assert "overlay" not in data["shortcuts"][1]
-
-    # Third shortcut has overlay but no sound
-    assert data["shortcuts"][2]["hotkey"] == "<ctrl>+<alt>+3"
-    assert "sound" not in data["shortcuts"][2]
-    assert data["shortcuts"][2]["overlay"]["file"] == "assets/overlays/test.gif"
-
-
-def test_save_shortcuts_multiple(temp_config_dir: Path, temp_schema: Path) -> None:
-    """Test saving multiple shortcuts."""
-    config_path = temp_config_dir / "shortcuts.json"
-    shortcuts = [
-        Shortcut(
-            hotkey="<ctrl>+<alt>+1",
-            sound_path="assets/sounds/test1.wav",
-        ),
-        Shortcut(
-            hotkey="<ctrl>+<alt>+2",
-            sound_path="assets/sounds/test2.wav",
+        pytest.param(
+            [
+                Shortcut(hotkey="<ctrl>+<alt>+1"),
+                Shortcut(hotkey="<ctrl>+<alt>+2", sound_path="assets/sounds/test.wav"),
+                Shortcut(
+                    hotkey="<ctrl>+<alt>+3",
+                    overlay=OverlayConfig(file="assets/overlays/test.gif"),
+                ),
+            ],
+            [
+                # Unset sound/overlay are omitted rather than written as null.
+                {"hotkey": "<ctrl>+<alt>+1"},
+                {"hotkey": "<ctrl>+<alt>+2", "sound": "assets/sounds/test.wav"},
+                {
+                    "hotkey": "<ctrl>+<alt>+3",
+                    "overlay": {
+                        "file": "assets/overlays/test.gif",
+                        "x": 0,
+                        "y": 0,
+                        "duration": 1500,
+                    },
+                },
+            ],
+            id="without-optional-fields",
         ),
-        Shortcut(
-            hotkey="<ctrl>+<alt>+3",
-            sound_path="assets/sounds/test3.wav",
+        pytest.param(
+            [
+                Shortcut(
+                    hotkey=f"<ctrl>+<alt>+{n}", sound_path=f"assets/sounds/test{n}.wav"
+                )
+                for n in (1, 2, 3)
+            ],
+            [
+                {"hotkey": f"<ctrl>+<alt>+{n}", "sound": f"assets/sounds/test{n}.wav"}
+                for n in (1, 2, 3)
+            ],
+            id="multiple",
         ),
-    ]
+    ],
+)
+def test_save_shortcuts_writes_entries(
+    temp_config_dir: Path,
+    temp_schema: Path,
+    shortcuts: List[Shortcut],
+    expected: List[dict],
+) -> None:
+    """Test the entries save_shortcuts writes for various shortcut lists."""
+    config_path = temp_config_dir / "shortcuts.json"
 
     save_shortcuts(shortcuts, config_path, schema_path=temp_schema)
 
     assert config_path.exists()
     data = json.loads(config_path.read_text())
-    assert len(data["shortcuts"]) == 3
-    assert data["shortcuts"][0]["hotkey"] == "<ctrl>+<alt>+1"
-    assert data["shortcuts"][1]["hotkey"] == "<ctrl>+<alt>+2"
-    assert data["shortcuts"][2]["hotkey"] == "<ctrl>+<alt>+3"
+    assert data["version"] == "1.5.0"
+    assert data["shortcuts"] == expected
 
 
 def test_save_shortcuts_creates_parent_directory(
@@ -230,3 +210,110 @@ def test_save_shortcuts_validates_against_schema(
 
     with pytest.raises(ConfigError):
         load_shortcuts(config_path, schema_path=temp_schema)
+
+
+def test_qt_key_to_name_maps_modifiers_and_regular_keys() -> None:
+    """Test Qt key codes translate to pynput-style names."""
+    from PySide6.QtCore import Qt
+
+    from stream_companion.configurator.widgets import HotkeyCapture
+
+    to_name = HotkeyCapture._qt_key_to_name
+    assert to_name(Qt.Key_Control.value, None) == "ctrl"
+    assert to_name(Qt.Key_Super_L.value, None) == "cmd"
+    assert to_name(Qt.Key_K.value, None) == "k"
+    assert to_name(Qt.Key_F12.value, None) == "f12"
+    assert to_name(Qt.Key_Escape.value, None) is None
+
+
+def test_shortcut_display_summarizes_bindings() -> None:
+    """Test the list label shows the binding plus asset/trigger markers."""
+    from stream_companion.configurator.window import _shortcut_display
+
+    assert _shortcut_display(Shortcut(hotkey="<ctrl>+k")) == "<ctrl>+k"
+    assert (
+        _shortcut_display(
+            Shortcut(
+                suffix=("g", "h"),
+                sound_path="a.wav",
+                trigger_phrases=("one", "two", "three"),
+            )
+        )
+        == "[g+h] | 🔊 | 🗣️“one”, “two” +1"
+    )
+
+
+def test_format_hotkey_puts_modifiers_first() -> None:
+    """Test captured keys format as a pynput hotkey, modifiers first."""
+    from stream_companion.configurator.widgets import HotkeyCapture
+
+    assert HotkeyCapture._format_hotkey(["k", "ctrl", "shift"]) == "<ctrl>+<shift>+k"
+    assert HotkeyCapture._format_hotkey(["f5"]) == "f5"
+
+
+def test_overlay_preview_is_debounced_and_cached(tmp_path: Path, qapp) -> None:
+    """Test typing a path defers the decode and reselecting reuses it."""
+    from PySide6.QtGui import QImage
+
+    from stream_companion.configurator import sections
+
+    image_path = tmp_path / "overlay.png"
+    image = QImage(40, 30, QImage.Format.Format_ARGB32)
+    image.fill(0)
+    assert image.save(str(image_path))
+
+    sections._load_image_preview.cache_clear()
+    section = sections.ShortcutSection()
+    section._overlay_input.setText(str(image_path))
+    assert section._preview_timer.isActive()
+    assert section._overlay_preview.pixmap().isNull()
+
+    section._update_overlay_preview()
+    assert not section._overlay_preview.pixmap().isNull()
+    assert (section._width_input.value(), section._height_input.value()) == (40, 30)
+
+    section._update_overlay_preview()
+    info = sections._load_image_preview.cache_info()
+    assert (info.misses, info.hits) == (1, 1)
+
+    # The module-level cache must not hold QPixmaps past the QApplication.
+    st = image_path.stat()
+    cached = sections._load_image_preview(str(image_path), st.st_mtime_ns, st.st_size)
+    assert isinstance(cached[0], QImage)
+
+
+def test_save_rechecks_assets_missing_at_preview(
+    tmp_path: Path, qapp, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test Save does not reuse a cached "missing" result from Preview."""
+    from stream_companion.configurator import window as window_module
+
+    monkeypatch.setattr(
+        window_module, "load_full_config", lambda: (None, [], None, None)
+    )
+    saved: List[List[Shortcut]] = []
+    monkeypatch.setattr(
+        window_module,
+        "save_config",
+        lambda activator, shortcuts, **kwargs: saved.append(list(shortcuts)),
+    )
+    warnings: List[str] = []
+    monkeypatch.setattr(
+        window_module.QMessageBox,
+        "warning",
+        lambda parent, title, text: warnings.append(text),
+    )
+    monkeypatch.setattr(window_module.QMessageBox, "information", lambda *a: None)
+
+    sound_path = tmp_path / "late.wav"
+    window = window_module.ConfiguratorWindow()
+    window._shortcuts = [Shortcut(hotkey="<ctrl>+<alt>+1", sound_path=str(sound_path))]
+    # Preview saw the file missing, then the user copied it into place.
+    assert window._path_is_file(str(sound_path)) is False
+    sound_path.write_bytes(b"fake sound data")
+
+    window._save_changes()
+
+    assert warnings == []
+    assert len(saved) == 1
+    window.close()
@@ -20,11 +20,6 @@ streaming:
 
 from __future__ import annotations
 
-import os
-
-# Must be set BEFORE importing PySide6 to take effect on the QApplication.
-os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
-
 import pytest
 from PySide6.QtWidgets import QApplication
 
@@ -37,12 +32,6 @@ from stream_companion.fact_checker.answer_panel import AnswerPanel
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture(scope="module")
-def qapp() -> QApplication:
-    app = QApplication.instance() or QApplication([])
-    return app  # type: ignore[return-value]
-
-
 @pytest.fixture
 def panel(qapp: QApplication) -> AnswerPanel:
     p = AnswerPanel()
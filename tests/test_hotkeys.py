@@ -9,6 +9,8 @@ from stream_companion.hotkeys import HotkeyManager
 
 
 class FakeListener:
+    __slots__ = ("on_press", "on_release", "running", "_canonical_calls")
+
     def __init__(self, on_press: Callable, on_release: Callable) -> None:
         self.on_press = on_press
         self.on_release = on_release
@@ -27,6 +29,8 @@ class FakeListener:
 
 
 class FakeHotKey:
+    __slots__ = ("combination", "callback", "press_calls", "release_calls")
+
     def __init__(self, combination: str, callback: Callable[[], None]) -> None:
         self.combination = combination
         self.callback = callback
@@ -41,7 +45,12 @@ class FakeHotKey:
         self.callback()
 
 
-def make_manager():
+_LOGGER = logging.getLogger("test.hotkeys")
+
+
+@pytest.fixture()
+def manager_and_listener():
+    """A manager on fake pynput classes, plus a ref to its listener once started."""
     listener_ref = {}
 
     def listener_factory(on_press, on_release):
@@ -49,20 +58,18 @@ def make_manager():
         listener_ref["instance"] = listener
         return listener
 
-    def hotkey_factory(combination, callback):
-        hotkey = FakeHotKey(combination, callback)
-        return hotkey
-
+    # FakeHotKey already has the factory's (combination, callback) signature.
     manager = HotkeyManager(
         listener_factory=listener_factory,
-        hotkey_factory=hotkey_factory,
-        logger=logging.getLogger("test.hotkeys"),
+        hotkey_factory=FakeHotKey,
+        logger=_LOGGER,
     )
-    return manager, listener_ref
+    yield manager, listener_ref
+    manager.stop()
 
 
-def test_register_and_trigger_executes_callback():
-    manager, _ = make_manager()
+def test_register_and_trigger_executes_callback(manager_and_listener):
+    manager, _ = manager_and_listener
     calls: List[str] = []
 
     manager.register_hotkey("<ctrl>+<alt>+c", lambda: calls.append("hit"))
@@ -71,23 +78,23 @@ def test_register_and_trigger_executes_callback():
     assert "<ctrl>+<alt>+c" in manager.registered_combinations()
 
 
-def test_duplicate_registration_raises_value_error():
-    manager, _ = make_manager()
+def test_duplicate_registration_raises_value_error(manager_and_listener):
+    manager, _ = manager_and_listener
     manager.register_hotkey("a", lambda: None)
     with pytest.raises(ValueError):
         manager.register_hotkey("A", lambda: None)
 
 
-def test_unregister_hotkey_removes_binding():
-    manager, _ = make_manager()
+def test_unregister_hotkey_removes_binding(manager_and_listener):
+    manager, _ = manager_and_listener
     manager.register_hotkey("a", lambda: None)
     assert manager.unregister_hotkey("a") is True
     assert manager.unregister_hotkey("a") is False
     assert manager.trigger("a") is False
 
 
-def test_start_and_stop_control_listener_state():
-    manager, listener_ref = make_manager()
+def test_start_and_stop_control_listener_state(manager_and_listener):
+    manager, listener_ref = manager_and_listener
 
     assert manager.start() is True
     assert manager.is_running is True
@@ -101,8 +108,8 @@ def test_start_and_stop_control_listener_state():
     assert manager.stop() is False
 
 
-def test_dispatch_invokes_hotkey_press_and_release():
-    manager, listener_ref = make_manager()
+def test_dispatch_invokes_hotkey_press_and_release(manager_and_listener):
+    manager, listener_ref = manager_and_listener
     events: List[str] = []
 
     manager.register_hotkey("b", lambda: events.append("released"))
@@ -117,7 +124,38 @@ def test_dispatch_invokes_hotkey_press_and_release():
     assert binding.hotkey.press_calls == [fake_key]
     assert binding.hotkey.release_calls == [fake_key]
     assert events == ["released"]
-    manager.stop()
+
+
+def test_key_events_only_feed_hotkeys_using_that_key():
+    from pynput import keyboard
+
+    listener_ref = {}
+
+    def listener_factory(on_press, on_release):
+        listener_ref["instance"] = FakeListener(on_press, on_release)
+        return listener_ref["instance"]
+
+    # Default hotkey factory: real pynput HotKey objects are indexed.
+    manager = HotkeyManager(listener_factory=listener_factory)
+    events: List[str] = []
+    manager.register_hotkey("a", lambda: events.append("a"))
+    manager.register_hotkey("b", lambda: events.append("b"))
+    manager.start()
+    try:
+        listener = listener_ref["instance"]
+
+        key_b = keyboard.KeyCode.from_char("b")
+        bindings, _ = manager._dispatch_state(key_b)  # type: ignore[misc]
+        assert [binding.combination for binding in bindings] == ["b"]
+        listener.on_press(key_b)
+        listener.on_release(key_b)
+        assert events == ["b"]
+
+        manager.unregister_hotkey("b")
+        assert manager._dispatch_state(key_b) == ((), key_b)
+    finally:
+        # Stop even when an assertion fails, so no listener outlives the test.
+        manager.stop()
 
 
 def test_canonicalize_wraps_modifiers_in_angle_brackets():
@@ -144,10 +182,10 @@ def test_canonicalize_rejects_invalid_inputs():
         HotkeyManager.canonicalize("ctrl+alt")
 
 
-def test_register_hotkey_normalizes_bare_form():
+def test_register_hotkey_normalizes_bare_form(manager_and_listener):
     """A bare 'ctrl+alt+9' should be registered the same as '<ctrl>+<alt>+9'."""
 
-    manager, _ = make_manager()
+    manager, _ = manager_and_listener
     calls: List[str] = []
 
     manager.register_hotkey("ctrl+alt+9", lambda: calls.append("hit"))
@@ -156,3 +194,67 @@ def test_register_hotkey_normalizes_bare_form():
     # And via the bare form too (since it normalizes)
     assert manager.trigger("Ctrl + Alt + 9") is True
     assert calls == ["hit", "hit"]
+
+
+def test_chord_sequences_match_through_prefixes(manager_and_listener):
+    from pynput import keyboard
+
+    manager, listener_ref = manager_and_listener
+    events: List[str] = []
+
+    manager.configure_chord_sequences(
+        "<ctrl>+<alt>+k",
+        1500,
+        {
+            ("g",): lambda: events.append("g"),
+            ("a", "b"): lambda: events.append("a+b"),
+        },
+    )
+    manager.start()
+    listener = listener_ref["instance"]
+
+    def press(char: str) -> None:
+        listener.on_press(keyboard.KeyCode.from_char(char))
+
+    assert manager.trigger("<ctrl>+<alt>+k") is True
+    press("k")  # activator's own final key is ignored
+    press("a")
+    assert events == []
+    press("b")
+    assert events == ["a+b"]
+
+    # Non-matching keys disarm without firing
+    manager.trigger("<ctrl>+<alt>+k")
+    press("k")
+    press("a")
+    press("x")
+    press("b")
+    assert events == ["a+b"]
+
+
+def test_chord_expires_after_timeout(monkeypatch, manager_and_listener):
+    from pynput import keyboard
+
+    from stream_companion import hotkeys
+
+    now = [100.0]
+    monkeypatch.setattr(hotkeys, "_monotonic", lambda: now[0])
+    manager, listener_ref = manager_and_listener
+    events: List[str] = []
+    manager.configure_chord_sequences(
+        "<ctrl>+<alt>+k", 500, {("g",): lambda: events.append("g")}
+    )
+    manager.start()
+    listener = listener_ref["instance"]
+
+    manager.trigger("<ctrl>+<alt>+k")
+    listener.on_press(keyboard.KeyCode.from_char("k"))
+    now[0] += 0.6
+    listener.on_press(keyboard.KeyCode.from_char("g"))
+    assert events == []
+
+    manager.trigger("<ctrl>+<alt>+k")
+    listener.on_press(keyboard.KeyCode.from_char("k"))
+    now[0] += 0.4
+    listener.on_press(keyboard.KeyCode.from_char("g"))
+    assert events == ["g"]
@@ -2,10 +2,6 @@
 
 from __future__ import annotations
 
-import os
-
-os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
-
 import pytest
 from PySide6.QtWidgets import QApplication
 
@@ -13,11 +9,6 @@ from stream_companion.configurator.llm_section import LLMSection
 from stream_companion.llm.config import LLMConfig
 
 
-@pytest.fixture(scope="module")
-def qapp() -> QApplication:
-    return QApplication.instance() or QApplication([])
-
-
 @pytest.fixture
 def section(qapp: QApplication) -> LLMSection:
     return LLMSection()
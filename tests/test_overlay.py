@@ -1,28 +1,29 @@
 from __future__ import annotations
 
-import os
+import threading
+import time
 from pathlib import Path
+from typing import Callable
 
 import pytest
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QPixmap
+from PySide6.QtGui import QColor, QImage, QMovie, QPixmap
+from PySide6.QtMultimedia import QVideoFrame
 from PySide6.QtTest import QTest
 from PySide6.QtWidgets import QApplication
 
+from stream_companion import overlay as overlay_module
 from stream_companion.overlay import OverlayWindow
 
 
-@pytest.fixture(scope="session", autouse=True)
-def ensure_offscreen_platform() -> None:
-    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
-
-
-@pytest.fixture(scope="session")
-def qapp() -> QApplication:
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication([])
-    return app
+def _wait_until(predicate: Callable[[], bool], timeout_ms: int = 1000) -> bool:
+    """Process events until ``predicate()`` holds, instead of a fixed sleep."""
+    deadline = time.monotonic() + timeout_ms / 1000
+    while not predicate():
+        if time.monotonic() >= deadline:
+            return False
+        QTest.qWait(5)
+    return True
 
 
 @pytest.fixture()
@@ -32,33 +33,57 @@ def overlay(qapp: QApplication) -> OverlayWindow:
     window.close()
 
 
-@pytest.fixture()
-def png_asset(tmp_path: Path) -> Path:
-    path = tmp_path / "overlay.png"
+# Assets are written once per session; tests that modify one work on a
+# copy in their own tmp_path.
+@pytest.fixture(scope="session")
+def png_asset(qapp: QApplication, tmp_path_factory: pytest.TempPathFactory) -> Path:
+    path = tmp_path_factory.mktemp("assets") / "overlay.png"
     pixmap = QPixmap(16, 16)
     pixmap.fill(Qt.GlobalColor.red)
     assert pixmap.save(str(path), "PNG")
     return path
 
 
-@pytest.fixture()
-def gif_asset(tmp_path: Path) -> Path:
+@pytest.fixture(scope="session")
+def gif_asset(tmp_path_factory: pytest.TempPathFactory) -> Path:
     # Minimal 1x1 pixel GIF image
     gif_bytes = (
         b"GIF89a\x01\x00\x01\x00\x80\x00\x00\xff\x00\x00\x00\x00\x00!\xf9\x04"
         b"\x01\n\x00\x01\x00,\x00\x00\x00\x00\x01\x00\x01\x00\x00\x02\x02D\x01\x00;"
     )
-    path = tmp_path / "overlay.gif"
+    path = tmp_path_factory.mktemp("assets") / "overlay.gif"
     path.write_bytes(gif_bytes)
     return path
 
 
 def test_show_static_image(overlay: OverlayWindow, png_asset: Path) -> None:
+    assert overlay.show_asset(png_asset.as_posix(), duration_ms=20) is True
+    assert overlay.isVisible() is True
+    assert overlay.is_auto_hide_active() is True
+
+    assert _wait_until(lambda: not overlay.isVisible())
+
+
+def test_repeated_show_extends_auto_hide(
+    overlay: OverlayWindow, png_asset: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    now = [100.0]
+    monkeypatch.setattr(overlay_module, "_monotonic", lambda: now[0])
+
     assert overlay.show_asset(png_asset.as_posix(), duration_ms=150) is True
+    now[0] += 0.1
+    assert overlay.show_asset(png_asset.as_posix(), duration_ms=150) is True
+
+    # The timer armed by the first show fires past its own deadline but
+    # before the second one: the overlay stays up for the remainder.
+    now[0] += 0.1
+    overlay._on_auto_hide_timeout()
     assert overlay.isVisible() is True
     assert overlay.is_auto_hide_active() is True
+    assert 0 < overlay._timer.remainingTime() < 150
 
-    QTest.qWait(200)
+    now[0] += 0.06
+    overlay._on_auto_hide_timeout()
     assert overlay.isVisible() is False
 
 
@@ -67,11 +92,113 @@ def test_show_gif_animation(overlay: OverlayWindow, gif_asset: Path) -> None:
     assert overlay.is_animating() is True
     assert overlay.is_auto_hide_active() is False
 
+    movie = overlay._movie
     overlay.hide()
-    QTest.qWait(50)
+    # hideEvent stops the movie synchronously; there is nothing to wait for.
     assert overlay.is_animating() is False
+    assert movie.state() == QMovie.MovieState.NotRunning
 
 
 def test_missing_asset_returns_false(overlay: OverlayWindow) -> None:
     assert overlay.show_asset("missing.png") is False
     assert overlay.isVisible() is False
+
+
+def test_replayed_assets_reuse_decoded_data(
+    overlay: OverlayWindow, png_asset: Path, gif_asset: Path, tmp_path: Path
+) -> None:
+    # This test rewrites the image, so it gets its own copy.
+    image = tmp_path / png_asset.name
+    image.write_bytes(png_asset.read_bytes())
+    assert overlay.show_asset(image.as_posix(), size=(8, 8)) is True
+    first = overlay._label.pixmap().cacheKey()
+    assert overlay.show_asset(image.as_posix(), size=(8, 8)) is True
+    assert overlay._label.pixmap().cacheKey() == first
+
+    # Rewriting the file changes its stamp, so it is decoded again.
+    pixmap = QPixmap(32, 32)
+    pixmap.fill(Qt.GlobalColor.blue)
+    assert pixmap.save(str(image), "PNG")
+    assert overlay.show_asset(image.as_posix()) is True
+    assert overlay._label.pixmap().width() == 32
+
+    movies = []
+    for _ in range(2):
+        assert overlay.show_asset(gif_asset.as_posix(), duration_ms=0) is True
+        assert overlay.is_animating() is True
+        movies.append(overlay._movie)
+    assert movies[0] is movies[1]
+    assert len(overlay._movie_cache) == 1
+
+
+def test_preload_decodes_images_off_the_gui_thread(
+    overlay: OverlayWindow, png_asset: Path, gif_asset: Path
+) -> None:
+    assert overlay.preload(gif_asset.as_posix()) is True
+    assert overlay.preload(gif_asset.as_posix()) is False
+    assert len(overlay._movie_cache) == 1
+    assert overlay.preload(png_asset.as_posix(), size=(8, 8)) is True
+    # A second request while the first is in flight is ignored.
+    assert overlay.preload(png_asset.as_posix(), size=(8, 8)) is False
+
+    assert _wait_until(lambda: not overlay._pending_decodes)
+    assert len(overlay._pixmap_cache) == 1
+    cached = next(iter(overlay._pixmap_cache.values()))
+
+    assert overlay.show_asset(png_asset.as_posix(), size=(8, 8)) is True
+    assert overlay._label.pixmap().cacheKey() == cached.cacheKey()
+    assert overlay.preload(png_asset.as_posix(), size=(8, 8)) is False
+
+
+def test_show_waits_for_an_in_flight_preload(
+    overlay: OverlayWindow, png_asset: Path
+) -> None:
+    assert overlay.preload(png_asset.as_posix()) is True
+    assert overlay.show_asset(png_asset.as_posix(), duration_ms=0) is True
+
+    assert _wait_until(lambda: not overlay._pending_decodes)
+    assert overlay.isVisible() is True
+    cached = next(iter(overlay._pixmap_cache.values()))
+    assert overlay._label.pixmap().cacheKey() == cached.cacheKey()
+
+
+def test_video_frames_from_a_worker_thread_reach_the_label(
+    overlay: OverlayWindow,
+) -> None:
+    # QVideoSink delivers frames on its render thread, which has no event
+    # loop of its own.
+    overlay._video_target_size = (4, 4)
+
+    def deliver(color: Qt.GlobalColor) -> None:
+        image = QImage(4, 4, QImage.Format.Format_ARGB32)
+        image.fill(color)
+        worker = threading.Thread(
+            target=overlay._on_video_frame, args=(QVideoFrame(image),)
+        )
+        worker.start()
+        worker.join()
+
+    def label_color():
+        pixmap = overlay._label.pixmap()
+        return None if pixmap.isNull() else pixmap.toImage().pixelColor(0, 0)
+
+    deliver(Qt.GlobalColor.red)
+    assert _wait_until(lambda: label_color() == QColor(Qt.GlobalColor.red))
+    # A later frame is still scheduled, so playback does not freeze.
+    deliver(Qt.GlobalColor.blue)
+    assert _wait_until(lambda: label_color() == QColor(Qt.GlobalColor.blue))
+    assert overlay._pending_video_frame is None
+
+
+def test_pixmap_cache_is_bounded_by_decoded_bytes(
+    overlay: OverlayWindow, png_asset: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Room for one 16x16 32-bit image but not two.
+    monkeypatch.setattr(overlay_module, "_PIXMAP_CACHE_BYTES", 16 * 16 * 4 + 1)
+    assert overlay.show_asset(png_asset.as_posix(), size=(16, 16)) is True
+    assert overlay.show_asset(png_asset.as_posix(), size=(8, 8)) is True
+    assert overlay.show_asset(png_asset.as_posix(), size=(12, 12)) is True
+    assert [key[1] for key in overlay._pixmap_cache] == [(8, 8), (12, 12)]
+    assert overlay._pixmap_cache_bytes == sum(
+        p.width() * p.height() * p.depth() // 8 for p in overlay._pixmap_cache.values()
+    )
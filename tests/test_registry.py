@@ -152,9 +152,28 @@ def test_reload_config_clears_all_caches(
     assert stt is not None and stt.model == "base"
     registry.reload_config()
     # After reload, the cache should be empty
-    assert registry._CACHED_SHORTCUTS is None
-    assert registry._CACHED_STT is None
-    assert registry._FULL_CONFIG_LOADED is False
+    assert registry._cached_full_config.cache_info().currsize == 0
     # Re-fetching reloads from disk
     stt2 = registry.get_stt_config()
     assert stt2 is not None and stt2.model == "base"
+
+
+def test_invalid_config_falls_back_once_for_every_getter(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    calls = []
+
+    def _broken() -> None:
+        calls.append(1)
+        raise registry.ConfigError("bad config")
+
+    monkeypatch.setattr(registry, "load_full_config", _broken)
+
+    with caplog.at_level("WARNING", logger=registry.__name__):
+        assert list(registry.iter_shortcuts()) == []
+        assert registry.get_activator() is None
+        assert registry.get_stt_config() is None
+        assert registry.get_llm_config() is None
+
+    assert len(calls) == 1
+    assert len([r for r in caplog.records if "Falling back" in r.message]) == 1
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict
 
@@ -10,6 +11,8 @@ from stream_companion.sound import SoundPlayer
 
 
 class DummySound:
+    __slots__ = ("play_calls",)
+
     def __init__(self) -> None:
         self.play_calls: list[Dict[str, int]] = []
 
@@ -18,6 +21,8 @@ class DummySound:
 
 
 class DummyMixer:
+    __slots__ = ("init_calls", "quit_calls", "stop_calls", "sounds")
+
     def __init__(self) -> None:
         self.init_calls: list[Dict[str, int]] = []
         self.quit_calls = 0
@@ -46,9 +51,10 @@ class DummyMixer:
         return dummy
 
 
-@pytest.fixture()
-def temp_sound(tmp_path: Path) -> Path:
-    path = tmp_path / "sound.wav"
+@pytest.fixture(scope="session")
+def temp_sound(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    # DummyMixer never reads the file, so one shared copy is enough.
+    path = tmp_path_factory.mktemp("sounds") / "sound.wav"
     path.write_bytes(b"fake sound data")
     return path
 
@@ -66,6 +72,19 @@ def test_initialize_is_idempotent(player: tuple[SoundPlayer, DummyMixer]) -> Non
     sound_player.initialize()
 
     assert len(mixer.init_calls) == 1
+    assert mixer.init_calls[0]["buffer"] == 512
+
+
+def test_buffer_size_can_be_set_per_player() -> None:
+    mixer = DummyMixer()
+    SoundPlayer(mixer=mixer, buffer=256).initialize()
+    assert mixer.init_calls[0]["buffer"] == 256
+
+
+def test_explicit_initialize_buffer_overrides_the_player_default() -> None:
+    mixer = DummyMixer()
+    SoundPlayer(mixer=mixer, buffer=256).initialize(buffer=1024)
+    assert mixer.init_calls[0]["buffer"] == 1024
 
 
 def test_load_invalid_path_logs_warning(player: tuple[SoundPlayer, DummyMixer]) -> None:
@@ -104,6 +123,42 @@ def test_unload_sound(player: tuple[SoundPlayer, DummyMixer], temp_sound: Path)
     assert sound_player.unload("sfx") is False
 
 
+def test_ids_loading_the_same_file_share_one_sound(
+    player: tuple[SoundPlayer, DummyMixer], temp_sound: Path, tmp_path: Path
+) -> None:
+    sound_player, mixer = player
+    assert sound_player.load("a", temp_sound.as_posix()) is True
+    alias = tmp_path / "alias.wav"
+    alias.symlink_to(temp_sound)
+    assert sound_player.load("b", alias.as_posix()) is True
+
+    loaded = sound_player.loaded_sounds()
+    assert loaded["a"] is loaded["b"]
+    assert list(mixer.sounds) == [temp_sound]
+
+    # The shared Sound is only released once its last id is unloaded.
+    assert sound_player.unload("a") is True
+    assert sound_player.play("b") is True
+    assert sound_player.unload("b") is True
+    assert sound_player.load("c", temp_sound.as_posix()) is True
+    assert sound_player.loaded_sounds()["c"] is not loaded["b"]
+
+
+def test_reloading_an_id_with_the_same_file_keeps_it_unloadable(
+    player: tuple[SoundPlayer, DummyMixer], temp_sound: Path
+) -> None:
+    # The configurator's Preview reloads the same id on every click.
+    sound_player, mixer = player
+    assert sound_player.load("a", temp_sound.as_posix()) is True
+    assert sound_player.load("a", temp_sound.as_posix()) is True
+    assert list(mixer.sounds) == [temp_sound]
+
+    assert sound_player.unload("a") is True
+    assert sound_player.unload("a") is False
+    assert sound_player._by_path == {}
+    assert sound_player._path_refs == {}
+
+
 def test_shutdown_quits_mixer(
     player: tuple[SoundPlayer, DummyMixer], temp_sound: Path
 ) -> None:
@@ -114,3 +169,23 @@ def test_shutdown_quits_mixer(
     assert mixer.quit_calls == 1
     assert mixer.stop_calls == 1
     assert sound_player.loaded_sounds() == {}
+
+
+def test_concurrent_loads_initialize_mixer_once(
+    player: tuple[SoundPlayer, DummyMixer], tmp_path: Path
+) -> None:
+    sound_player, mixer = player
+    paths = []
+    for i in range(8):
+        path = tmp_path / f"sfx{i}.wav"
+        path.write_bytes(b"fake sound data")
+        paths.append(path.as_posix())
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(
+            pool.map(sound_player.load, [f"sfx{i}" for i in range(8)], paths)
+        )
+
+    assert all(results)
+    assert len(mixer.init_calls) == 1
+    assert len(sound_player.loaded_sounds()) == 8
@@ -5,17 +5,16 @@ from __future__ import annotations
 from unittest.mock import MagicMock, patch
 
 import pytest
-from PySide6.QtWidgets import QApplication
 
-from stream_companion.tray_icon import TrayIcon
+from stream_companion.tray_icon import QSystemTrayIcon, TrayIcon
 from stream_companion.tray_indicators import TrayIndicatorState
 
 
-@pytest.fixture
-def qt_app():
-    """Provide a QApplication instance for tests."""
-    app = QApplication.instance() or QApplication([])
-    yield app
+@pytest.fixture(autouse=True, scope="module")
+def _tray_available():
+    """Report a system tray everywhere; the offscreen platform has none."""
+    with patch.object(QSystemTrayIcon, "isSystemTrayAvailable", return_value=True):
+        yield
 
 
 def test_tray_icon_initialization(qt_app):
@@ -29,11 +28,8 @@ def test_tray_icon_initialization(qt_app):
     assert tray._on_open_configurator == on_config_mock
 
 
-@patch("stream_companion.tray_icon.QSystemTrayIcon.isSystemTrayAvailable")
-def test_tray_icon_show_when_available(mock_available, qt_app):
+def test_tray_icon_show_when_available(qt_app):
     """Test showing tray icon when system tray is available."""
-    mock_available.return_value = True
-
     tray = TrayIcon()
     result = tray.show()
 
@@ -42,59 +38,45 @@ def test_tray_icon_show_when_available(mock_available, qt_app):
     assert tray._menu is not None
 
 
-@patch("stream_companion.tray_icon.QSystemTrayIcon.isSystemTrayAvailable")
-def test_tray_icon_show_when_unavailable(mock_available, qt_app):
+def test_tray_icon_show_when_unavailable(qt_app):
     """Test showing tray icon when system tray is not available."""
-    mock_available.return_value = False
-
-    tray = TrayIcon()
-    result = tray.show()
+    with patch.object(QSystemTrayIcon, "isSystemTrayAvailable", return_value=False):
+        tray = TrayIcon()
+        result = tray.show()
 
     assert result is False
 
 
 def test_tray_icon_hide(qt_app):
     """Test hiding the tray icon."""
-    with patch(
-        "stream_companion.tray_icon.QSystemTrayIcon.isSystemTrayAvailable",
-        return_value=True,
-    ):
-        tray = TrayIcon()
-        tray.show()
-        tray.hide()
+    tray = TrayIcon()
+    tray.show()
+    tray.hide()
 
-        # Icon should still exist but be hidden
-        assert tray._tray_icon is not None
+    # Icon should still exist but be hidden
+    assert tray._tray_icon is not None
 
 
 def test_tray_icon_quit_callback(qt_app):
     """Test that quit callback is invoked."""
-    on_quit_mock = MagicMock()
+    calls = []
 
-    with patch(
-        "stream_companion.tray_icon.QSystemTrayIcon.isSystemTrayAvailable",
-        return_value=True,
-    ):
-        tray = TrayIcon(on_quit=on_quit_mock)
-        tray.show()
-        tray._handle_quit()
+    tray = TrayIcon(on_quit=lambda: calls.append("quit"))
+    tray.show()
+    tray._handle_quit()
 
-        on_quit_mock.assert_called_once()
+    assert calls == ["quit"]
 
 
 def test_tray_icon_configurator_callback(qt_app):
     """Test that configurator callback is invoked."""
-    on_config_mock = MagicMock()
+    calls = []
 
-    with patch(
-        "stream_companion.tray_icon.QSystemTrayIcon.isSystemTrayAvailable",
-        return_value=True,
-    ):
-        tray = TrayIcon(on_open_configurator=on_config_mock)
-        tray.show()
-        tray._handle_open_configurator()
+    tray = TrayIcon(on_open_configurator=lambda: calls.append("configure"))
+    tray.show()
+    tray._handle_open_configurator()
 
-        on_config_mock.assert_called_once()
+    assert calls == ["configure"]
 
 
 # ---------------------------------------------------------------------------
@@ -149,19 +131,15 @@ def test_refresh_skips_when_state_unchanged(qt_app):
     def fake_compose(state, *, size=64, base_pixmap=None):
         return QIcon(QPixmap(size, size))
 
-    with patch(
-        "stream_companion.tray_icon.QSystemTrayIcon.isSystemTrayAvailable",
-        return_value=True,
-    ):
-        tray = TrayIcon(stt_state_provider=state_provider)
-        tray.show()
-        # Reset the state-key cache so the next refresh will compare
-        # against the previous key.
-        tray._last_state_key = None
-        with patch.object(tray, "_composed_icon", side_effect=fake_compose) as composed:
-            tray.refresh_stt_label()  # first call after reset
-            tray.refresh_stt_label()  # same state, should be a no-op
-            assert composed.call_count == 1
+    tray = TrayIcon(stt_state_provider=state_provider)
+    tray.show()
+    # Reset the state-key cache so the next refresh will compare
+    # against the previous key.
+    tray._last_state_key = None
+    with patch.object(tray, "_composed_icon", side_effect=fake_compose) as composed:
+        tray.refresh_stt_label()  # first call after reset
+        tray.refresh_stt_label()  # same state, should be a no-op
+        assert composed.call_count == 1
 
 
 def test_refresh_updates_icon_on_state_change(qt_app):
@@ -174,110 +152,86 @@ def test_refresh_updates_icon_on_state_change(qt_app):
     def fake_compose(state, *, size=64, base_pixmap=None):
         return QIcon(QPixmap(size, size))
 
-    with patch(
-        "stream_companion.tray_icon.QSystemTrayIcon.isSystemTrayAvailable",
-        return_value=True,
-    ):
-        tray = TrayIcon(stt_state_provider=lambda: state_holder["state"])
-        tray.show()
-        tray._last_state_key = None  # force re-eval
-        with patch.object(tray, "_composed_icon", side_effect=fake_compose) as composed:
-            # First refresh: enabled=True
-            tray.refresh_stt_label()
-            assert composed.call_count == 1
-            # State changes
-            state_holder["state"] = TrayIndicatorState(
-                enabled=True, stt_active=True, typing_active=True
-            )
-            tray.refresh_stt_label()
-            assert composed.call_count == 2
-            # State goes away (None)
-            state_holder["state"] = None
-            tray.refresh_stt_label()
-            # The None branch doesn't compose, so the count is still 2
-            assert composed.call_count == 2
+    tray = TrayIcon(stt_state_provider=lambda: state_holder["state"])
+    tray.show()
+    tray._last_state_key = None  # force re-eval
+    with patch.object(tray, "_composed_icon", side_effect=fake_compose) as composed:
+        # First refresh: enabled=True
+        tray.refresh_stt_label()
+        assert composed.call_count == 1
+        # State changes
+        state_holder["state"] = TrayIndicatorState(
+            enabled=True, stt_active=True, typing_active=True
+        )
+        tray.refresh_stt_label()
+        assert composed.call_count == 2
+        # State goes away (None)
+        state_holder["state"] = None
+        tray.refresh_stt_label()
+        # The None branch doesn't compose, so the count is still 2
+        assert composed.call_count == 2
 
 
 def test_menu_hidden_when_state_is_none(qt_app):
     """When STT is not configured, the toggle item is hidden."""
 
-    with patch(
-        "stream_companion.tray_icon.QSystemTrayIcon.isSystemTrayAvailable",
-        return_value=True,
-    ):
-        tray = TrayIcon(on_toggle_stt=MagicMock(), stt_state_provider=lambda: None)
-        tray.show()
-        tray.refresh_stt_label()
-        assert tray._stt_toggle_action is not None
-        assert tray._stt_toggle_action.isVisible() is False
+    tray = TrayIcon(on_toggle_stt=MagicMock(), stt_state_provider=lambda: None)
+    tray.show()
+    tray.refresh_stt_label()
+    assert tray._stt_toggle_action is not None
+    assert tray._stt_toggle_action.isVisible() is False
 
 
 def test_menu_label_reflects_typing_state(qt_app):
-    with patch(
-        "stream_companion.tray_icon.QSystemTrayIcon.isSystemTrayAvailable",
-        return_value=True,
-    ):
-        tray = TrayIcon(on_toggle_stt=MagicMock())
-        tray.show()
-        # Typing active
-        tray._update_menu(
-            TrayIndicatorState(enabled=True, stt_active=True, typing_active=True)
-        )
-        assert "typing" in tray._stt_toggle_action.text().lower()
-        # Listening only (triggers)
-        tray._update_menu(
-            TrayIndicatorState(enabled=True, stt_active=True, typing_active=False)
-        )
-        assert "listening" in tray._stt_toggle_action.text().lower()
-        # Idle
-        tray._update_menu(
-            TrayIndicatorState(enabled=True, stt_active=False, typing_active=False)
-        )
-        assert "start" in tray._stt_toggle_action.text().lower()
+    tray = TrayIcon(on_toggle_stt=MagicMock())
+    tray.show()
+    # Typing active
+    tray._update_menu(
+        TrayIndicatorState(enabled=True, stt_active=True, typing_active=True)
+    )
+    assert "typing" in tray._stt_toggle_action.text().lower()
+    # Listening only (triggers)
+    tray._update_menu(
+        TrayIndicatorState(enabled=True, stt_active=True, typing_active=False)
+    )
+    assert "listening" in tray._stt_toggle_action.text().lower()
+    # Idle
+    tray._update_menu(
+        TrayIndicatorState(enabled=True, stt_active=False, typing_active=False)
+    )
+    assert "start" in tray._stt_toggle_action.text().lower()
 
 
 def test_menu_disabled_when_stt_disabled_in_config(qt_app):
-    with patch(
-        "stream_companion.tray_icon.QSystemTrayIcon.isSystemTrayAvailable",
-        return_value=True,
-    ):
-        tray = TrayIcon(on_toggle_stt=MagicMock())
-        tray.show()
-        tray._update_menu(
-            TrayIndicatorState(enabled=False, stt_active=False, typing_active=False)
-        )
-        assert tray._stt_toggle_action.isEnabled() is False
-        assert "disabled" in tray._stt_toggle_action.text().lower()
+    tray = TrayIcon(on_toggle_stt=MagicMock())
+    tray.show()
+    tray._update_menu(
+        TrayIndicatorState(enabled=False, stt_active=False, typing_active=False)
+    )
+    assert tray._stt_toggle_action.isEnabled() is False
+    assert "disabled" in tray._stt_toggle_action.text().lower()
 
 
 def test_left_click_toggles_stt(qt_app):
     """Left-clicking the tray icon must invoke the toggle callback."""
 
     on_toggle = MagicMock()
-    with patch(
-        "stream_companion.tray_icon.QSystemTrayIcon.isSystemTrayAvailable",
-        return_value=True,
-    ):
-        tray = TrayIcon(on_toggle_stt=on_toggle)
-        tray.show()
-        # Simulate a left-click (Trigger) and a double-click
-        from PySide6.QtWidgets import QSystemTrayIcon as _Sti
+    tray = TrayIcon(on_toggle_stt=on_toggle)
+    tray.show()
+    # Simulate a left-click (Trigger) and a double-click
+    from PySide6.QtWidgets import QSystemTrayIcon as _Sti
 
-        tray._on_activated(_Sti.ActivationReason.Trigger)
-        tray._on_activated(_Sti.ActivationReason.DoubleClick)
-        assert on_toggle.call_count == 2
+    tray._on_activated(_Sti.ActivationReason.Trigger)
+    tray._on_activated(_Sti.ActivationReason.DoubleClick)
+    assert on_toggle.call_count == 2
 
 
 def test_left_click_ignored_when_no_toggle_callback(qt_app):
     """When no on_toggle_stt is provided, the click is a no-op."""
 
-    with patch(
-        "stream_companion.tray_icon.QSystemTrayIcon.isSystemTrayAvailable",
-        return_value=True,
-    ):
-        tray = TrayIcon()  # no on_toggle_stt
-        tray.show()
-        # Should not raise even though there's no callback
-        from PySide6.QtWidgets import QSystemTrayIcon as _Sti
+    tray = TrayIcon()  # no on_toggle_stt
+    tray.show()
+    # Should not raise even though there's no callback
+    from PySide6.QtWidgets import QSystemTrayIcon as _Sti
 
-        tray._on_activated(_Sti.ActivationReason.Trigger)  # no error
+    tray._on_activated(_Sti.ActivationReason.Trigger)  # no error
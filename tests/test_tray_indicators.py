@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import pytest
 from PySide6.QtGui import QColor, QImage, QPixmap
-from PySide6.QtWidgets import QApplication
 
 from stream_companion.tray_indicators import (
     COLOR_FACT_LISTENING,
@@ -23,12 +22,6 @@ from stream_companion.tray_indicators import (
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture(scope="module")
-def qt_app() -> QApplication:
-    app = QApplication.instance() or QApplication([])
-    yield app
-
-
 @pytest.fixture
 def solid_red_pixmap() -> QPixmap:
     """A small solid-red pixmap, used as a controllable base icon."""